@@ -5,6 +5,8 @@ from __future__ import annotations
 import logging
 import re
 import time
+from dataclasses import dataclass, field
+from datetime import datetime
 from enum import Enum
 from typing import Optional, Tuple
 
@@ -29,6 +31,78 @@ def is_market_open(now_ts: float, close_ts: float, buffer_sec: float = 0.0) -> b
     return now_ts < (close_ts - buffer_sec)
 
 
+def parse_close_time(close_time: object) -> Optional[float]:
+    """Kalshi close_time (ISO 8601, trailing 'Z' allowed) as epoch seconds, or None."""
+    if not close_time or not isinstance(close_time, str):
+        return None
+    if close_time.endswith("Z"):
+        close_time = close_time[:-1] + "+00:00"
+    try:
+        return datetime.fromisoformat(close_time).timestamp()
+    except ValueError:
+        return None
+
+
+@dataclass(frozen=True)
+class KalshiMarketInfo:
+    """
+    Market metadata with the rules/close-time part of eligibility done once.
+
+    `static_result` covers every check except the market-open window, so
+    eligibility() at any `now_ts` only compares against `close_ts`.
+    """
+
+    ticker: str
+    event_ticker: Optional[str]
+    static_result: EligibilityResult
+    source: Optional[ResolutionSource]
+    close_ts: Optional[float]
+    metadata: dict = field(compare=False, repr=False)
+
+    @classmethod
+    def from_metadata(cls, market_metadata: dict) -> "KalshiMarketInfo":
+        def info(result, source=None, close_ts=None):
+            return cls(
+                ticker=market_metadata.get("ticker") or "",
+                event_ticker=market_metadata.get("event_ticker"),
+                static_result=result,
+                source=source,
+                close_ts=close_ts,
+                metadata=market_metadata,
+            )
+
+        # Kalshi puts the resolution text in "rules_primary".
+        rules_text = market_metadata.get("rules_primary") or market_metadata.get("rules") or ""
+        if not rules_text:
+            return info(EligibilityResult.UNSUPPORTED_RULES)
+
+        source = resolution_source_from_metadata({"rules_text": rules_text})
+        if is_unknown(source):
+            return info(EligibilityResult.UNSUPPORTED_RULES)
+
+        # Fail closed unless we route an official feed for the resolution venue.
+        if source.venue not in ("coinbase", "gemini", "binance"):
+            return info(EligibilityResult.FEED_ROUTING_UNKNOWN, source)
+
+        close_ts = parse_close_time(market_metadata.get("close_time"))
+        if close_ts is None:
+            return info(EligibilityResult.MISSING_CLOSE_TIME, source)
+
+        return info(EligibilityResult.ELIGIBLE, source, close_ts)
+
+    def eligibility(
+        self, now_ts: Optional[float] = None, time_buffer_sec: float = 5.0
+    ) -> Tuple[EligibilityResult, Optional[ResolutionSource]]:
+        """Same result as check_kalshi_eligibility(self.metadata, now_ts, time_buffer_sec)."""
+        if self.static_result != EligibilityResult.ELIGIBLE:
+            return self.static_result, self.source
+        if now_ts is None:
+            now_ts = time.time()
+        if not is_market_open(now_ts, self.close_ts, time_buffer_sec):
+            return EligibilityResult.MARKET_CLOSED, self.source
+        return EligibilityResult.ELIGIBLE, self.source
+
+
 def check_kalshi_eligibility(
     market_metadata: dict,
     now_ts: Optional[float] = None,
@@ -38,67 +112,4 @@ def check_kalshi_eligibility(
     Validates if a Kalshi market is eligible for trading.
     Returns (Result, ResolutionSource).
     """
-    if now_ts is None:
-        now_ts = time.time()
-
-    # 1. Rules/Feed Check
-    # We rely on resolution_source logic to parse rules.
-    # We construct a metadata dict compatible with resolution_source_from_metadata
-    # Kalshi API fields: "rules_primary", "rules_secondary" -> we combine or check primary.
-    # Usually "rules_primary" contains the text we need.
-    rules_text = market_metadata.get("rules_primary") or market_metadata.get("rules") or ""
-    
-    # Fail if empty
-    if not rules_text:
-        return EligibilityResult.UNSUPPORTED_RULES, None
-
-    # Use shared source resolver
-    # Note: resolution_source_from_metadata expects dict with "rules_text" or similar
-    source = resolution_source_from_metadata({"rules_text": rules_text})
-    if is_unknown(source):
-        return EligibilityResult.UNSUPPORTED_RULES, None
-
-    # Check if we assume we can route this source.
-    # Currently we only really support official feeds for BTC/ETH on Coinbase/Gemini/Binance
-    # The source object tells us the venue/symbol. We need to verify if we have a feed for it.
-    # For now, we assume if resolution_source matched a known pattern, it's supported.
-    # But strictly, we should check if it's one of our targeted mappings? 
-    # The user req says: "underlying feed mapping is known... fail-closed by default"
-    # The ResolutionSource has 'venue' and 'symbol'.
-    if source.venue not in ("coinbase", "gemini", "binance"):
-        return EligibilityResult.FEED_ROUTING_UNKNOWN, source
-
-    # 2. Time Check
-    # Kalshi fields: "close_time", "expiration_time". usually close_time is what we want.
-    # It sends ISO strings usually, but verify what fetch_market returns.
-    # Assuming fetch_market returns parsed JSON, dates are likely strings.
-    # We need to parse them.
-    # Actually, looking at Kalshi API docs (or standard behavior), timestamps are often strings.
-    # But wait, let's look at what we receive.
-    # If the response is raw JSON, it's ISO strings.
-    # We need a helper to parse ISO.
-    
-    # Wait, let's verify if we need to implement date parsing.
-    # Standard python methods.
-    
-    close_time_str = market_metadata.get("close_time")
-    if not close_time_str:
-        return EligibilityResult.MISSING_CLOSE_TIME, source
-        
-    try:
-        # Robust ISO parse
-        # If python 3.11+, fromisoformat handles Z.
-        # Else replace Z.
-        if close_time_str.endswith('Z'):
-            close_time_str = close_time_str[:-1] + '+00:00'
-        
-        from datetime import datetime
-        close_dt = datetime.fromisoformat(close_time_str)
-        close_ts = close_dt.timestamp()
-    except (ValueError, TypeError):
-         return EligibilityResult.MISSING_CLOSE_TIME, source
-
-    if not is_market_open(now_ts, close_ts, time_buffer_sec):
-         return EligibilityResult.MARKET_CLOSED, source
-
-    return EligibilityResult.ELIGIBLE, source
+    return KalshiMarketInfo.from_metadata(market_metadata).eligibility(now_ts, time_buffer_sec)
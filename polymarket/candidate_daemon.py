@@ -0,0 +1,203 @@
+"""
+Background discovery of READY CLOB candidates.
+
+CandidateDaemon keeps a rolling set of READY candidates so the shadow
+entrypoint does not have to run Gamma discovery and CLOB probing before its
+first decision. Each cycle ranks candidates (local catalogue or streamed
+Gamma, see clob_readiness.rank_clob_candidates) and revalidates the top
+window with batch /midpoints requests that bypass the probe cache. A READY
+answer refreshes a candidate's `validated_at`; NOT_READY and PERM_ERROR
+drop it at once; retryable errors leave it to age out after `max_age_sec`.
+
+The set is published as one JSON document written atomically (tmp + fsync
++ rename), so readers never see a partial file. read_selection() returns
+the still-fresh candidates, best first, in the same shape as
+discover_and_filter_candidates()["ready"].
+"""
+
+import json
+import logging
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from polymarket import clob_readiness
+from polymarket.contract import ReadinessStatus
+from recorder.shadow_artifacts import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+SELECTION_FORMAT = "polymarket_selection_v1"
+DEFAULT_MAX_READY = 5
+DEFAULT_REFRESH_INTERVAL_SEC = 30.0
+DEFAULT_SELECTION_MAX_AGE_SEC = 120.0
+
+
+@dataclass
+class ReadyCandidate:
+    market_id: str
+    token_id: str
+    no_token_id: Optional[str]
+    question: Optional[str]
+    slug: Optional[str]
+    liquidity: float
+    validated_at: float
+    volume: float = 0.0
+
+    def to_ready_entry(self) -> Dict[str, Any]:
+        """Legacy discover_and_filter_candidates() candidate dict."""
+        return {
+            "id": self.market_id,
+            "token_id": self.token_id,
+            "clobTokenIds": [self.token_id, self.no_token_id] if self.no_token_id else [self.token_id],
+            "question": self.question,
+            "slug": self.slug,
+            "liquidity": self.liquidity,
+            "validated_at": self.validated_at,
+        }
+
+
+class CandidateDaemon:
+    """Maintains and publishes the rolling READY candidate set."""
+
+    def __init__(
+        self,
+        path: str,
+        max_ready: int = DEFAULT_MAX_READY,
+        max_probes: int = clob_readiness.DEFAULT_MAX_PROBES,
+        max_age_sec: float = DEFAULT_SELECTION_MAX_AGE_SEC,
+        interval_sec: float = DEFAULT_REFRESH_INTERVAL_SEC,
+    ):
+        self.path = Path(path)
+        self.max_ready = max_ready
+        self.max_probes = max_probes
+        self.max_age_sec = max_age_sec
+        self.interval_sec = interval_sec
+        self._ready: Dict[str, ReadyCandidate] = {}
+        self.cycles = 0
+        self.errors = 0
+        self.last_stats: Dict[str, Any] = {}
+
+    def refresh(self, now: Optional[float] = None) -> Dict[str, Any]:
+        """Runs one discovery/revalidation cycle. Returns cycle counters."""
+        now = time.time() if now is None else now
+        seen, ranked, skipped, load_market = clob_readiness.rank_clob_candidates(self.max_probes)
+        window = [c for c in ranked[:max(0, self.max_probes)] if c.yes_token is not None]
+
+        gate = clob_readiness.ProbeRequestGate.from_env()
+        results = clob_readiness.probe_clob_readiness_batch(
+            [c.yes_token for c in window], gate=gate, use_cache=False
+        )
+        gate.close()
+
+        dropped = 0
+        for c in window:
+            r = results.get(c.yes_token)
+            if r is None:
+                continue
+            key = str(c.market_id)
+            if r.status == ReadinessStatus.READY:
+                m = c.market
+                if m is None and load_market is not None:
+                    m = load_market(c.market_id)
+                m = m or {}
+                self._ready[key] = ReadyCandidate(
+                    market_id=key,
+                    token_id=c.yes_token,
+                    no_token_id=c.no_token,
+                    question=m.get("question"),
+                    slug=m.get("slug"),
+                    liquidity=c.liquidity,
+                    validated_at=now,
+                    volume=c.volume,
+                )
+            elif r.status != ReadinessStatus.RETRYABLE_ERROR and self._ready.pop(key, None) is not None:
+                dropped += 1
+
+        expired = [k for k, c in self._ready.items() if now - c.validated_at > self.max_age_sec]
+        for key in expired:
+            del self._ready[key]
+
+        self.cycles += 1
+        self.last_stats = {
+            "seen": seen,
+            "skipped": skipped,
+            "probed": len(window),
+            "probe_requests": gate.used,
+            "ready": len(self._ready),
+            "dropped": dropped,
+            "expired": len(expired),
+        }
+        return self.last_stats
+
+    def candidates(self) -> List[ReadyCandidate]:
+        """Current READY set by (liquidity, volume) descending, at most `max_ready`."""
+        ranked = sorted(self._ready.values(), key=lambda c: (-c.liquidity, -c.volume))
+        return ranked[:self.max_ready]
+
+    def publish(self, now: Optional[float] = None):
+        now = time.time() if now is None else now
+        atomic_write_json(self.path, {
+            "format": SELECTION_FORMAT,
+            "generated_at": now,
+            "max_age_sec": self.max_age_sec,
+            "candidates": [asdict(c) for c in self.candidates()],
+            "stats": self.last_stats,
+        })
+
+    def run_once(self):
+        """refresh + publish; a failed refresh republishes the aged set."""
+        try:
+            stats = self.refresh()
+            logger.info(f"Candidate daemon cycle: {stats}")
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Candidate refresh failed: {type(e).__name__}: {e}")
+            now = time.time()
+            self._ready = {k: c for k, c in self._ready.items() if now - c.validated_at <= self.max_age_sec}
+        self.publish()
+
+    def run(self, stop_event: Optional[threading.Event] = None, iterations: Optional[int] = None):
+        """Refreshes every `interval_sec` until `stop_event` is set."""
+        stop_event = stop_event or threading.Event()
+        done = 0
+        while not stop_event.is_set():
+            started = time.monotonic()
+            self.run_once()
+            done += 1
+            if iterations is not None and done >= iterations:
+                break
+            stop_event.wait(max(0.0, self.interval_sec - (time.monotonic() - started)))
+
+
+def read_selection(
+    path: str, max_age_sec: Optional[float] = None, now: Optional[float] = None
+) -> List[Dict[str, Any]]:
+    """
+    Fresh published candidates, best first, as legacy ready-entry dicts.
+
+    Candidates validated more than `max_age_sec` ago (default: the age the
+    daemon published with) are left out. A missing, unreadable or foreign
+    file yields an empty list, so callers can fall back to inline discovery.
+    """
+    now = time.time() if now is None else now
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            doc = json.load(f)
+    except (OSError, ValueError):
+        return []
+    if not isinstance(doc, dict) or doc.get("format") != SELECTION_FORMAT:
+        return []
+    if max_age_sec is None:
+        max_age_sec = float(doc.get("max_age_sec") or DEFAULT_SELECTION_MAX_AGE_SEC)
+    out = []
+    for entry in doc.get("candidates") or []:
+        try:
+            candidate = ReadyCandidate(**entry)
+        except TypeError:
+            continue
+        if now - candidate.validated_at <= max_age_sec:
+            out.append(candidate.to_ready_entry())
+    return out
@@ -0,0 +1,107 @@
+"""
+Ranking index of pre-parsed CLOB candidates.
+
+Candidates are kept sorted by (liquidityNum, volume24hr) descending, ties in
+first-insertion order (the same order as a stable sort of the market list),
+with YES/NO token ids and the end date parsed once when a market is added or
+changes. Updates are O(log n) search plus a list insert, and selection is a
+walk from the top that only applies the expiry window.
+"""
+
+from bisect import bisect_left, insort
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from polymarket import clob_readiness
+from polymarket.contract import FailureReason
+
+
+@dataclass
+class RankedCandidate:
+    market_id: Any
+    liquidity: float
+    volume: float
+    end_ts: Optional[float]
+    yes_token: Optional[str]
+    no_token: Optional[str]
+    parse_reason: FailureReason
+    # Full Gamma payload when at hand; the catalogue loads it on demand.
+    market: Optional[Dict[str, Any]] = field(default=None, compare=False, repr=False)
+
+
+def candidate_from_market(m: Dict[str, Any]) -> RankedCandidate:
+    """Parses the ranking fields and tokens of an (eligible) Gamma market once."""
+    _, _, end_dt = clob_readiness.static_eligibility(m)
+    success, yes_token, no_token, parse_reason = clob_readiness.parse_gamma_yes_no_tokens(m)
+    return RankedCandidate(
+        market_id=m.get("id"),
+        liquidity=float(m.get("liquidityNum") or 0),
+        volume=float(m.get("volume24hr") or 0),
+        end_ts=end_dt.timestamp() if end_dt is not None else None,
+        yes_token=yes_token if success else None,
+        no_token=no_token if success else None,
+        parse_reason=parse_reason,
+        market=m,
+    )
+
+
+class CandidateIndex:
+    """Sorted candidate container keyed by market id."""
+
+    def __init__(self, candidates: Iterable[RankedCandidate] = ()):
+        self._keys: List[Tuple[float, float, int, str]] = []
+        self._entries: Dict[str, Tuple[Tuple[float, float, int, str], RankedCandidate]] = {}
+        self._seq = 0
+        for candidate in candidates:
+            self.upsert(candidate)
+
+    def upsert(self, candidate: RankedCandidate) -> bool:
+        """Adds or replaces a candidate. Returns False if nothing changed."""
+        market_id = str(candidate.market_id)
+        existing = self._entries.get(market_id)
+        if existing is not None:
+            old_key, old = existing
+            if old == candidate:
+                if candidate.market is not None:
+                    old.market = candidate.market
+                return False
+            self._keys.pop(bisect_left(self._keys, old_key))
+            seq = old_key[2]
+        else:
+            seq = self._seq
+            self._seq += 1
+        key = (-candidate.liquidity, -candidate.volume, seq, market_id)
+        insort(self._keys, key)
+        self._entries[market_id] = (key, candidate)
+        return True
+
+    def remove(self, market_id: Any) -> bool:
+        existing = self._entries.pop(str(market_id), None)
+        if existing is None:
+            return False
+        self._keys.pop(bisect_left(self._keys, existing[0]))
+        return True
+
+    def get(self, market_id: Any) -> Optional[RankedCandidate]:
+        existing = self._entries.get(str(market_id))
+        return existing[1] if existing is not None else None
+
+    def top(self, k: int, min_end_ts: Optional[float] = None) -> List[RankedCandidate]:
+        """Best `k` candidates, skipping those ending before `min_end_ts`."""
+        out: List[RankedCandidate] = []
+        if k <= 0:
+            return out
+        for key in self._keys:
+            candidate = self._entries[key[3]][1]
+            if min_end_ts is not None and (candidate.end_ts is None or candidate.end_ts < min_end_ts):
+                continue
+            out.append(candidate)
+            if len(out) >= k:
+                break
+        return out
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, market_id: Any) -> bool:
+        return str(market_id) in self._entries
@@ -1,15 +1,22 @@
 import logging
 import requests
+import threading
 import time
 import random
 import json
 import os
-from typing import Tuple, Optional, Any, Dict, List
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Tuple, Optional, Any, Dict, Iterator, List
 from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 
 from polymarket.contract import ReadinessStatus, FailureReason, cache_ttl_for, is_retryable
+from polymarket.probe_cache import PersistentProbeCache
+from recorder.shadow_artifacts import atomic_write_bytes
+from shared.lru_ttl_cache import LruTtlCache
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -22,9 +29,53 @@ MAX_BACKOFF_SECONDS = 2.0
 MAX_PROBES_PER_RUN = 20
 DEFAULT_MAX_PROBES = 20
 MIN_HOURS_TO_EXPIRY = 24
+DEFAULT_PROBE_CACHE_MAX_ENTRIES = 5000
 
-# In-memory cache: string -> (timestamp, result_tuple)
-_probe_cache: Dict[str, Tuple[float, Any]] = {}
+# Concurrent probing (select_best_clob_candidate). The request budget counts
+# every HTTP attempt, retries included, across all probes in one selection.
+DEFAULT_PROBE_CONCURRENCY = 4
+DEFAULT_PROBE_REQUEST_BUDGET = 40
+DEFAULT_PROBE_RATE_PER_SEC = 10.0
+
+# Paginated Gamma discovery. Pages are requested in descending liquidity so
+# stopping early keeps the most liquid markets.
+GAMMA_URL_BASE = "https://gamma-api.polymarket.com"
+DEFAULT_GAMMA_PAGE_SIZE = 100
+DEFAULT_GAMMA_MAX_PAGES = 10
+GAMMA_RATE_LIMIT_BACKOFF_SECONDS = 30.0
+GAMMA_MAX_RATE_LIMIT_BACKOFF_SECONDS = 300.0
+
+# After a Gamma 429 discovery is skipped (not slept on) until this monotonic time.
+# With POLYMARKET_GAMMA_BACKOFF_PATH the deadline (wall clock) and attempt count
+# are also written there, so the next oneshot run or another process honours it.
+_gamma_backoff_until = 0.0
+_gamma_backoff_attempt = 0
+
+
+def env_number(name: str, default, cast):
+    """`cast(os.environ[name])`, or `default` when unset; ValueError names the variable."""
+    raw = os.environ.get(name)
+    if raw in (None, ""):
+        return default
+    try:
+        return cast(raw)
+    except ValueError:
+        raise ValueError(f"{name} must be a number, got {raw!r}")
+
+
+# In-memory cache: token_id -> result_tuple, bounded (LRU) with TTLs from
+# cache_ttl_for so long-running processes do not grow it without limit.
+# Validated at import (invalid => hard fail), like the other env overrides.
+_probe_cache_max_entries = env_number(
+    "POLYMARKET_PROBE_CACHE_MAX_ENTRIES", DEFAULT_PROBE_CACHE_MAX_ENTRIES, int
+)
+if _probe_cache_max_entries < 1:
+    raise ValueError("POLYMARKET_PROBE_CACHE_MAX_ENTRIES must be >= 1")
+_probe_cache = LruTtlCache(max_entries=_probe_cache_max_entries)
+
+# Optional on-disk cache (POLYMARKET_PROBE_CACHE_PATH) behind the in-memory one.
+_persistent_cache: Optional[PersistentProbeCache] = None
+_persistent_cache_lock = threading.Lock()
 
 @dataclass
 class ProbeResult:
@@ -44,6 +95,7 @@ class SelectionResult:
     meta: Dict[str, Any] = None
     probes_attempted: int = 0
     skipped_count: int = 0
+    probe_requests: int = 0
 
     def __post_init__(self):
         if self.meta is None:
@@ -169,19 +221,75 @@ def sanitize_market_id(market_id: Any) -> str:
         return "None"
     return str(market_id)
 
-def probe_clob_readiness(token_id: str) -> ProbeResult:
+class ProbeRequestGate:
+    """
+    Shared request budget and rate limit for concurrent probes.
+
+    acquire() blocks until the next request slot (requests are spaced
+    1/rate_per_sec apart) and returns False once the budget is spent or the
+    gate has been closed, so in-flight retries stop after a selection is made.
+    """
+
+    def __init__(self, budget: int, rate_per_sec: float):
+        self.budget = budget
+        self.interval = 1.0 / rate_per_sec if rate_per_sec > 0 else 0.0
+        self.used = 0
+        self.denied = 0
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._next_at = 0.0
+
+    @classmethod
+    def from_env(
+        cls, budget: Optional[int] = None, rate_per_sec: Optional[float] = None
+    ) -> "ProbeRequestGate":
+        """Gate from POLYMARKET_PROBE_REQUEST_BUDGET / POLYMARKET_PROBE_RATE_PER_SEC
+        unless given explicitly."""
+        if budget is None:
+            budget = env_number("POLYMARKET_PROBE_REQUEST_BUDGET", DEFAULT_PROBE_REQUEST_BUDGET, int)
+        if rate_per_sec is None:
+            rate_per_sec = env_number("POLYMARKET_PROBE_RATE_PER_SEC", DEFAULT_PROBE_RATE_PER_SEC, float)
+        return cls(budget, rate_per_sec)
+
+    def acquire(self) -> bool:
+        with self._lock:
+            if self._closed.is_set() or self.used >= self.budget:
+                self.denied += 1
+                return False
+            self.used += 1
+            now = time.monotonic()
+            slot = max(now, self._next_at)
+            self._next_at = slot + self.interval
+        delay = slot - now
+        if delay > 0 and self._closed.wait(delay):
+            return False
+        return True
+
+    def close(self):
+        self._closed.set()
+
+    def sleep(self, seconds: float) -> bool:
+        """Sleeps up to `seconds`; returns False early if the gate is closed."""
+        return not self._closed.wait(seconds)
+
+
+def probe_clob_readiness(
+    token_id: str, gate: Optional[ProbeRequestGate] = None, use_cache: bool = True
+) -> ProbeResult:
     """
     Probes the Polymarket CLOB for orderbook readiness for a given token_id.
     
     Args:
         token_id: The token ID to probe.
+        gate: Optional shared budget/rate limit checked before every HTTP attempt.
+        use_cache: False skips the cache lookup (the answer is still stored).
         
     Returns:
         ProbeResult object.
     """
     
     # Check cache first
-    cached_result = _get_from_cache(token_id)
+    cached_result = _get_from_cache(token_id) if use_cache else None
     if cached_result:
         return ProbeResult(*cached_result)
 
@@ -201,6 +309,10 @@ def probe_clob_readiness(token_id: str) -> ProbeResult:
             if os.environ.get("POLYMARKET_FIXTURE_MODE") == "1":
                  return _probe_clob_fixtures(token_id)
 
+            if gate is not None and not gate.acquire():
+                # Local budget, not a venue answer: never cached.
+                return ProbeResult(ReadinessStatus.RETRYABLE_ERROR, FailureReason.CLOB_BUDGET_EXHAUSTED, {})
+
             resp = requests.get(url, params=params, timeout=5)
             
             # READY: 200 OK + payload has 'mid'
@@ -250,7 +362,7 @@ def probe_clob_readiness(token_id: str) -> ProbeResult:
             # RETRYABLE: 429, 5XX
             elif resp.status_code in [429, 500, 502, 503, 504]:
                 if attempt < MAX_RETRIES:
-                    _backoff(attempt)
+                    _backoff(attempt, gate)
                     continue
                 else:
                     status = ReadinessStatus.RETRYABLE_ERROR
@@ -273,7 +385,7 @@ def probe_clob_readiness(token_id: str) -> ProbeResult:
 
         except (requests.exceptions.RequestException, TimeoutError):
             if attempt < MAX_RETRIES:
-                _backoff(attempt)
+                _backoff(attempt, gate)
                 continue
             else:
                 status = ReadinessStatus.RETRYABLE_ERROR
@@ -286,6 +398,124 @@ def probe_clob_readiness(token_id: str) -> ProbeResult:
     return ProbeResult(ReadinessStatus.NOT_READY, FailureReason.CLOB_UNKNOWN_ERROR, {})
 
 
+def probe_clob_readiness_batch(
+    token_ids: List[str],
+    gate: Optional[ProbeRequestGate] = None,
+    fallback: bool = True,
+    use_cache: bool = True,
+) -> Dict[str, ProbeResult]:
+    """
+    Probes many tokens with POST /midpoints (up to MAX_PROBES_PER_RUN per request).
+
+    Cached tokens are answered from the cache. A token with a midpoint is
+    READY, with the mid in meta; a null or empty midpoint is
+    CLOB_INVALID_PAYLOAD. The batch response cannot tell "No orderbook
+    exists" from an unknown token, so tokens it leaves out, and whole
+    batches rejected with 400/404, are unresolved. With fallback=True they
+    get a single probe_clob_readiness each. With fallback=False they are
+    left out of the result. Rate limits, 5xx and timeouts map to the same
+    RETRYABLE_ERROR reasons as a single probe, for every token in the batch.
+    All resolved answers are cached in bulk. use_cache=False skips the cache
+    lookup, for the fallback single probes too (answers are still stored),
+    to revalidate tokens against the venue.
+    """
+    results: Dict[str, ProbeResult] = {}
+    pending = []
+    for token_id in dict.fromkeys(token_ids):
+        cached = _get_from_cache(token_id) if use_cache else None
+        if cached:
+            results[token_id] = ProbeResult(*cached)
+        else:
+            pending.append(token_id)
+
+    if os.environ.get("POLYMARKET_FIXTURE_MODE") == "1":
+        results.update({token_id: _probe_clob_fixtures(token_id) for token_id in pending})
+        return results
+
+    unresolved = []
+    for start in range(0, len(pending), MAX_PROBES_PER_RUN):
+        chunk = pending[start:start + MAX_PROBES_PER_RUN]
+        chunk_results, chunk_unresolved = _probe_midpoints_chunk(chunk, gate)
+        results.update(chunk_results)
+        unresolved.extend(chunk_unresolved)
+
+    if fallback:
+        for token_id in unresolved:
+            results[token_id] = probe_clob_readiness(token_id, gate=gate, use_cache=use_cache)
+    return results
+
+
+def _probe_midpoints_chunk(
+    tokens: List[str], gate: Optional[ProbeRequestGate]
+) -> Tuple[Dict[str, ProbeResult], List[str]]:
+    """One /midpoints round trip (with retries). Returns (results, unresolved tokens)."""
+    url = f"{CLOB_URL_BASE}/midpoints"
+    body = [{"token_id": token_id} for token_id in tokens]
+
+    def all_tokens(status: ReadinessStatus, reason: FailureReason, http_code: Any) -> Dict[str, ProbeResult]:
+        out = {token_id: ProbeResult(status, reason, {}) for token_id in tokens}
+        _log_probe_batch(len(tokens), http_code, 0, 0)
+        _add_many_to_cache(out)
+        return out
+
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            if gate is not None and not gate.acquire():
+                # Local budget, not a venue answer: never cached.
+                return {
+                    token_id: ProbeResult(ReadinessStatus.RETRYABLE_ERROR, FailureReason.CLOB_BUDGET_EXHAUSTED, {})
+                    for token_id in tokens
+                }, []
+
+            resp = requests.post(url, json=body, timeout=5)
+
+            if resp.status_code == 200:
+                try:
+                    data = resp.json()
+                except ValueError:
+                    data = None
+                if not isinstance(data, dict):
+                    return all_tokens(ReadinessStatus.NOT_READY, FailureReason.CLOB_INVALID_PAYLOAD, resp.status_code), []
+                out: Dict[str, ProbeResult] = {}
+                unresolved = []
+                for token_id in tokens:
+                    if token_id not in data:
+                        unresolved.append(token_id)
+                        continue
+                    mid = data[token_id]
+                    if isinstance(mid, (str, int, float)) and not isinstance(mid, bool) and str(mid) != "":
+                        out[token_id] = ProbeResult(ReadinessStatus.READY, FailureReason.OK, {"mid": str(mid)})
+                    else:
+                        out[token_id] = ProbeResult(ReadinessStatus.NOT_READY, FailureReason.CLOB_INVALID_PAYLOAD, {})
+                ready = sum(1 for r in out.values() if r.status == ReadinessStatus.READY)
+                _log_probe_batch(len(tokens), resp.status_code, ready, len(unresolved))
+                _add_many_to_cache(out)
+                return out, unresolved
+
+            # 400/404 name no token: one bad or book-less token rejects the batch.
+            elif resp.status_code in (400, 404):
+                _log_probe_batch(len(tokens), resp.status_code, 0, len(tokens))
+                return {}, list(tokens)
+
+            elif resp.status_code in [429, 500, 502, 503, 504]:
+                if attempt < MAX_RETRIES:
+                    _backoff(attempt, gate)
+                    continue
+                reason = FailureReason.CLOB_RATE_LIMITED if resp.status_code == 429 else FailureReason.CLOB_5XX
+                return all_tokens(ReadinessStatus.RETRYABLE_ERROR, reason, resp.status_code), []
+
+            else:
+                return all_tokens(ReadinessStatus.RETRYABLE_ERROR, FailureReason.CLOB_UNKNOWN_ERROR, resp.status_code), []
+
+        except (requests.exceptions.RequestException, TimeoutError):
+            if attempt < MAX_RETRIES:
+                _backoff(attempt, gate)
+                continue
+            return all_tokens(ReadinessStatus.RETRYABLE_ERROR, FailureReason.CLOB_TIMEOUT, "ERR"), []
+
+    return {}, list(tokens)
+
+
 def _probe_clob_fixtures(token_id: str) -> ProbeResult:
     """Helper for offline probe results based on fixtures."""
     # Simple mapping for verify_shadow_pipeline.py and tests
@@ -300,143 +530,512 @@ def _probe_clob_fixtures(token_id: str) -> ProbeResult:
     return ProbeResult(ReadinessStatus.READY, FailureReason.OK, {"mid": "0.5"})
 
 
-def _backoff(attempt: int):
-    """Sleeps with exponential backoff and jitter."""
+def _backoff(attempt: int, gate: Optional[ProbeRequestGate] = None):
+    """Sleeps with exponential backoff and jitter (cut short when `gate` closes)."""
     sleep_time = min(MAX_BACKOFF_SECONDS, BASE_BACKOFF_SECONDS * (2 ** attempt))
     jitter = random.uniform(0, 0.1 * sleep_time)
-    time.sleep(sleep_time + jitter)
+    if gate is not None:
+        gate.sleep(sleep_time + jitter)
+    else:
+        time.sleep(sleep_time + jitter)
 
 def _log_probe(token_suffix: str, http_code: Any, status: ReadinessStatus, reason: FailureReason):
     """Logs a single line summary of the probe (token_id suffix only, no URLs)."""
     logger.info(f"CLOB_PROBE | token: ...{token_suffix} | code: {http_code} | status: {status.name} | reason: {reason.name}")
 
+def _get_persistent_cache() -> Optional[PersistentProbeCache]:
+    """Opens the on-disk cache named by POLYMARKET_PROBE_CACHE_PATH, if set."""
+    global _persistent_cache
+    path = os.environ.get("POLYMARKET_PROBE_CACHE_PATH")
+    if not path:
+        return None
+    with _persistent_cache_lock:
+        if _persistent_cache is None or _persistent_cache.path != path:
+            if _persistent_cache is not None:
+                _persistent_cache.close()
+                _persistent_cache = None
+            try:
+                _persistent_cache = PersistentProbeCache(path)
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"Persistent probe cache unavailable: {type(e).__name__}")
+                return None
+        return _persistent_cache
+
+def get_probe_cache_stats() -> Optional[Dict[str, Any]]:
+    """Hit/miss counters of the on-disk probe cache for this process, if enabled."""
+    cache = _get_persistent_cache()
+    return cache.stats() if cache is not None else None
+
+def get_probe_cache_metrics() -> Dict[str, Any]:
+    """In-memory and on-disk probe cache counters, for health artifacts."""
+    return {"memory": _probe_cache.stats(), "persistent": get_probe_cache_stats()}
+
+def _log_probe_batch(count: int, http_code: Any, ready: int, unresolved: int):
+    """Logs a single line summary of a batch probe (counts only, no token ids)."""
+    logger.info(f"CLOB_PROBE_BATCH | tokens: {count} | code: {http_code} | ready: {ready} | unresolved: {unresolved}")
+
+def _add_many_to_cache(results: Dict[str, ProbeResult]):
+    """Caches several probe results, writing the on-disk cache in one transaction."""
+    now = time.time()
+    entries = []
+    for token_id, r in results.items():
+        ttl = cache_ttl_for(r.reason, r.status)
+        expiry = now + ttl
+        _probe_cache.set(token_id, (r.status, r.reason, r.meta), ttl)
+        entries.append((token_id, (r.status, r.reason, r.meta), expiry))
+    cache = _get_persistent_cache()
+    if cache is not None and entries:
+        try:
+            cache.put_many(entries)
+        except sqlite3.Error as e:
+            logger.warning(f"Persistent probe cache write failed: {type(e).__name__}")
+
 def _add_to_cache(token_id: str, result: Tuple[ReadinessStatus, FailureReason, Dict], status: ReadinessStatus, reason: FailureReason):
     """Adds a result to the cache with a TTL derived from status/reason."""
     ttl = cache_ttl_for(reason, status)
     expiry = time.time() + ttl
-    _probe_cache[token_id] = (expiry, result)
+    _probe_cache.set(token_id, result, ttl)
+    cache = _get_persistent_cache()
+    if cache is not None:
+        try:
+            cache.put(token_id, result, expiry)
+        except sqlite3.Error as e:
+            logger.warning(f"Persistent probe cache write failed: {type(e).__name__}")
 
 def _get_from_cache(token_id: str) -> Optional[Tuple[ReadinessStatus, FailureReason, Dict]]:
     """Retrieves a result from cache if valid."""
-    if token_id in _probe_cache:
-        expiry, result = _probe_cache[token_id]
-        if time.time() < expiry:
+    result = _probe_cache.get(token_id)
+    if result is not None:
+        return result
+    cache = _get_persistent_cache()
+    if cache is not None:
+        try:
+            entry = cache.get_with_expiry(token_id)
+        except sqlite3.Error as e:
+            logger.warning(f"Persistent probe cache read failed: {type(e).__name__}")
+            return None
+        if entry is not None:
+            # Keep the hit in memory for the rest of its original TTL.
+            result, expires_at = entry
+            _probe_cache.set(token_id, result, max(0.0, expires_at - time.time()))
             return result
-        else:
-            del _probe_cache[token_id]
     return None
 
 
-def discover_gamma_candidates(limit: int = 100) -> List[Dict[str, Any]]:
+def _read_gamma_backoff_state() -> Tuple[float, int]:
+    """(wall-clock deadline, attempt) from POLYMARKET_GAMMA_BACKOFF_PATH, (0, 0) if unset or unreadable."""
+    path = os.environ.get("POLYMARKET_GAMMA_BACKOFF_PATH")
+    if not path:
+        return 0.0, 0
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+        return float(state["until"]), int(state["attempt"])
+    except FileNotFoundError:
+        return 0.0, 0
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"Gamma backoff state unreadable: {type(e).__name__}")
+        return 0.0, 0
+
+
+def _write_gamma_backoff_state(until: float, attempt: int):
+    path = os.environ.get("POLYMARKET_GAMMA_BACKOFF_PATH")
+    if not path:
+        return
+    try:
+        # fsynced tmp + replace: a crash cannot leave an empty or torn file
+        # that would silently drop the backoff.
+        atomic_write_bytes(Path(path), json.dumps({"until": until, "attempt": attempt}).encode("utf-8"))
+    except OSError as e:
+        logger.warning(f"Gamma backoff state not saved: {type(e).__name__}")
+
+
+def _clear_gamma_backoff_state():
+    path = os.environ.get("POLYMARKET_GAMMA_BACKOFF_PATH")
+    if not path:
+        return
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Gamma backoff state not cleared: {type(e).__name__}")
+
+
+def _gamma_rate_limited(resp) -> float:
+    """Records a Gamma 429 and returns the backoff in seconds (Retry-After if given)."""
+    global _gamma_backoff_until, _gamma_backoff_attempt
+    attempt = max(_gamma_backoff_attempt, _read_gamma_backoff_state()[1])
+    try:
+        delay = float(resp.headers.get("Retry-After"))
+    except (TypeError, ValueError, AttributeError):
+        delay = GAMMA_RATE_LIMIT_BACKOFF_SECONDS * (2 ** attempt)
+    delay = min(GAMMA_MAX_RATE_LIMIT_BACKOFF_SECONDS, max(0.0, delay))
+    _gamma_backoff_attempt = attempt + 1
+    _gamma_backoff_until = time.monotonic() + delay
+    _write_gamma_backoff_state(time.time() + delay, _gamma_backoff_attempt)
+    return delay
+
+
+def gamma_backoff_remaining() -> float:
+    """Seconds until Gamma may be queried again after a 429 (0 if not limited)."""
+    persisted_until, _ = _read_gamma_backoff_state()
+    return max(0.0, _gamma_backoff_until - time.monotonic(), persisted_until - time.time())
+
+
+def fetch_gamma_page(
+    params: Dict[str, Any],
+    headers: Optional[Dict[str, str]] = None,
+) -> Tuple[Optional[Any], bool]:
     """
-    Fetches active markets from Polymarket Gamma API.
+    GETs one /markets page. Returns (response, rate_limited).
+
+    The response is None unless the status is 200 or 304 (304 only happens
+    when conditional `headers` were sent). A 429 records the backoff
+    deadline instead of sleeping.
+    """
+    global _gamma_backoff_attempt
+    kwargs = {"headers": headers} if headers else {}
+    try:
+        resp = requests.get(f"{GAMMA_URL_BASE}/markets", params=params, timeout=10, **kwargs)
+    except Exception as e:
+        logger.error(f"Gamma discovery error: {e}")
+        return None, False
+    if resp.status_code == 429:
+        delay = _gamma_rate_limited(resp)
+        logger.warning(f"Gamma discovery rate limited at offset {params.get('offset')}; backing off {delay:.0f}s")
+        return None, True
+    if resp.status_code not in (200, 304):
+        logger.warning(f"Gamma discovery failed: {resp.status_code}")
+        return None, False
+    _clear_gamma_backoff_state()
+    _gamma_backoff_attempt = 0
+    return resp, False
+
+
+def gamma_page_size() -> int:
+    """Markets per Gamma page (POLYMARKET_GAMMA_PAGE_SIZE)."""
+    return max(1, env_number("POLYMARKET_GAMMA_PAGE_SIZE", DEFAULT_GAMMA_PAGE_SIZE, int))
+
+
+def gamma_max_pages() -> int:
+    """Page cap for one Gamma listing (POLYMARKET_GAMMA_MAX_PAGES)."""
+    return env_number("POLYMARKET_GAMMA_MAX_PAGES", DEFAULT_GAMMA_MAX_PAGES, int)
+
+
+def gamma_page_markets(resp) -> Optional[List[Dict[str, Any]]]:
+    """Markets of one Gamma /markets response, or None if it is not a JSON list."""
+    try:
+        markets = resp.json()
+    except ValueError as e:
+        logger.error(f"Gamma discovery error: {e}")
+        return None
+    if not isinstance(markets, list):
+        logger.warning("Gamma discovery returned a non-list payload")
+        return None
+    return markets
+
+
+def iter_gamma_markets(
+    page_size: Optional[int] = None,
+    max_pages: Optional[int] = None,
+    stats: Optional[Dict[str, Any]] = None,
+) -> Iterator[Dict[str, Any]]:
     """
+    Streams active Gamma markets page by page, most liquid first.
+
+    Pages are fetched lazily, so a consumer that stops iterating stops the
+    requests. A 429 never sleeps: the stream ends with what it has and
+    discovery is skipped until the backoff (Retry-After, else exponential
+    from 30 s) has passed. Page size and count default to
+    POLYMARKET_GAMMA_PAGE_SIZE (100) and POLYMARKET_GAMMA_MAX_PAGES (10).
+
+    If `stats` is given it is filled with pages, markets and rate_limited.
+    """
+    if page_size is None:
+        page_size = gamma_page_size()
+    if max_pages is None:
+        max_pages = gamma_max_pages()
+    counters = stats if stats is not None else {}
+    counters.update(pages=0, markets=0, rate_limited=False)
+
     if os.environ.get("POLYMARKET_FIXTURE_MODE") == "1":
          # Load from gamma_ready_candidate.json
          fix_path = Path(__file__).resolve().parents[1] / "tests" / "fixtures" / "polymarket" / "gamma_ready_candidate.json"
          if fix_path.exists():
              with open(fix_path, 'r') as f:
-                 return [json.load(f)]
-         return []
+                 counters["pages"] = counters["markets"] = 1
+                 yield json.load(f)
+         return
 
-    url = f"https://gamma-api.polymarket.com/markets?active=true&closed=false&limit={limit}&offset=0"
-    try:
-        resp = requests.get(url, timeout=10)
-        if resp.status_code != 200:
-            logger.warning(f"Gamma discovery failed: {resp.status_code}")
-            return []
-        return resp.json()
-    except Exception as e:
-        logger.error(f"Gamma discovery error: {e}")
-        return []
+    wait = gamma_backoff_remaining()
+    if wait > 0:
+        logger.warning(f"Gamma discovery skipped: rate limited for another {wait:.0f}s")
+        counters["rate_limited"] = True
+        return
 
+    for page in range(max(0, max_pages)):
+        params = {
+            "active": "true",
+            "closed": "false",
+            "limit": page_size,
+            "offset": page * page_size,
+            "order": "liquidityNum",
+            "ascending": "false",
+        }
+        resp, rate_limited = fetch_gamma_page(params)
+        if resp is None:
+            counters["rate_limited"] = rate_limited
+            return
+        markets = gamma_page_markets(resp)
+        if markets is None:
+            return
+        counters["pages"] += 1
+        counters["markets"] += len(markets)
+        yield from markets
+        if len(markets) < page_size:
+            return
 
-def _is_market_eligible(m: Dict[str, Any]) -> Tuple[bool, FailureReason]:
-    """Strict eligibility filters for a candidate market."""
+
+def discover_gamma_candidates(limit: int = 100, stream: bool = False) -> Any:
+    """
+    Fetches active markets from Polymarket Gamma API.
+
+    By default returns a list of at most `limit` markets from one page. With
+    stream=True returns the lazy paginated iterator from iter_gamma_markets.
+    """
+    if stream:
+        return iter_gamma_markets()
+    return list(islice(iter_gamma_markets(page_size=limit, max_pages=1), limit))
+
+
+def parse_end_date(end_date_str: str) -> datetime:
+    """Parses Gamma endDateIso; date-only or naive values are taken as UTC. Raises ValueError."""
+    dt = datetime.fromisoformat(end_date_str.replace('Z', '+00:00'))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+def static_eligibility(m: Dict[str, Any]) -> Tuple[bool, FailureReason, Optional[datetime]]:
+    """
+    Eligibility checks that depend only on the market payload.
+
+    Returns (ok, reason, end_date). The expiry window is the only
+    time-dependent check and is left to the caller.
+    """
     if not m.get("enableOrderBook"):
-        return False, FailureReason.ORDERBOOK_DISABLED
+        return False, FailureReason.ORDERBOOK_DISABLED, None
     if not m.get("acceptingOrders"):
-        return False, FailureReason.NOT_ACCEPTING_ORDERS
+        return False, FailureReason.NOT_ACCEPTING_ORDERS, None
     if m.get("closed"):
-        return False, FailureReason.MARKET_FILTERED_OUT
+        return False, FailureReason.MARKET_FILTERED_OUT, None
     if m.get("restricted"):
-        return False, FailureReason.RESTRICTED
+        return False, FailureReason.RESTRICTED, None
     
     end_date_str = m.get("endDateIso")
     if not end_date_str:
-        return False, FailureReason.NO_END_DATE
+        return False, FailureReason.NO_END_DATE, None
     
     try:
-        dt = datetime.fromisoformat(end_date_str.replace('Z', '+00:00'))
-        now = datetime.now(timezone.utc)
-        if dt < now + timedelta(hours=MIN_HOURS_TO_EXPIRY):
-             return False, FailureReason.EXPIRING_SOON
-    except ValueError:
-        return False, FailureReason.BAD_DATE_FORMAT
+        dt = parse_end_date(end_date_str)
+    except (ValueError, TypeError, AttributeError):
+        return False, FailureReason.BAD_DATE_FORMAT, None
+
+    return True, FailureReason.OK, dt
+
+
+def _is_market_eligible(m: Dict[str, Any]) -> Tuple[bool, FailureReason]:
+    """Strict eligibility filters for a candidate market."""
+    ok, reason, dt = static_eligibility(m)
+    if not ok:
+        return False, reason
+
+    now = datetime.now(timezone.utc)
+    if dt < now + timedelta(hours=MIN_HOURS_TO_EXPIRY):
+         return False, FailureReason.EXPIRING_SOON
 
     return True, FailureReason.OK
 
 
-def select_best_clob_candidate(max_probes: int = DEFAULT_MAX_PROBES) -> SelectionResult:
+def _catalogue_candidates(path: str, limit: int) -> Optional[Tuple[int, List[Any], int, Any]]:
+    """
+    Syncs the local Gamma catalogue and its ranking index.
+
+    Returns (catalogue size, top eligible candidates, skipped, payload loader),
+    or None if the catalogue cannot be used (callers then stream Gamma). A
+    failed sync still ranks what the catalogue already holds.
+    """
+    # Imported lazily: gamma_catalogue builds on this module.
+    from polymarket.gamma_catalogue import get_catalogue_ranking
+
+    try:
+        ranking = get_catalogue_ranking(path)
+        catalogue = ranking.catalogue
+        try:
+            diff = catalogue.sync()
+        except sqlite3.Error as e:
+            logger.warning(f"Gamma catalogue sync failed: {type(e).__name__}")
+            # Pages committed before the failure are not in any diff.
+            ranking.refresh()
+        else:
+            touched = ranking.refresh(diff)
+            logger.info(
+                f"Gamma catalogue {diff.mode} sync: added={len(diff.added)} changed={len(diff.changed)} "
+                f"removed={len(diff.removed)} pages={diff.pages} not_modified={diff.not_modified} "
+                f"complete={diff.complete} index_updates={touched}"
+            )
+        skipped = sum(catalogue.skip_counts().values())
+        return len(catalogue), ranking.top(limit), skipped, catalogue.get_market
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"Gamma catalogue unavailable: {type(e).__name__}")
+        return None
+
+
+def rank_clob_candidates(target_eligible: int) -> Tuple[int, List[Any], int, Any]:
+    """
+    Ranked, eligible candidates for probing.
+
+    Returns (markets seen, RankedCandidates best first, skipped, payload
+    loader or None). Uses the local catalogue when
+    POLYMARKET_GAMMA_CATALOGUE_PATH is set and usable, else streams Gamma.
+    """
+    catalogue_path = os.environ.get("POLYMARKET_GAMMA_CATALOGUE_PATH")
+    if catalogue_path:
+        candidates = _catalogue_candidates(catalogue_path, target_eligible)
+        if candidates is not None:
+            return candidates
+
+    # Imported lazily: both build on this module.
+    from polymarket.candidate_index import CandidateIndex, candidate_from_market
+    from polymarket.eligibility_batch import MarketColumns
+
+    # Gamma pages stream in and are filtered a page at a time with vector
+    # masks; pagination stops once enough eligible candidates have been seen.
+    page_size = gamma_page_size()
+    stream = iter(discover_gamma_candidates(stream=True))
+    now = time.time()
+    target_eligible = max(1, target_eligible)
+    seen = 0
+    skipped = 0
+    index = CandidateIndex()
+    while len(index) < target_eligible:
+        page = list(islice(stream, page_size))
+        if not page:
+            break
+        eligible = [int(i) for i in (MarketColumns.from_markets(page).reason_codes(now) == 0).nonzero()[0]]
+        needed = target_eligible - len(index)
+        if len(eligible) >= needed:
+            # Count only up to the market that completes the target.
+            eligible = eligible[:needed]
+            consumed = eligible[-1] + 1
+        else:
+            consumed = len(page)
+        seen += consumed
+        skipped += consumed - len(eligible)
+        for i in eligible:
+            index.upsert(candidate_from_market(page[i]))
+    return seen, index.top(len(index)), skipped, None
+
+
+def select_best_clob_candidate(
+    max_probes: int = DEFAULT_MAX_PROBES,
+    concurrency: Optional[int] = None,
+    request_budget: Optional[int] = None,
+    rate_per_sec: Optional[float] = None,
+    target_eligible: Optional[int] = None,
+) -> SelectionResult:
     """
     Main pipeline to select a trading candidate.
+
+    The top `max_probes` ranked candidates are probed concurrently
+    (POLYMARKET_PROBE_CONCURRENCY, default 4) under one shared request budget
+    (POLYMARKET_PROBE_REQUEST_BUDGET, default 40) and rate limit
+    (POLYMARKET_PROBE_RATE_PER_SEC, default 10). Results are consumed in rank
+    order: the highest-ranked READY candidate wins, and we return as soon as
+    every higher-ranked probe has come back not ready. Concurrent probes
+    draw on the budget in completion order, so lower-ranked probes can spend
+    it while a higher-ranked one is still retrying. A candidate whose probe
+    ran out of budget therefore ends the selection as NOT_READY
+    (CLOB_BUDGET_EXHAUSTED) rather than letting a lower-ranked READY
+    candidate win over one whose readiness is unknown.
+
+    Gamma is paged lazily (see iter_gamma_markets) and discovery stops after
+    `target_eligible` eligible markets (POLYMARKET_GAMMA_TARGET_ELIGIBLE,
+    default max_probes). If POLYMARKET_GAMMA_CATALOGUE_PATH is set, candidates
+    come from the incrementally synced local catalogue instead
+    (polymarket.gamma_catalogue). With POLYMARKET_PROBE_BATCH=1 the window
+    is first probed with one batch /midpoints request.
     """
+    if concurrency is None:
+        concurrency = env_number("POLYMARKET_PROBE_CONCURRENCY", DEFAULT_PROBE_CONCURRENCY, int)
+
+    if target_eligible is None:
+        target_eligible = env_number("POLYMARKET_GAMMA_TARGET_ELIGIBLE", max_probes, int)
+
     result = SelectionResult()
-    
-    candidates = discover_gamma_candidates(limit=100)
-    if not candidates:
+    seen, ranked, result.skipped_count, load_market = rank_clob_candidates(target_eligible)
+            
+    if not seen:
         result.readiness_status = ReadinessStatus.NOT_READY
         result.failure_reason = FailureReason.EXHAUSTED_PROBES_OR_CANDIDATES
         return result
         
-    filtered_candidates = []
-    
-    for m in candidates:
-        eligible, reason = _is_market_eligible(m)
-        if eligible:
-            filtered_candidates.append(m)
-        else:
-            result.skipped_count += 1
-            
-    if not filtered_candidates:
+    if not ranked:
         result.readiness_status = ReadinessStatus.NOT_READY
         result.failure_reason = FailureReason.MARKET_FILTERED_OUT
         return result
         
-    def get_sort_key(m):
-        liq = float(m.get("liquidityNum") or 0)
-        vol = float(m.get("volume24hr") or 0)
-        return (liq, vol)
-        
-    filtered_candidates.sort(key=get_sort_key, reverse=True)
-    
-    probes_left = max_probes
-    
-    for m in filtered_candidates:
-        if probes_left <= 0:
-            break
-            
-        probes_left -= 1
-        result.probes_attempted += 1
-        
-        success, yes_token, no_token, parse_reason = parse_gamma_yes_no_tokens(m)
-        if not success:
-            continue
-            
-        target_token = yes_token
-        status, reason, meta = probe_clob_readiness(target_token)
-        
-        if status == ReadinessStatus.READY:
-            result.selected_market_id = m.get("id")
-            result.selected_token_id = target_token
-            result.readiness_status = ReadinessStatus.READY
-            result.failure_reason = FailureReason.OK
-            result.meta = {
-                "no_token_id": no_token,
-                "gamma_data": {k: m.get(k) for k in ["question", "slug"]},
-                "probe_meta": meta
-            }
-            return result
+    # Candidates come ranked by (liquidityNum, volume24hr) with tokens
+    # already parsed. Every candidate in the window uses a probe slot, even
+    # if its tokens failed to parse (same accounting as the sequential loop).
+    window = ranked[:max(0, max_probes)]
+
+    gate = ProbeRequestGate.from_env(request_budget, rate_per_sec)
+    if os.environ.get("POLYMARKET_PROBE_BATCH") == "1":
+        # One /midpoints round trip answers most of the window via the
+        # cache; only tokens it could not resolve are probed singly below.
+        probe_clob_readiness_batch([c.yes_token for c in window if c.yes_token is not None], gate=gate, fallback=False)
+    executor = ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix="clob-probe")
+    try:
+        futures = [
+            executor.submit(probe_clob_readiness, c.yes_token, gate=gate) if c.yes_token is not None else None
+            for c in window
+        ]
+        for c, future in zip(window, futures):
+            result.probes_attempted += 1
+            if future is None:
+                continue
+
+            status, reason, meta = future.result()
+
+            if reason == FailureReason.CLOB_BUDGET_EXHAUSTED:
+                # Unknown, not "not ready": stop rather than pass over it.
+                result.readiness_status = ReadinessStatus.NOT_READY
+                result.failure_reason = FailureReason.CLOB_BUDGET_EXHAUSTED
+                return result
+
+            if status == ReadinessStatus.READY:
+                m = c.market
+                if m is None and load_market is not None:
+                    m = load_market(c.market_id)
+                m = m or {}
+                result.selected_market_id = c.market_id
+                result.selected_token_id = c.yes_token
+                result.readiness_status = ReadinessStatus.READY
+                result.failure_reason = FailureReason.OK
+                result.meta = {
+                    "no_token_id": c.no_token,
+                    "gamma_data": {k: m.get(k) for k in ["question", "slug"]},
+                    "probe_meta": meta
+                }
+                return result
+    finally:
+        # Lower-ranked probes are no longer needed: drop queued ones and make
+        # running ones give up at their next attempt.
+        gate.close()
+        executor.shutdown(wait=False, cancel_futures=True)
+        result.probe_requests = gate.used
         
     result.readiness_status = ReadinessStatus.NOT_READY
     result.failure_reason = FailureReason.NO_READY_CANDIDATES
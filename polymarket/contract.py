@@ -17,6 +17,7 @@ class FailureReason(Enum):
     CLOB_5XX = "CLOB_5XX"
     CLOB_INVALID_PAYLOAD = "CLOB_INVALID_PAYLOAD"
     CLOB_UNKNOWN_ERROR = "CLOB_UNKNOWN_ERROR"
+    CLOB_BUDGET_EXHAUSTED = "CLOB_BUDGET_EXHAUSTED"  # Local per-selection request budget spent
 
     # Non-Retryable / Permanent Errors
     INVALID_TOKEN_ID = "INVALID_TOKEN_ID"
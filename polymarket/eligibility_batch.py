@@ -0,0 +1,132 @@
+"""
+Columnar eligibility filtering for pages of Gamma markets.
+
+MarketColumns pulls the fields the eligibility checks read out of a list of
+Gamma market dicts once, as NumPy arrays (flags, end timestamps, liquidity,
+volume). reason_codes() then applies every predicate as a vector mask in the
+same order as clob_readiness.static_eligibility / _is_market_eligible, so
+each market gets the same FailureReason the scalar filter would give it.
+
+End dates are parsed with clob_readiness.parse_end_date once per distinct
+string; Gamma pages repeat a small set of end dates, so most markets cost a
+dict lookup instead of a datetime parse.
+"""
+
+import math
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from polymarket import clob_readiness
+from polymarket.contract import FailureReason
+
+# Code 0 is OK; the rest are in check order (first failing check wins).
+REASONS: List[FailureReason] = [
+    FailureReason.OK,
+    FailureReason.ORDERBOOK_DISABLED,
+    FailureReason.NOT_ACCEPTING_ORDERS,
+    FailureReason.MARKET_FILTERED_OUT,
+    FailureReason.RESTRICTED,
+    FailureReason.NO_END_DATE,
+    FailureReason.BAD_DATE_FORMAT,
+    FailureReason.EXPIRING_SOON,
+]
+
+
+def _end_ts(value: Any) -> float:
+    try:
+        return clob_readiness.parse_end_date(value).timestamp()
+    except (ValueError, TypeError, AttributeError):
+        return math.nan
+
+
+@dataclass
+class MarketColumns:
+    order_book: np.ndarray
+    accepting: np.ndarray
+    closed: np.ndarray
+    restricted: np.ndarray
+    has_end: np.ndarray
+    end_ts: np.ndarray  # epoch seconds; NaN if missing or unparseable
+    liquidity: np.ndarray
+    volume: np.ndarray
+
+    @classmethod
+    def from_markets(cls, markets: Sequence[Dict[str, Any]]) -> "MarketColumns":
+        n = len(markets)
+
+        def flags(key: str) -> np.ndarray:
+            return np.fromiter((bool(m.get(key)) for m in markets), dtype=bool, count=n)
+
+        def numbers(key: str) -> np.ndarray:
+            out = np.zeros(n, dtype=np.float64)
+            for i, m in enumerate(markets):
+                try:
+                    out[i] = float(m.get(key) or 0)
+                except (TypeError, ValueError):
+                    pass
+            return out
+
+        raw_end = [m.get("endDateIso") for m in markets]
+        parsed: Dict[Any, float] = {}
+        end_ts = np.full(n, np.nan)
+        for i, value in enumerate(raw_end):
+            if not value:
+                continue
+            try:
+                ts = parsed.get(value)
+                if ts is None:
+                    ts = parsed[value] = _end_ts(value)
+            except TypeError:  # unhashable payload value
+                ts = _end_ts(value)
+            end_ts[i] = ts
+
+        return cls(
+            order_book=flags("enableOrderBook"),
+            accepting=flags("acceptingOrders"),
+            closed=flags("closed"),
+            restricted=flags("restricted"),
+            has_end=np.fromiter((bool(v) for v in raw_end), dtype=bool, count=n),
+            end_ts=end_ts,
+            liquidity=numbers("liquidityNum"),
+            volume=numbers("volume24hr"),
+        )
+
+    def __len__(self) -> int:
+        return len(self.order_book)
+
+    def reason_codes(self, now: Optional[float] = None) -> np.ndarray:
+        """Index into REASONS per market; 0 means eligible at `now` (epoch seconds)."""
+        now = time.time() if now is None else now
+        min_end = now + clob_readiness.MIN_HOURS_TO_EXPIRY * 3600
+        with np.errstate(invalid="ignore"):
+            expiring = self.end_ts < min_end
+        return np.select(
+            [
+                ~self.order_book,
+                ~self.accepting,
+                self.closed,
+                self.restricted,
+                ~self.has_end,
+                np.isnan(self.end_ts),
+                expiring,
+            ],
+            np.arange(1, len(REASONS), dtype=np.int8),
+            default=0,
+        ).astype(np.int8)
+
+
+def skip_counts(codes: np.ndarray) -> Dict[str, int]:
+    """Ineligible markets by FailureReason name."""
+    counts = np.bincount(codes, minlength=len(REASONS))
+    return {REASONS[code].name: int(n) for code, n in enumerate(counts) if code and n}
+
+
+def filter_markets(
+    markets: Sequence[Dict[str, Any]], now: Optional[float] = None
+) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    """Eligible markets (input order) and per-reason skip counts."""
+    codes = MarketColumns.from_markets(markets).reason_codes(now)
+    return [markets[i] for i in np.flatnonzero(codes == 0)], skip_counts(codes)
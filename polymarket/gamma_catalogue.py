@@ -0,0 +1,500 @@
+"""
+Local catalogue of Gamma markets, synced incrementally.
+
+Markets are stored in SQLite keyed by id with a digest of their payload and
+the payload-only ("static") part of the eligibility check, evaluated once
+when a market is added or changes. The expiry window, the only
+time-dependent check, is applied in the query, so listing eligible markets
+never re-parses payloads.
+
+Incremental syncs page /markets in descending `updatedAt` order and stop at
+the stored watermark; the first page is sent with If-None-Match /
+If-Modified-Since so an unchanged catalogue costs one 304 where Gamma
+supports it. Closed or inactive markets seen this way are removed. Markets
+that simply drop out of the active listing are only noticed by a full sync,
+which runs when there is no watermark yet or every
+POLYMARKET_GAMMA_FULL_RESYNC_SEC (default 3600) seconds. A full listing can
+be longer than one run's page cap, so a full pass resumes from a stored page
+offset across syncs; it only removes markets it did not see, and only sets
+the watermark, once it has reached the end of the listing.
+
+Pages are fetched with no transaction open and committed one at a time, so
+other processes sharing the catalogue file are never locked out for the
+length of a sync.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from polymarket.clob_readiness import (
+    MIN_HOURS_TO_EXPIRY,
+    env_number,
+    gamma_max_pages,
+    gamma_page_markets,
+    gamma_page_size,
+    static_eligibility,
+    fetch_gamma_page,
+    gamma_backoff_remaining,
+)
+from polymarket.candidate_index import CandidateIndex, RankedCandidate, candidate_from_market
+from polymarket.contract import FailureReason
+from shared.sqlite_util import connect
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FULL_RESYNC_SEC = 3600
+MAX_INCREMENTAL_PAGES = 50
+
+MODE_FULL = "full"
+MODE_INCREMENTAL = "incremental"
+
+
+@dataclass
+class CatalogueDiff:
+    mode: str
+    added: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    pages: int = 0
+    not_modified: bool = False
+    complete: bool = False
+    rate_limited: bool = False
+
+    @property
+    def churn(self) -> int:
+        return len(self.added) + len(self.changed) + len(self.removed)
+
+
+def _digest(market: Dict[str, Any]) -> str:
+    return hashlib.sha1(json.dumps(market, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _updated_ts(market: Dict[str, Any]) -> Optional[float]:
+    raw = market.get("updatedAt")
+    if not raw:
+        return None
+    try:
+        dt = datetime.fromisoformat(str(raw).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def _float(value: Any) -> float:
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _is_gone(market: Dict[str, Any]) -> bool:
+    return bool(market.get("closed")) or market.get("active") is False
+
+
+class GammaCatalogue:
+    """SQLite-backed Gamma market catalogue with diffing syncs."""
+
+    def __init__(self, path: str, page_size: Optional[int] = None, full_resync_sec: Optional[float] = None):
+        self.path = path
+        self.page_size = page_size or gamma_page_size()
+        self.full_resync_sec = (
+            full_resync_sec
+            if full_resync_sec is not None
+            else env_number("POLYMARKET_GAMMA_FULL_RESYNC_SEC", DEFAULT_FULL_RESYNC_SEC, float)
+        )
+        self._lock = threading.Lock()
+        self._conn = connect(path)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS gamma_markets ("
+                "id TEXT PRIMARY KEY, digest TEXT NOT NULL, updated_ts REAL, payload TEXT NOT NULL, "
+                "static_ok INTEGER NOT NULL, reason TEXT NOT NULL, end_ts REAL, "
+                "liquidity REAL NOT NULL, volume REAL NOT NULL, "
+                "yes_token TEXT, no_token TEXT, parse_reason TEXT, seen_pass REAL)"
+            )
+            # Catalogues created before token columns existed are backfilled.
+            existing = {row[1] for row in self._conn.execute("PRAGMA table_info(gamma_markets)")}
+            for col, kind in (("yes_token", "TEXT"), ("no_token", "TEXT"), ("parse_reason", "TEXT"), ("seen_pass", "REAL")):
+                if col not in existing:
+                    self._conn.execute(f"ALTER TABLE gamma_markets ADD COLUMN {col} {kind}")
+            stale = self._conn.execute(
+                "SELECT id, payload FROM gamma_markets WHERE parse_reason IS NULL"
+            ).fetchall()
+            for market_id, payload in stale:
+                c = candidate_from_market(json.loads(payload))
+                self._conn.execute(
+                    "UPDATE gamma_markets SET yes_token = ?, no_token = ?, parse_reason = ? WHERE id = ?",
+                    (c.yes_token, c.no_token, c.parse_reason.value, market_id),
+                )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_gamma_markets_rank ON gamma_markets(static_ok, liquidity, volume)"
+            )
+            self._conn.execute("CREATE TABLE IF NOT EXISTS gamma_sync_state (key TEXT PRIMARY KEY, value TEXT)")
+
+    # -- sync state ---------------------------------------------------------
+
+    def _get_state(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM gamma_sync_state WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_state(self, key: str, value: Any):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO gamma_sync_state (key, value) VALUES (?, ?)",
+            (key, None if value is None else str(value)),
+        )
+
+    @property
+    def watermark(self) -> Optional[float]:
+        raw = self._get_state("watermark")
+        return float(raw) if raw is not None else None
+
+    # -- sync ---------------------------------------------------------------
+
+    def _apply(self, market: Dict[str, Any], diff: CatalogueDiff, seen_pass: Optional[float] = None) -> Optional[float]:
+        """
+        Upserts or removes one market. Returns its updatedAt timestamp.
+
+        `seen_pass` marks the market as listed by the full pass that started
+        at that time (unseen markets are removed when the pass completes).
+        """
+        market_id = market.get("id")
+        if market_id in (None, ""):
+            return None
+        market_id = str(market_id)
+        updated = _updated_ts(market)
+        row = self._conn.execute("SELECT digest FROM gamma_markets WHERE id = ?", (market_id,)).fetchone()
+        if _is_gone(market):
+            if row is not None:
+                self._conn.execute("DELETE FROM gamma_markets WHERE id = ?", (market_id,))
+                diff.removed.append(market_id)
+            return updated
+
+        digest = _digest(market)
+        if row is not None and row[0] == digest:
+            if seen_pass is not None:
+                self._conn.execute("UPDATE gamma_markets SET seen_pass = ? WHERE id = ?", (seen_pass, market_id))
+            return updated
+        ok, reason, end_dt = static_eligibility(market)
+        c = candidate_from_market(market)
+        self._conn.execute(
+            "INSERT OR REPLACE INTO gamma_markets "
+            "(id, digest, updated_ts, payload, static_ok, reason, end_ts, liquidity, volume, "
+            "yes_token, no_token, parse_reason, seen_pass) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                market_id,
+                digest,
+                updated,
+                json.dumps(market),
+                1 if ok else 0,
+                reason.value,
+                end_dt.timestamp() if end_dt is not None else None,
+                _float(market.get("liquidityNum")),
+                _float(market.get("volume24hr")),
+                c.yes_token,
+                c.no_token,
+                c.parse_reason.value,
+                seen_pass,
+            ),
+        )
+        (diff.changed if row is not None else diff.added).append(market_id)
+        return updated
+
+    def _pages(
+        self, params: Dict[str, Any], start_page: int, max_pages: int, diff: CatalogueDiff, conditional: bool
+    ) -> Iterator[Tuple[List[Dict[str, Any]], Dict[str, Optional[str]]]]:
+        """
+        Yields (markets, validators) per page. Nothing is written here, so
+        no transaction is open while a page is being fetched.
+        """
+        for page in range(start_page, start_page + max_pages):
+            page_params = dict(params, limit=self.page_size, offset=page * self.page_size)
+            headers = None
+            first = conditional and page == start_page
+            if first:
+                headers = {}
+                etag = self._get_state("etag")
+                last_modified = self._get_state("last_modified")
+                if etag:
+                    headers["If-None-Match"] = etag
+                if last_modified:
+                    headers["If-Modified-Since"] = last_modified
+            resp, rate_limited = fetch_gamma_page(page_params, headers)
+            if resp is None:
+                diff.rate_limited = rate_limited
+                return
+            if resp.status_code == 304:
+                diff.not_modified = True
+                diff.complete = True
+                return
+            validators: Dict[str, Optional[str]] = {}
+            if first:
+                resp_headers = getattr(resp, "headers", None) or {}
+                validators = {"etag": resp_headers.get("ETag"), "last_modified": resp_headers.get("Last-Modified")}
+            markets = gamma_page_markets(resp)
+            if markets is None:
+                return
+            diff.pages += 1
+            last = len(markets) < self.page_size
+            if last:
+                diff.complete = True
+            yield markets, validators
+            if last:
+                return
+
+    def sync(self, full: Optional[bool] = None, max_pages: Optional[int] = None) -> CatalogueDiff:
+        """
+        Brings the catalogue up to date and returns what changed.
+
+        `full` forces (True) or suppresses (False) a full listing; by default
+        one runs when there is no watermark, the last one is too old, or a
+        full pass is still in progress. A full pass reads at most `max_pages`
+        pages (POLYMARKET_GAMMA_MAX_PAGES) per call and resumes from the
+        stored page offset on the next call until it reaches the end of the
+        listing. Each page is committed on its own; pages are fetched with
+        no transaction open.
+        """
+        with self._lock:
+            last_full = self._get_state("last_full_sync")
+            watermark = self.watermark
+            if full is None:
+                full = (
+                    self._get_state("full_offset") is not None
+                    or watermark is None
+                    or last_full is None
+                    or time.time() - float(last_full) >= self.full_resync_sec
+                )
+            diff = CatalogueDiff(mode=MODE_FULL if full else MODE_INCREMENTAL)
+            if gamma_backoff_remaining() > 0:
+                diff.rate_limited = True
+                return diff
+            if full:
+                if max_pages is None:
+                    max_pages = gamma_max_pages()
+                self._sync_full(diff, max(1, max_pages))
+            else:
+                self._sync_incremental(diff, watermark, max_pages or MAX_INCREMENTAL_PAGES)
+            return diff
+
+    def _sync_full(self, diff: CatalogueDiff, max_pages: int):
+        offset = self._get_state("full_offset")
+        pass_started = self._get_state("full_pass_started")
+        if offset is None or pass_started is None:
+            page = 0
+            pass_started = time.time()
+            newest = None
+            with self._conn:
+                self._set_state("full_pass_started", pass_started)
+                self._set_state("full_offset", 0)
+                self._set_state("full_pass_newest", None)
+        else:
+            page = int(offset)
+            pass_started = float(pass_started)
+            raw_newest = self._get_state("full_pass_newest")
+            newest = float(raw_newest) if raw_newest is not None else None
+
+        params = {"active": "true", "closed": "false", "order": "id", "ascending": "true"}
+        for markets, _ in self._pages(params, page, max_pages, diff, conditional=False):
+            with self._conn:
+                for m in markets:
+                    updated = self._apply(m, diff, seen_pass=pass_started)
+                    if updated is not None and (newest is None or updated > newest):
+                        newest = updated
+                page += 1
+                self._set_state("full_offset", page)
+                self._set_state("full_pass_newest", newest)
+
+        if not diff.complete:
+            return
+        with self._conn:
+            # Only a pass that reached the end of the listing proves absence.
+            stale = [
+                r[0] for r in self._conn.execute(
+                    "SELECT id FROM gamma_markets WHERE seen_pass IS NULL OR seen_pass < ?", (pass_started,)
+                )
+            ]
+            for market_id in stale:
+                self._conn.execute("DELETE FROM gamma_markets WHERE id = ?", (market_id,))
+                diff.removed.append(market_id)
+            # Markets updated after the pass started may sit behind its
+            # offset, so incremental syncs pick up from the pass start.
+            watermark = pass_started if newest is None else min(newest, pass_started)
+            self._set_state("watermark", watermark)
+            self._set_state("last_full_sync", time.time())
+            for key in ("full_offset", "full_pass_started", "full_pass_newest"):
+                self._conn.execute("DELETE FROM gamma_sync_state WHERE key = ?", (key,))
+
+    def _sync_incremental(self, diff: CatalogueDiff, watermark: Optional[float], max_pages: int):
+        newest = watermark
+        params = {"active": "true", "order": "updatedAt", "ascending": "false"}
+        for markets, validators in self._pages(params, 0, max_pages, diff, conditional=True):
+            reached = False
+            with self._conn:
+                for key, value in validators.items():
+                    self._set_state(key, value)
+                for m in markets:
+                    updated = self._apply(m, diff)
+                    if updated is not None and (newest is None or updated > newest):
+                        newest = updated
+                    if updated is not None and watermark is not None and updated < watermark:
+                        reached = True
+            if reached:
+                diff.complete = True
+                break
+        if newest is not None and diff.complete:
+            with self._conn:
+                self._set_state("watermark", newest)
+
+    # -- queries ------------------------------------------------------------
+
+    def eligible_markets(self, now: Optional[float] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Eligible markets, most liquid first (liquidityNum, then volume24hr)."""
+        now = time.time() if now is None else now
+        min_end = now + timedelta(hours=MIN_HOURS_TO_EXPIRY).total_seconds()
+        sql = (
+            "SELECT payload FROM gamma_markets WHERE static_ok = 1 AND end_ts >= ? "
+            "ORDER BY liquidity DESC, volume DESC"
+        )
+        args: Tuple[Any, ...] = (min_end,)
+        if limit is not None:
+            sql += " LIMIT ?"
+            args += (limit,)
+        with self._lock:
+            return [json.loads(row[0]) for row in self._conn.execute(sql, args)]
+
+    def ranked_candidates(self, ids: Optional[List[str]] = None) -> List[RankedCandidate]:
+        """
+        Statically eligible markets as pre-parsed candidates, most liquid first.
+
+        Built from stored columns only; payloads are not decoded (see get_market).
+        With `ids`, only those markets are returned (ineligible ones are omitted).
+        """
+        sql = (
+            "SELECT id, liquidity, volume, end_ts, yes_token, no_token, parse_reason "
+            "FROM gamma_markets WHERE static_ok = 1"
+        )
+        args: Tuple[Any, ...] = ()
+        if ids is not None:
+            if not ids:
+                return []
+            sql += f" AND id IN ({','.join('?' * len(ids))})"
+            args = tuple(ids)
+        sql += " ORDER BY liquidity DESC, volume DESC"
+        with self._lock:
+            return [
+                RankedCandidate(
+                    market_id=row[0],
+                    liquidity=row[1],
+                    volume=row[2],
+                    end_ts=row[3],
+                    yes_token=row[4],
+                    no_token=row[5],
+                    parse_reason=FailureReason(row[6]),
+                )
+                for row in self._conn.execute(sql, args)
+            ]
+
+    def get_market(self, market_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT payload FROM gamma_markets WHERE id = ?", (str(market_id),)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def skip_counts(self, now: Optional[float] = None) -> Dict[str, int]:
+        """Ineligible markets by FailureReason name (EXPIRING_SOON evaluated at `now`)."""
+        now = time.time() if now is None else now
+        min_end = now + timedelta(hours=MIN_HOURS_TO_EXPIRY).total_seconds()
+        with self._lock:
+            counts = {
+                FailureReason(reason).name: n
+                for reason, n in self._conn.execute(
+                    "SELECT reason, COUNT(*) FROM gamma_markets WHERE static_ok = 0 GROUP BY reason"
+                )
+            }
+            expiring = self._conn.execute(
+                "SELECT COUNT(*) FROM gamma_markets WHERE static_ok = 1 AND end_ts < ?", (min_end,)
+            ).fetchone()[0]
+        if expiring:
+            counts[FailureReason.EXPIRING_SOON.name] = expiring
+        return counts
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM gamma_markets").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_catalogue: Optional[GammaCatalogue] = None
+_catalogue_lock = threading.Lock()
+
+
+def get_gamma_catalogue(path: str) -> GammaCatalogue:
+    """Process-wide catalogue for `path` (reopened if the path changes)."""
+    global _catalogue
+    with _catalogue_lock:
+        if _catalogue is None or _catalogue.path != path:
+            if _catalogue is not None:
+                _catalogue.close()
+            _catalogue = GammaCatalogue(path)
+        return _catalogue
+
+
+class CatalogueRanking:
+    """
+    CandidateIndex kept in step with a GammaCatalogue.
+
+    The first refresh loads every eligible candidate; later refreshes apply
+    only the diff returned by the catalogue sync.
+    """
+
+    def __init__(self, catalogue: GammaCatalogue):
+        self.catalogue = catalogue
+        self.index: Optional[CandidateIndex] = None
+
+    def refresh(self, diff: Optional[CatalogueDiff] = None) -> int:
+        """Applies a sync diff (or loads everything). Returns entries touched."""
+        if self.index is None or diff is None:
+            self.index = CandidateIndex(self.catalogue.ranked_candidates())
+            return len(self.index)
+        for market_id in diff.removed:
+            self.index.remove(market_id)
+        touched = diff.added + diff.changed
+        current = {c.market_id: c for c in self.catalogue.ranked_candidates(touched)}
+        for market_id in touched:
+            candidate = current.get(market_id)
+            if candidate is None:
+                # Changed into an ineligible market.
+                self.index.remove(market_id)
+            else:
+                self.index.upsert(candidate)
+        return len(touched) + len(diff.removed)
+
+    def top(self, k: int, now: Optional[float] = None) -> List[RankedCandidate]:
+        """Best `k` candidates outside the expiry window at `now`."""
+        if self.index is None:
+            self.refresh()
+        now = time.time() if now is None else now
+        return self.index.top(k, min_end_ts=now + timedelta(hours=MIN_HOURS_TO_EXPIRY).total_seconds())
+
+
+_rankings: Dict[str, CatalogueRanking] = {}
+
+
+def get_catalogue_ranking(path: str) -> CatalogueRanking:
+    """Process-wide ranking for the catalogue at `path`."""
+    catalogue = get_gamma_catalogue(path)
+    with _catalogue_lock:
+        ranking = _rankings.get(path)
+        if ranking is None or ranking.catalogue is not catalogue:
+            ranking = _rankings[path] = CatalogueRanking(catalogue)
+        return ranking
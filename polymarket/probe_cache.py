@@ -0,0 +1,115 @@
+"""
+Persistent CLOB probe cache shared across oneshot runs.
+
+The production shadow runner starts a fresh interpreter every minute, so the
+in-memory `_probe_cache` in clob_readiness never survives to the next run.
+This cache keeps probe results in a small SQLite database with the same
+per-status expiry (`cache_ttl_for`) so consecutive runs reuse them.
+
+Runs are serialized by flock in systemd, but the database is still opened in
+WAL mode with a busy timeout so ad-hoc runs alongside the service are safe.
+Expired rows are purged when the cache is opened.
+"""
+
+import json
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from polymarket.contract import FailureReason, ReadinessStatus
+from shared.sqlite_util import connect
+
+logger = logging.getLogger(__name__)
+
+ProbeTuple = Tuple[ReadinessStatus, FailureReason, Dict[str, Any]]
+
+
+class PersistentProbeCache:
+    """SQLite-backed token_id -> (status, reason, meta) cache with expiry."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.purged = 0
+        # Concurrent probes write from worker threads.
+        self._lock = threading.Lock()
+        self._conn = connect(path)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS clob_probe_cache ("
+                "token_id TEXT PRIMARY KEY, status TEXT NOT NULL, reason TEXT NOT NULL, "
+                "meta TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_clob_probe_cache_expires ON clob_probe_cache(expires_at)"
+            )
+            self.purged = self._conn.execute(
+                "DELETE FROM clob_probe_cache WHERE expires_at <= ?", (time.time(),)
+            ).rowcount
+
+    def get(self, token_id: str) -> Optional[ProbeTuple]:
+        entry = self.get_with_expiry(token_id)
+        return entry[0] if entry is not None else None
+
+    def get_with_expiry(self, token_id: str) -> Optional[Tuple[ProbeTuple, float]]:
+        """Unexpired (result, expires_at) for `token_id`, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, reason, meta, expires_at FROM clob_probe_cache WHERE token_id = ? AND expires_at > ?",
+                (token_id, time.time()),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        try:
+            return (ReadinessStatus(row[0]), FailureReason(row[1]), json.loads(row[2])), float(row[3])
+        except ValueError:
+            # Written by a build with a different contract; treat as a miss.
+            return None
+
+    def put(self, token_id: str, result: ProbeTuple, expires_at: float):
+        status, reason, meta = result
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO clob_probe_cache (token_id, status, reason, meta, expires_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (token_id, status.value, reason.value, json.dumps(meta or {}), expires_at),
+            )
+            self.writes += 1
+
+    def put_many(self, entries: List[Tuple[str, ProbeTuple, float]]):
+        """Stores (token_id, result, expires_at) entries in one transaction."""
+        rows = [
+            (token_id, status.value, reason.value, json.dumps(meta or {}), expires_at)
+            for token_id, (status, reason, meta), expires_at in entries
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO clob_probe_cache (token_id, status, reason, meta, expires_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            self.writes += len(rows)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM clob_probe_cache").fetchone()[0]
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            "writes": self.writes,
+            "purged_expired": self.purged,
+            "entries": len(self),
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,126 @@
+"""Bounded, rate-limited publishing of shadow artifacts.
+
+Runners used to keep every journal row in a list and rewrite all three
+artifact files on every tick. ShadowArtifactPublisher keeps only the newest
+SHADOW_JOURNAL_MAX_ROWS rows in a ring buffer and calls write_shadow_artifacts
+on a cadence, or immediately when the headline decision changes. Writes still
+go through write_shadow_artifacts, so the atomic-write and sanitization
+guarantees of the Shadow Artifacts Contract are unchanged.
+
+SHADOW_ARTIFACTS_MIN_INTERVAL_SEC sets the cadence (default 5.0, 0 = every tick).
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from .shadow_artifacts import get_max_rows, write_shadow_artifacts
+
+DEFAULT_MIN_INTERVAL_SEC = 5.0
+
+# Summary fields whose change triggers an immediate publish.
+CHANGE_FIELDS: Tuple[str, ...] = ("market", "decision", "reason", "subreason")
+
+
+def _min_interval_from_env() -> float:
+    raw = os.getenv("SHADOW_ARTIFACTS_MIN_INTERVAL_SEC")
+    if raw is None or raw == "":
+        return DEFAULT_MIN_INTERVAL_SEC
+    try:
+        value = float(raw)
+    except ValueError:
+        raise ValueError("SHADOW_ARTIFACTS_MIN_INTERVAL_SEC must be a non-negative number")
+    if value < 0:
+        raise ValueError("SHADOW_ARTIFACTS_MIN_INTERVAL_SEC must be a non-negative number")
+    return value
+
+
+MIN_INTERVAL_SEC = _min_interval_from_env()
+
+
+class ShadowArtifactPublisher:
+    """Ring buffer of journal rows plus a publish-on-cadence-or-change policy."""
+
+    def __init__(
+        self,
+        *,
+        max_rows: Optional[int] = None,
+        min_interval_sec: Optional[float] = None,
+        artifacts_dir: Optional[str] = None,
+        header_cols: Optional[List[str]] = None,
+    ) -> None:
+        self.max_rows = max_rows if max_rows is not None else get_max_rows()
+        self.min_interval_sec = (
+            min_interval_sec if min_interval_sec is not None else MIN_INTERVAL_SEC
+        )
+        self.artifacts_dir = artifacts_dir
+        self.header_cols = header_cols
+        self._rows: Deque[Dict[str, Any]] = deque(maxlen=max(1, self.max_rows))
+        self.total_rows = 0
+        self._rows_at_publish = 0
+        self._last_publish: Optional[float] = None
+        self._last_key: Optional[Tuple[Any, ...]] = None
+        self.publishes = 0
+        self.skipped = 0
+
+    def append(self, row: Dict[str, Any]) -> None:
+        self._rows.append(row)
+        self.total_rows += 1
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """Snapshot of the buffered rows, oldest first."""
+        return list(self._rows)
+
+    def due(self, summary: Dict[str, Any], now: Optional[float] = None) -> bool:
+        """True if the artifacts should be rewritten for this summary."""
+        if self._last_publish is None:
+            return True
+        if tuple(summary.get(f) for f in CHANGE_FIELDS) != self._last_key:
+            return True
+        if self.total_rows == self._rows_at_publish:
+            return False
+        now = time.monotonic() if now is None else now
+        return now - self._last_publish >= self.min_interval_sec
+
+    def mark_published(self, summary: Dict[str, Any], now: Optional[float] = None) -> None:
+        self._last_publish = time.monotonic() if now is None else now
+        self._last_key = tuple(summary.get(f) for f in CHANGE_FIELDS)
+        self._rows_at_publish = self.total_rows
+        self.publishes += 1
+
+    def publish(
+        self,
+        summary: Dict[str, Any],
+        health: Dict[str, Any],
+        *,
+        force: bool = False,
+        now: Optional[float] = None,
+        submit: Optional[Callable[..., Any]] = None,
+    ) -> bool:
+        """Write artifacts if due (or forced). Returns True if a write was issued.
+
+        With `submit` (e.g. AsyncWriter.submit) the write is handed off with a
+        snapshot of the ring taken on the calling thread. Without it, exceptions
+        from write_shadow_artifacts propagate and the publish is not marked done,
+        so the next call retries.
+        """
+        if not force and not self.due(summary, now):
+            self.skipped += 1
+            return False
+        (submit or _call)(
+            write_shadow_artifacts,
+            summary,
+            self.rows(),
+            health,
+            artifacts_dir=self.artifacts_dir,
+            header_cols=self.header_cols,
+        )
+        self.mark_published(summary, now)
+        return True
+
+
+def _call(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    return fn(*args, **kwargs)
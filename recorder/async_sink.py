@@ -0,0 +1,253 @@
+"""Background writer thread for journal and artifact I/O.
+
+The decision loop hands write jobs to a bounded queue drained by a single
+daemon thread, so a slow disk no longer stretches tick latency. What happens
+when the queue is full is governed by an overflow policy:
+
+- block:       the producer waits for space (no data loss)
+- drop_oldest: the oldest queued job is discarded (good for snapshots)
+- drop_newest: the new job is discarded
+
+stats() exposes queue depth, drop count and write latency for health.json.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import threading
+import time
+import weakref
+from collections import deque
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+from .shadow_artifacts import sanitize_text
+from .trade_journal import TradeJournal
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUEUE_MAX = 1000
+
+
+class OverflowPolicy(Enum):
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+
+
+def _overflow_from_env(name: str, default: OverflowPolicy) -> OverflowPolicy:
+    raw = os.getenv(name)
+    if raw is None or raw == "":
+        return default
+    try:
+        return OverflowPolicy(raw.strip().lower())
+    except ValueError:
+        allowed = ", ".join(item.value for item in OverflowPolicy)
+        raise ValueError(f"{name} must be one of: {allowed}")
+
+
+def _queue_max_from_env(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if raw is None or raw == "":
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        raise ValueError(f"{name} must be a positive integer")
+    if value <= 0:
+        raise ValueError(f"{name} must be a positive integer")
+    return value
+
+
+# Journal rows must not be lost, so the journal queue blocks by default.
+# Artifacts are full snapshots: only the newest matters, so keep a short
+# queue and discard stale snapshots.
+JOURNAL_QUEUE_MAX = _queue_max_from_env("SHADOW_ASYNC_JOURNAL_QUEUE_MAX", DEFAULT_QUEUE_MAX)
+JOURNAL_OVERFLOW = _overflow_from_env("SHADOW_ASYNC_JOURNAL_OVERFLOW", OverflowPolicy.BLOCK)
+ARTIFACTS_QUEUE_MAX = _queue_max_from_env("SHADOW_ASYNC_ARTIFACTS_QUEUE_MAX", 2)
+ARTIFACTS_OVERFLOW = _overflow_from_env("SHADOW_ASYNC_ARTIFACTS_OVERFLOW", OverflowPolicy.DROP_OLDEST)
+
+
+def _close_if_alive(ref: "weakref.ReferenceType[AsyncWriter]") -> None:
+    writer = ref()
+    if writer is not None:
+        writer.close()
+
+
+_Job = Tuple[Callable[..., Any], tuple, dict]
+
+
+class AsyncWriter:
+    """Single-threaded bounded job queue with backpressure metrics."""
+
+    def __init__(
+        self,
+        *,
+        max_queue: int = DEFAULT_QUEUE_MAX,
+        overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+        name: str = "async-writer",
+    ) -> None:
+        if max_queue <= 0:
+            raise ValueError("max_queue must be positive")
+        self.max_queue = max_queue
+        self.overflow = overflow
+        self.name = name
+        self._jobs: Deque[_Job] = deque()
+        self._cond = threading.Condition()
+        self._busy = False
+        self._closed = False
+
+        self.submitted = 0
+        self.written = 0
+        self.dropped = 0
+        self.errors = 0
+        self.last_error: Optional[str] = None
+        self.last_ok_at: Optional[float] = None
+        self._latency_last_ms = 0.0
+        self._latency_max_ms = 0.0
+        self._latency_total_ms = 0.0
+
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+        # Registered after any journal this writer wraps, so it drains first.
+        atexit.register(_close_if_alive, weakref.ref(self))
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> bool:
+        """Queue a write job. Returns False if the job itself was dropped."""
+        with self._cond:
+            if self._closed:
+                raise RuntimeError(f"{self.name} is closed")
+            self.submitted += 1
+            if len(self._jobs) >= self.max_queue:
+                if self.overflow == OverflowPolicy.DROP_NEWEST:
+                    self.dropped += 1
+                    return False
+                if self.overflow == OverflowPolicy.DROP_OLDEST:
+                    self._jobs.popleft()
+                    self.dropped += 1
+                else:
+                    while len(self._jobs) >= self.max_queue and not self._closed:
+                        self._cond.wait()
+                    if self._closed:
+                        raise RuntimeError(f"{self.name} is closed")
+            self._jobs.append((fn, args, kwargs))
+            self._cond.notify_all()
+            return True
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._jobs and not self._closed:
+                    self._cond.wait()
+                if not self._jobs:
+                    return
+                fn, args, kwargs = self._jobs.popleft()
+                self._busy = True
+                self._cond.notify_all()
+
+            t0 = time.perf_counter()
+            error: Optional[Exception] = None
+            try:
+                fn(*args, **kwargs)
+            except Exception as exc:
+                error = exc
+                logger.warning(f"{self.name}: write failed: {exc}")
+            elapsed_ms = (time.perf_counter() - t0) * 1000.0
+
+            with self._cond:
+                if error is not None:
+                    self.errors += 1
+                    self.last_error = str(error)
+                else:
+                    self.written += 1
+                    self.last_ok_at = time.time()
+                self._latency_last_ms = elapsed_ms
+                self._latency_max_ms = max(self._latency_max_ms, elapsed_ms)
+                self._latency_total_ms += elapsed_ms
+                self._busy = False
+                self._cond.notify_all()
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued job has run. Returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._jobs or self._busy:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def pending(self) -> int:
+        """Jobs queued or running."""
+        with self._cond:
+            return len(self._jobs) + (1 if self._busy else 0)
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """Drain outstanding jobs and stop the writer thread.
+
+        Returns False if the thread was still draining when `timeout` ran
+        out; it keeps running the remaining jobs in the background.
+        """
+        with self._cond:
+            if not self._closed:
+                self._closed = True
+                self._cond.notify_all()
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.warning(f"{self.name}: close timed out with {self.pending} jobs pending")
+            return False
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            finished = self.written + self.errors
+            return {
+                "overflow_policy": self.overflow.value,
+                "queue_depth": len(self._jobs),
+                "queue_max": self.max_queue,
+                "submitted": self.submitted,
+                "written": self.written,
+                "dropped": self.dropped,
+                "errors": self.errors,
+                "last_error": sanitize_text(self.last_error),
+                "write_latency_ms_last": round(self._latency_last_ms, 3),
+                "write_latency_ms_max": round(self._latency_max_ms, 3),
+                "write_latency_ms_avg": (
+                    round(self._latency_total_ms / finished, 3) if finished else 0.0
+                ),
+            }
+
+
+class AsyncTradeJournal:
+    """TradeJournal front-end whose writes run on an AsyncWriter thread."""
+
+    def __init__(self, journal: TradeJournal, writer: AsyncWriter) -> None:
+        self.journal = journal
+        self.writer = writer
+
+    @property
+    def path(self) -> str:
+        return self.journal.path
+
+    def record_decision(self, row: Dict[str, object]) -> bool:
+        # Copy: the caller may keep mutating its row dict.
+        return self.writer.submit(self.journal.record_decision, dict(row))
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """Drain queued rows, then close the journal.
+
+        If the drain times out the journal is left open, since the writer
+        thread is still appending to it; returns False in that case.
+        """
+        if not self.writer.close(timeout):
+            return False
+        self.journal.close()
+        return True
@@ -0,0 +1,379 @@
+"""Fixed-layout binary decision journal with an mmap/NumPy reader.
+
+File layout:
+
+    [0, 4096)   header: b"SBJ2", u32 JSON length, JSON {format, schema_version,
+                columns: [[name, kind, dtype], ...], record_size}, zero padding
+    [4096, ...) records: one packed little-endian struct per decision row
+
+Every JOURNAL_COLUMNS column is stored: ints as int64 (null = INT64_MIN),
+floats as float64 (null = NaN), bools as int8 (null = -1). String columns
+come in two encodings, told apart by their dtype in the header:
+
+- "<u4": code into a dictionary kept in `<path>.dict.json` (code 0 = "").
+  Used only for the low-cardinality DICTIONARY_COLUMNS (venue, action,
+  reason); the dictionary is rewritten atomically whenever a flush adds new
+  strings, before the records that use them are written.
+- "<u8": 1 + byte offset into the append-only side file `<path>.strings`,
+  which holds u32-length-prefixed UTF-8 strings (0 = ""). Unbounded columns
+  such as market_id or official_err use this, so a flush only appends the
+  strings it introduces. Strings are appended before the records that use
+  them; recently written values are reused rather than appended again.
+
+binary_journal_v1 files (magic b"SBJ1", every string column
+dictionary-encoded) are still read and appended to in their own layout. The
+magic changed with the layout so that a v1-only reader rejects v2 files
+instead of misparsing them; a header whose format does not match its magic
+is rejected too.
+
+BinaryJournalReader memory-maps the records as a NumPy structured array, so
+columns are views with no parsing; to_csv() converts back to a journal_v1
+CSV with the canonical header, writing bools as "true"/"false" like the CSV
+TradeJournal rows. Codes the dictionary or side file cannot
+resolve (e.g. a missing `.dict.json`) decode as "".
+"""
+
+from __future__ import annotations
+
+import atexit
+import csv
+import json
+import math
+import os
+import struct
+import tempfile
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .journal_schema import (
+    JOURNAL_COLUMNS,
+    KIND_BOOL,
+    KIND_FLOAT,
+    KIND_INT,
+    KIND_STR,
+    SCHEMA_VERSION,
+    column_converter,
+    column_kind,
+)
+
+FORMAT_VERSION = "binary_journal_v2"
+READABLE_FORMATS = frozenset({"binary_journal_v1", FORMAT_VERSION})
+MAGIC = b"SBJ2"
+# Magic -> the only format a header with that magic may declare.
+_MAGIC_FORMATS = {b"SBJ1": "binary_journal_v1", MAGIC: FORMAT_VERSION}
+HEADER_SIZE = 4096
+DEFAULT_BATCH_ROWS = 256
+
+INT_NULL = np.iinfo(np.int64).min
+BOOL_NULL = -1
+
+# Low-cardinality string columns worth a dictionary; other strings go to the side file.
+DICTIONARY_COLUMNS = frozenset({"venue", "action", "reason"})
+# Distinct recent values per inline column whose side-file offsets are reused.
+INLINE_REUSE_ENTRIES = 1024
+
+STR_DICT_DTYPE = "<u4"
+STR_INLINE_DTYPE = "<u8"
+_DTYPES = {KIND_INT: "<i8", KIND_FLOAT: "<f8", KIND_BOOL: "i1"}
+_LENGTH = struct.Struct("<I")
+# CSV spelling of bools, as TradeJournal rows write them (str(flag).lower()).
+_CSV_BOOLS = ("false", "true")
+
+
+def dictionary_path_for(path: str) -> str:
+    return path + ".dict.json"
+
+
+def strings_path_for(path: str) -> str:
+    return path + ".strings"
+
+
+def _column_dtype(col: str) -> str:
+    kind = column_kind(col)
+    if kind != KIND_STR:
+        return _DTYPES[kind]
+    return STR_DICT_DTYPE if col in DICTIONARY_COLUMNS else STR_INLINE_DTYPE
+
+
+def _layout(columns: List[str]) -> List[Tuple[str, str, str]]:
+    return [(col, column_kind(col), _column_dtype(col)) for col in columns]
+
+
+def _dtype(layout: List[Tuple[str, str, str]]) -> np.dtype:
+    return np.dtype([(name, dtype) for name, _, dtype in layout])
+
+
+def _encode_header(layout: List[Tuple[str, str, str]]) -> bytes:
+    meta = {
+        "format": FORMAT_VERSION,
+        "schema_version": SCHEMA_VERSION,
+        "columns": [list(entry) for entry in layout],
+        "record_size": _dtype(layout).itemsize,
+    }
+    body = json.dumps(meta, separators=(",", ":")).encode("utf-8")
+    header = MAGIC + struct.pack("<I", len(body)) + body
+    if len(header) > HEADER_SIZE:
+        raise ValueError("binary journal header exceeds 4096 bytes")
+    return header.ljust(HEADER_SIZE, b"\0")
+
+
+def read_header(path: str) -> Dict[str, Any]:
+    with open(path, "rb") as f:
+        raw = f.read(HEADER_SIZE)
+    if len(raw) < 8 or raw[:4] not in _MAGIC_FORMATS:
+        raise ValueError(f"{path} is not a binary journal")
+    (length,) = struct.unpack("<I", raw[4:8])
+    meta = json.loads(raw[8:8 + length].decode("utf-8"))
+    if meta.get("format") not in READABLE_FORMATS:
+        raise ValueError(f"Unsupported binary journal format: {meta.get('format')}")
+    if meta["format"] != _MAGIC_FORMATS[raw[:4]]:
+        raise ValueError(f"{path}: header format {meta['format']} does not match its magic")
+    return meta
+
+
+def _load_dictionary(path: str) -> Dict[str, List[str]]:
+    try:
+        with open(dictionary_path_for(path), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def _write_dictionary(path: str, dictionary: Dict[str, List[str]]) -> None:
+    target = dictionary_path_for(path)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(target) or ".", prefix=f".{os.path.basename(target)}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(dictionary, f, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, target)
+    except Exception:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _close_if_alive(ref: "weakref.ReferenceType[BinaryJournal]") -> None:
+    journal = ref()
+    if journal is not None:
+        journal.close()
+
+
+class BinaryJournal:
+    """Append-only binary journal. Same record_decision API as TradeJournal."""
+
+    def __init__(self, path: str, *, batch_rows: int = DEFAULT_BATCH_ROWS) -> None:
+        self.path = path
+        self.batch_rows = max(1, batch_rows)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            meta = read_header(path)
+            layout = [tuple(entry) for entry in meta["columns"]]
+            if [name for name, _, _ in layout] != JOURNAL_COLUMNS:
+                raise ValueError(f"{path} was written with a different column set")
+            self._handle = open(path, "r+b")
+            # Drop a trailing partial record left by a crash.
+            usable = (os.path.getsize(path) - HEADER_SIZE) // meta["record_size"]
+            self._handle.truncate(HEADER_SIZE + usable * meta["record_size"])
+            self._handle.seek(0, os.SEEK_END)
+        else:
+            layout = _layout(JOURNAL_COLUMNS)
+            self._handle = open(path, "wb")
+            self._handle.write(_encode_header(layout))
+            self._handle.flush()
+
+        self.dtype = _dtype(layout)
+        self._kinds = [kind for _, kind, _ in layout]
+        self._dtypes = [dtype for _, _, dtype in layout]
+        self._converters = [column_converter(col) for col in JOURNAL_COLUMNS]
+        self._dictionary: Dict[str, List[str]] = _load_dictionary(path)
+        self._codes: Dict[str, Dict[str, int]] = {}
+        self._offsets: Dict[str, Dict[str, int]] = {}
+        for col, kind, dtype in layout:
+            if kind != KIND_STR:
+                continue
+            if dtype == STR_DICT_DTYPE:
+                values = self._dictionary.setdefault(col, [""])
+                self._codes[col] = {value: code for code, value in enumerate(values)}
+            else:
+                self._offsets[col] = {}
+        self._dictionary_dirty = bool(self._codes) and not os.path.exists(dictionary_path_for(path))
+        self._strings_handle = None
+        self._strings_size = 0
+        if self._offsets:
+            self._strings_handle = open(strings_path_for(path), "ab")
+            self._strings_size = self._strings_handle.seek(0, os.SEEK_END)
+        self._strings_pending = bytearray()
+        self._pending: List[Tuple[Any, ...]] = []
+        self.rows_written = 0
+        atexit.register(_close_if_alive, weakref.ref(self))
+
+    @property
+    def closed(self) -> bool:
+        return self._handle.closed
+
+    def _inline(self, col: str, text: str) -> int:
+        if not text:
+            return 0
+        offsets = self._offsets[col]
+        ref = offsets.get(text)
+        if ref is None:
+            data = text.encode("utf-8")
+            ref = self._strings_size + len(self._strings_pending) + 1
+            self._strings_pending += _LENGTH.pack(len(data))
+            self._strings_pending += data
+            if len(offsets) >= INLINE_REUSE_ENTRIES:
+                offsets.clear()
+            offsets[text] = ref
+        return ref
+
+    def _encode(self, col: str, kind: str, dtype: str, value: Any) -> Any:
+        if kind == KIND_STR:
+            text = value or ""
+            if dtype != STR_DICT_DTYPE:
+                return self._inline(col, text)
+            codes = self._codes[col]
+            code = codes.get(text)
+            if code is None:
+                code = len(codes)
+                codes[text] = code
+                self._dictionary[col].append(text)
+                self._dictionary_dirty = True
+            return code
+        if kind == KIND_INT:
+            return INT_NULL if value is None else value
+        if kind == KIND_FLOAT:
+            return math.nan if value is None else value
+        return BOOL_NULL if value is None else int(value)
+
+    def record_decision(self, row: Dict[str, object]) -> None:
+        if self._handle.closed:
+            raise ValueError("binary journal is closed")
+        self._pending.append(tuple(
+            self._encode(col, kind, dtype, convert(row.get(col)))
+            for col, kind, dtype, convert in zip(JOURNAL_COLUMNS, self._kinds, self._dtypes, self._converters)
+        ))
+        if len(self._pending) >= self.batch_rows:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._handle.closed:
+            return
+        # Codes and offsets must be resolvable before records referencing them land.
+        if self._dictionary_dirty:
+            _write_dictionary(self.path, self._dictionary)
+            self._dictionary_dirty = False
+        if self._strings_pending:
+            self._strings_handle.write(self._strings_pending)
+            self._strings_handle.flush()
+            self._strings_size += len(self._strings_pending)
+            self._strings_pending = bytearray()
+        if self._pending:
+            self._handle.write(np.array(self._pending, dtype=self.dtype).tobytes())
+            self.rows_written += len(self._pending)
+            self._pending = []
+        self._handle.flush()
+
+    def close(self) -> None:
+        if self._handle.closed:
+            return
+        self.flush()
+        self._handle.close()
+        if self._strings_handle is not None:
+            self._strings_handle.close()
+
+    def __enter__(self) -> "BinaryJournal":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class BinaryJournalReader:
+    """Zero-copy column access to a binary journal."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.meta = read_header(path)
+        layout = [tuple(entry) for entry in self.meta["columns"]]
+        self.dtype = _dtype(layout)
+        if self.dtype.itemsize != self.meta["record_size"]:
+            raise ValueError("binary journal record_size does not match its column layout")
+        self.columns = [name for name, _, _ in layout]
+        self.kinds = {name: kind for name, kind, _ in layout}
+        count = (os.path.getsize(path) - HEADER_SIZE) // self.dtype.itemsize
+        if count > 0:
+            self.records = np.memmap(path, dtype=self.dtype, mode="r", offset=HEADER_SIZE, shape=(count,))
+        else:
+            self.records = np.zeros(0, dtype=self.dtype)
+        self.dtypes = {name: dtype for name, _, dtype in layout}
+        self.dictionary = _load_dictionary(path)
+        self._side: Optional[bytes] = None
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def column(self, name: str) -> np.ndarray:
+        """Raw column view (string columns are dictionary codes or side-file offsets)."""
+        return self.records[name]
+
+    def _side_strings(self) -> bytes:
+        if self._side is None:
+            try:
+                with open(strings_path_for(self.path), "rb") as f:
+                    self._side = f.read()
+            except FileNotFoundError:
+                self._side = b""
+        return self._side
+
+    def _decode_inline(self, ref: int) -> str:
+        side = self._side_strings()
+        start = ref - 1 + _LENGTH.size
+        if ref <= 0 or start > len(side):
+            return ""
+        (length,) = _LENGTH.unpack_from(side, ref - 1)
+        return side[start:start + length].decode("utf-8", errors="replace")
+
+    def strings(self, name: str) -> np.ndarray:
+        """Decoded string column as an object array."""
+        refs = self.records[name]
+        out = np.full(len(refs), "", dtype=object)
+        if self.dtypes[name] == STR_DICT_DTYPE:
+            values = np.array(self.dictionary.get(name, [""]), dtype=object)
+            known = refs < len(values)
+            out[known] = values[refs[known]]
+            return out
+        unique, inverse = np.unique(refs, return_inverse=True)
+        decoded = np.empty(len(unique), dtype=object)
+        decoded[:] = [self._decode_inline(ref) for ref in unique.tolist()]
+        return decoded[inverse]
+
+    def _csv_values(self, name: str) -> List[str]:
+        kind = self.kinds[name]
+        data = self.records[name]
+        if kind == KIND_STR:
+            return list(self.strings(name))
+        if kind == KIND_INT:
+            return ["" if v == INT_NULL else str(v) for v in data.tolist()]
+        if kind == KIND_FLOAT:
+            return ["" if math.isnan(v) else repr(v) for v in data.tolist()]
+        return ["" if v == BOOL_NULL else _CSV_BOOLS[bool(v)] for v in data.tolist()]
+
+    def to_csv(self, out_path: str, header_cols: Optional[List[str]] = None) -> int:
+        """Write a journal_v1 CSV (canonical column order). Returns row count."""
+        cols = header_cols if header_cols is not None else JOURNAL_COLUMNS
+        empty = [""] * len(self)
+        values = [self._csv_values(c) if c in self.kinds else empty for c in cols]
+        with open(out_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(cols)
+            writer.writerows(zip(*values))
+        return len(self)
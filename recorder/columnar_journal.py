@@ -0,0 +1,270 @@
+"""Typed columnar decision journal (Arrow IPC or Parquet) for analytics.
+
+Rows in the JOURNAL_COLUMNS schema are buffered column-wise, converted to
+typed record batches every `batch_rows` rows and appended to the current
+file. Files rotate when the row timestamp crosses an hour boundary or the
+file reaches `rotate_mb`. Names are `<prefix>_<YYYYMMDDHH>_<seq>.<ext>`.
+
+Formats:
+- arrow:   Arrow IPC stream (.arrows), zstd-compressed buffers. Every flushed
+           batch is readable immediately, including from a live file.
+- parquet: Parquet (.parquet), zstd. A file is readable once rotated/closed.
+
+Defaults come from JOURNAL_COLUMNAR_FORMAT, JOURNAL_COLUMNAR_BATCH_ROWS and
+JOURNAL_COLUMNAR_ROTATE_MB. pyarrow is an optional dependency: importing this
+module works without it, constructing a writer or reading does not.
+"""
+
+from __future__ import annotations
+
+import atexit
+import glob
+import os
+import time
+import weakref
+from typing import Any, Dict, List, Optional, Sequence
+
+from .journal_schema import (
+    JOURNAL_COLUMNS,
+    KIND_BOOL,
+    KIND_FLOAT,
+    KIND_INT,
+    KIND_STR,
+    column_converter,
+    column_kind,
+    to_int,
+)
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - exercised only without pyarrow
+    pa = None  # type: ignore
+    pa_ipc = None  # type: ignore
+    pq = None  # type: ignore
+
+FORMAT_ARROW = "arrow"
+FORMAT_PARQUET = "parquet"
+FORMATS = (FORMAT_ARROW, FORMAT_PARQUET)
+EXTENSIONS = {FORMAT_ARROW: ".arrows", FORMAT_PARQUET: ".parquet"}
+
+DEFAULT_BATCH_ROWS = 1000
+DEFAULT_ROTATE_MB = 64.0
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError(
+            "pyarrow is required for the columnar journal (pip install pyarrow)"
+        )
+
+
+def journal_arrow_schema() -> "pa.Schema":
+    """Arrow schema for JOURNAL_COLUMNS; unlisted columns are strings."""
+    _require_pyarrow()
+    fields = []
+    types = {KIND_INT: pa.int64(), KIND_FLOAT: pa.float64(), KIND_BOOL: pa.bool_(), KIND_STR: pa.string()}
+    for col in JOURNAL_COLUMNS:
+        fields.append(pa.field(col, types[column_kind(col)]))
+    return pa.schema(fields)
+
+
+def _env_format() -> str:
+    value = os.getenv("JOURNAL_COLUMNAR_FORMAT", FORMAT_ARROW).strip().lower()
+    if value not in FORMATS:
+        raise ValueError(f"JOURNAL_COLUMNAR_FORMAT must be one of {FORMATS}")
+    return value
+
+
+def _env_positive(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if raw is None or raw == "":
+        return default
+    try:
+        value = float(raw)
+    except ValueError:
+        raise ValueError(f"{name} must be a positive number")
+    if value <= 0:
+        raise ValueError(f"{name} must be a positive number")
+    return value
+
+
+def _close_if_alive(ref: "weakref.ReferenceType[ColumnarJournal]") -> None:
+    journal = ref()
+    if journal is not None:
+        journal.close()
+
+
+class ColumnarJournal:
+    """Append-only, rotating, typed journal. Same record_decision API as TradeJournal."""
+
+    def __init__(
+        self,
+        directory: str,
+        *,
+        fmt: Optional[str] = None,
+        batch_rows: Optional[int] = None,
+        rotate_mb: Optional[float] = None,
+        prefix: str = "journal",
+    ) -> None:
+        _require_pyarrow()
+        self.directory = directory
+        self.fmt = fmt if fmt is not None else _env_format()
+        if self.fmt not in FORMATS:
+            raise ValueError(f"fmt must be one of {FORMATS}")
+        if batch_rows is None:
+            batch_rows = int(_env_positive("JOURNAL_COLUMNAR_BATCH_ROWS", DEFAULT_BATCH_ROWS))
+        self.batch_rows = max(1, batch_rows)
+        if rotate_mb is None:
+            rotate_mb = _env_positive("JOURNAL_COLUMNAR_ROTATE_MB", DEFAULT_ROTATE_MB)
+        self.rotate_bytes = int(rotate_mb * 1024 * 1024)
+        self.prefix = prefix
+
+        self.schema = journal_arrow_schema()
+        self._converters = [column_converter(col) for col in JOURNAL_COLUMNS]
+        self._columns: List[List[Any]] = [[] for _ in JOURNAL_COLUMNS]
+        self._buffered = 0
+        self._hour: Optional[str] = None
+        self._seq = 0
+        self._sink = None
+        self._writer = None
+        self._path: Optional[str] = None
+        self._closed = False
+        self.rows_written = 0
+        self.files: List[str] = []
+
+        os.makedirs(directory, exist_ok=True)
+        atexit.register(_close_if_alive, weakref.ref(self))
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def current_path(self) -> Optional[str]:
+        return self._path
+
+    def record_decision(self, row: Dict[str, object]) -> None:
+        if self._closed:
+            raise ValueError("columnar journal is closed")
+        hour = self._hour_of(row)
+        if hour != self._hour:
+            self.flush()
+            self._close_file()
+            self._hour = hour
+        for values, col, convert in zip(self._columns, JOURNAL_COLUMNS, self._converters):
+            values.append(convert(row.get(col)))
+        self._buffered += 1
+        if self._buffered >= self.batch_rows:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered rows as one record batch."""
+        if not self._buffered:
+            return
+        batch = pa.RecordBatch.from_arrays(
+            [pa.array(values, type=field.type) for values, field in zip(self._columns, self.schema)],
+            schema=self.schema,
+        )
+        if self._writer is None:
+            self._open_file()
+        self._writer.write_batch(batch)
+        self.rows_written += self._buffered
+        self._columns = [[] for _ in JOURNAL_COLUMNS]
+        self._buffered = 0
+        if self.fmt == FORMAT_ARROW:
+            self._sink.flush()
+        if self._file_size() >= self.rotate_bytes:
+            self._close_file()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self.flush()
+        self._close_file()
+        self._closed = True
+
+    def __enter__(self) -> "ColumnarJournal":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _hour_of(self, row: Dict[str, object]) -> str:
+        ts_ms = to_int(row.get("ts"))
+        ts = ts_ms / 1000.0 if ts_ms is not None else time.time()
+        return time.strftime("%Y%m%d%H", time.gmtime(ts))
+
+    def _open_file(self) -> None:
+        hour = self._hour or time.strftime("%Y%m%d%H", time.gmtime())
+        while True:
+            self._seq += 1
+            path = os.path.join(
+                self.directory, f"{self.prefix}_{hour}_{self._seq:04d}{EXTENSIONS[self.fmt]}"
+            )
+            if not os.path.exists(path):
+                break
+        if self.fmt == FORMAT_ARROW:
+            self._sink = pa.OSFile(path, "wb")
+            self._writer = pa_ipc.new_stream(
+                self._sink, self.schema, options=pa_ipc.IpcWriteOptions(compression="zstd")
+            )
+        else:
+            self._writer = pq.ParquetWriter(path, self.schema, compression="zstd")
+        self._path = path
+        self.files.append(path)
+
+    def _file_size(self) -> int:
+        if self._sink is not None:
+            return self._sink.tell()
+        if self._path is not None and os.path.exists(self._path):
+            return os.path.getsize(self._path)
+        return 0
+
+    def _close_file(self) -> None:
+        if self._writer is None:
+            return
+        self._writer.close()
+        if self._sink is not None:
+            self._sink.close()
+        self._writer = None
+        self._sink = None
+        self._path = None
+
+
+def list_journal_files(path: str, prefix: str = "journal") -> List[str]:
+    """Journal files under `path` (a directory) in write order, or [path]."""
+    if not os.path.isdir(path):
+        return [path]
+    files = []
+    for ext in EXTENSIONS.values():
+        files.extend(glob.glob(os.path.join(path, f"{prefix}_*{ext}")))
+    return sorted(files)
+
+
+def read_columnar_journal(
+    path: str,
+    columns: Optional[Sequence[str]] = None,
+    *,
+    prefix: str = "journal",
+) -> "pa.Table":
+    """Load selected columns from one journal file or a directory of them.
+
+    Parquet reads only the requested column chunks. Arrow streams are
+    memory-mapped and projected after decoding.
+    """
+    _require_pyarrow()
+    cols = list(columns) if columns is not None else None
+    tables = []
+    for file_path in list_journal_files(path, prefix):
+        if file_path.endswith(EXTENSIONS[FORMAT_PARQUET]):
+            tables.append(pq.read_table(file_path, columns=cols))
+        else:
+            table = pa_ipc.open_stream(pa.memory_map(file_path, "r")).read_all()
+            tables.append(table.select(cols) if cols is not None else table)
+    if not tables:
+        schema = journal_arrow_schema()
+        if cols is not None:
+            schema = pa.schema([schema.field(c) for c in cols])
+        return schema.empty_table()
+    return pa.concat_tables(tables)
@@ -0,0 +1,232 @@
+"""Sparse byte-offset index over CSV decision journals.
+
+The sidecar `<journal>.idx` is JSON lines. After a header line, each line
+describes one block of up to `every` rows:
+
+    {"o": start_offset, "e": end_offset, "n": rows, "t0": min_ts, "t1": max_ts, "m": [market_ids]}
+
+TradeJournal appends an entry as each block completes (and for the partial
+block on close), so the index never points past flushed data. Queries seek
+straight to blocks whose ts range and market set can match, and scan any
+unindexed byte ranges (rows written before indexing, or the live tail).
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import os
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Set, Tuple
+
+INDEX_SCHEMA = "journal_sparse_index_v1"
+DEFAULT_EVERY = 1000
+
+
+def index_path_for(path: str) -> str:
+    return path + ".idx"
+
+
+def _ts_of(row: Dict[str, Any]) -> Optional[int]:
+    try:
+        return int(float(row.get("ts")))
+    except (TypeError, ValueError):
+        return None
+
+
+class JournalIndexWriter:
+    """Accumulates block metadata and appends index lines for one journal."""
+
+    def __init__(self, index_path: str, every: int = DEFAULT_EVERY) -> None:
+        self.every = max(1, every)
+        self.path = index_path
+        needs_header = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+        self._handle = open(self.path, "a", encoding="utf-8")
+        if needs_header:
+            self._handle.write(json.dumps({"schema": INDEX_SCHEMA, "every": self.every}) + "\n")
+            self._handle.flush()
+        self.block_rows = 0
+        self._start: Optional[int] = None
+        self._t0: Optional[int] = None
+        self._t1: Optional[int] = None
+        self._markets: Set[str] = set()
+
+    def start_block(self, offset: int) -> None:
+        self._start = offset
+        self.block_rows = 0
+        self._t0 = self._t1 = None
+        self._markets = set()
+
+    def observe(self, row: Dict[str, Any]) -> None:
+        self.block_rows += 1
+        ts = _ts_of(row)
+        if ts is not None:
+            self._t0 = ts if self._t0 is None else min(self._t0, ts)
+            self._t1 = ts if self._t1 is None else max(self._t1, ts)
+        market = row.get("market_id")
+        if market not in (None, ""):
+            self._markets.add(str(market))
+
+    def end_block(self, offset: int) -> None:
+        if self._start is None or self.block_rows == 0:
+            return
+        entry = {
+            "o": self._start,
+            "e": offset,
+            "n": self.block_rows,
+            "t0": self._t0,
+            "t1": self._t1,
+            "m": sorted(self._markets),
+        }
+        self._handle.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        self._handle.flush()
+        self._start = None
+        self.block_rows = 0
+
+    def close(self) -> None:
+        if not self._handle.closed:
+            self._handle.close()
+
+
+def load_index(journal_path: str) -> List[Dict[str, Any]]:
+    """Index entries sorted by start offset ([] if there is no index)."""
+    entries = []
+    try:
+        with open(index_path_for(journal_path), "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                entry = json.loads(line)
+                if "o" in entry:
+                    entries.append(entry)
+    except FileNotFoundError:
+        return []
+    entries.sort(key=lambda e: e["o"])
+    return entries
+
+
+def _iter_records(handle: BinaryIO, start: int, end: Optional[int]) -> Iterator[Tuple[List[str], int]]:
+    """CSV records between byte offsets, with the offset after each record.
+
+    csv.reader pulls physical lines lazily, so after each record the line
+    generator has consumed exactly that record's bytes (quoted newlines
+    included).
+    """
+    handle.seek(start)
+    pos = [start]
+
+    def lines() -> Iterator[str]:
+        while end is None or pos[0] < end:
+            raw = handle.readline()
+            if not raw:
+                return
+            pos[0] += len(raw)
+            yield raw.decode("utf-8")
+
+    for record in csv.reader(lines()):
+        yield record, pos[0]
+
+
+def _read_header(handle: BinaryIO) -> Tuple[List[str], int]:
+    for record, offset in _iter_records(handle, 0, None):
+        return record, offset
+    return [], 0
+
+
+def build_index(journal_path: str, every: int = DEFAULT_EVERY) -> int:
+    """Rebuild the sidecar index by scanning the journal. Returns entry count."""
+    tmp_path = index_path_for(journal_path) + ".tmp"
+    if os.path.exists(tmp_path):
+        os.unlink(tmp_path)
+    writer = JournalIndexWriter(tmp_path, every)
+    count = 0
+    with open(journal_path, "rb") as handle:
+        header, offset = _read_header(handle)
+        writer.start_block(offset)
+        for record, end in _iter_records(handle, offset, None):
+            writer.observe(dict(zip(header, record)))
+            if writer.block_rows >= writer.every:
+                writer.end_block(end)
+                count += 1
+                writer.start_block(end)
+        if writer.block_rows:
+            writer.end_block(handle.tell())
+            count += 1
+    writer.close()
+    os.replace(tmp_path, index_path_for(journal_path))
+    return count
+
+
+def _block_may_match(
+    entry: Dict[str, Any],
+    start_ts: Optional[int],
+    end_ts: Optional[int],
+    market_id: Optional[str],
+) -> bool:
+    t0, t1 = entry.get("t0"), entry.get("t1")
+    if start_ts is not None and t1 is not None and t1 < start_ts:
+        return False
+    if end_ts is not None and t0 is not None and t0 >= end_ts:
+        return False
+    if market_id is not None and market_id not in entry.get("m", ()):
+        return False
+    return True
+
+
+def query_journal(
+    journal_path: str,
+    *,
+    start_ts: Optional[int] = None,
+    end_ts: Optional[int] = None,
+    market_id: Optional[str] = None,
+    reason: Optional[str] = None,
+    action: Optional[str] = None,
+    stats: Optional[Dict[str, int]] = None,
+) -> Iterator[Dict[str, str]]:
+    """Stream rows with start_ts <= ts < end_ts matching the given filters.
+
+    If `stats` is given it is filled with blocks_scanned, blocks_skipped and
+    bytes_scanned.
+    """
+    counters = stats if stats is not None else {}
+    counters.update(blocks_scanned=0, blocks_skipped=0, bytes_scanned=0)
+    entries = load_index(journal_path)
+    with open(journal_path, "rb") as handle:
+        header, data_start = _read_header(handle)
+        size = os.fstat(handle.fileno()).st_size
+
+        ranges: List[Tuple[int, Optional[int]]] = []
+        pos = data_start
+        for entry in entries:
+            if entry["o"] < pos:
+                continue
+            if entry["o"] > pos:
+                ranges.append((pos, entry["o"]))
+            if _block_may_match(entry, start_ts, end_ts, market_id):
+                ranges.append((entry["o"], entry["e"]))
+                counters["blocks_scanned"] += 1
+            else:
+                counters["blocks_skipped"] += 1
+            pos = entry["e"]
+        if pos < size:
+            ranges.append((pos, None))
+
+        for begin, end in ranges:
+            counters["bytes_scanned"] += (end if end is not None else size) - begin
+            for record, _ in _iter_records(handle, begin, end):
+                row = dict(zip(header, record))
+                if market_id is not None and row.get("market_id") != market_id:
+                    continue
+                if reason is not None and row.get("reason") != reason:
+                    continue
+                if action is not None and row.get("action") != action:
+                    continue
+                if start_ts is not None or end_ts is not None:
+                    ts = _ts_of(row)
+                    if ts is None:
+                        continue
+                    if start_ts is not None and ts < start_ts:
+                        continue
+                    if end_ts is not None and ts >= end_ts:
+                        continue
+                yield row
@@ -9,7 +9,8 @@ STABILITY CONTRACT:
 - This is the v1 schema; additive-only changes permitted
 """
 
-from typing import Dict, Any, List
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional
 
 SCHEMA_VERSION = "journal_v1"
 
@@ -80,6 +81,116 @@ JOURNAL_COLUMNS: List[str] = [
 ]
 
 
+# Column storage kinds for typed sinks. Columns not listed are strings.
+KIND_INT = "int"
+KIND_FLOAT = "float"
+KIND_BOOL = "bool"
+KIND_STR = "str"
+
+INT_COLUMNS = frozenset({
+    "ts",
+    "now",
+    "market_end_ts",
+    "official_age_ms",
+    "pm_book_age_ms",
+    "rules_end_ts",
+    "open_markets",
+})
+FLOAT_COLUMNS = frozenset({
+    "official_mid",
+    "pm_yes_bid",
+    "pm_yes_ask",
+    "pm_no_bid",
+    "pm_no_ask",
+    "implied_yes",
+    "implied_no",
+    "fair_up_prob",
+    "edge_yes",
+    "edge_no",
+    "edge_gross_bps",
+    "edge_net_bps",
+    "spread_bps",
+    "depth_total",
+    "daily_pnl",
+    "daily_loss",
+    "total_loss",
+    "signal_book_arbitrage_edge_bps",
+    "signal_book_arbitrage_confidence",
+    "signal_book_staleness_edge_bps",
+    "signal_book_staleness_confidence",
+    "arb_cost_cents",
+    "arb_edge_cents",
+})
+BOOL_COLUMNS = frozenset({"official_ok", "book_ok", "kill_switch"})
+
+
+def to_int(value: Any) -> Optional[int]:
+    if type(value) is int:
+        return value
+    if value is None or value == "":
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        try:
+            return int(float(value))
+        except (TypeError, ValueError):
+            return None
+
+
+def to_float(value: Any) -> Optional[float]:
+    if type(value) is float:
+        return value
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def to_bool(value: Any) -> Optional[bool]:
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes")
+    return bool(value)
+
+
+def to_str(value: Any) -> Optional[str]:
+    if type(value) is str:
+        return value
+    if value is None:
+        return None
+    if isinstance(value, Enum):
+        value = value.value
+    return str(value)
+
+
+_CONVERTERS: Dict[str, Callable[[Any], Any]] = {
+    KIND_INT: to_int,
+    KIND_FLOAT: to_float,
+    KIND_BOOL: to_bool,
+    KIND_STR: to_str,
+}
+
+
+def column_kind(col: str) -> str:
+    """Storage kind of a journal column for typed sinks (Arrow, SQLite)."""
+    if col in INT_COLUMNS:
+        return KIND_INT
+    if col in FLOAT_COLUMNS:
+        return KIND_FLOAT
+    if col in BOOL_COLUMNS:
+        return KIND_BOOL
+    return KIND_STR
+
+
+def column_converter(col: str) -> Callable[[Any], Any]:
+    """Value coercion for a column: "" and unparseable numbers become None."""
+    return _CONVERTERS[column_kind(col)]
+
+
 def normalize_row_for_csv(row: Dict[str, Any]) -> Dict[str, Any]:
     """Ensure all JOURNAL_COLUMNS are present with defaults for missing keys.
 
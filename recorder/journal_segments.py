@@ -0,0 +1,379 @@
+"""Size/time-rotated, compressed TradeJournal segments with a manifest.
+
+SegmentedTradeJournal writes to the usual journal path (the active segment)
+through a TradeJournal. When the active file reaches `rotate_mb` (checked at
+flush boundaries) or is older than `rotate_interval_sec`, it is renamed to
+
+    <stem>.<YYYYMMDDTHHMMSS>.<seq>.csv
+
+and handed to a background AsyncWriter thread that compresses it (gzip, or
+zstd when the optional `zstandard` package is installed), updates the
+manifest `<stem>.segments.json` and deletes the oldest closed segments
+while they exceed `retention_mb`.
+
+iter_journal_rows() streams rows across closed segments and the active file
+without decompressing to disk, skipping segments outside a ts range.
+
+Defaults: TRADE_JOURNAL_ROTATE_MB, TRADE_JOURNAL_ROTATE_INTERVAL_SEC,
+TRADE_JOURNAL_COMPRESSION (gzip | zstd | none), TRADE_JOURNAL_RETENTION_MB.
+open_trade_journal() returns a plain TradeJournal unless rotation is enabled.
+"""
+
+from __future__ import annotations
+
+import csv
+import gzip
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .async_sink import AsyncWriter, OverflowPolicy
+from .journal_index import index_path_for
+from .trade_journal import TradeJournal
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None  # type: ignore
+
+COMPRESSION_NONE = "none"
+COMPRESSION_GZIP = "gzip"
+COMPRESSION_ZSTD = "zstd"
+COMPRESSIONS = (COMPRESSION_NONE, COMPRESSION_GZIP, COMPRESSION_ZSTD)
+_SUFFIXES = {COMPRESSION_NONE: "", COMPRESSION_GZIP: ".gz", COMPRESSION_ZSTD: ".zst"}
+
+MANIFEST_SCHEMA = "journal_segments_v1"
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if raw is None or raw == "":
+        return default
+    try:
+        value = float(raw)
+    except ValueError:
+        raise ValueError(f"{name} must be a non-negative number")
+    if value < 0:
+        raise ValueError(f"{name} must be a non-negative number")
+    return value
+
+
+def _env_compression() -> str:
+    value = os.getenv("TRADE_JOURNAL_COMPRESSION", COMPRESSION_GZIP).strip().lower()
+    if value not in COMPRESSIONS:
+        raise ValueError(f"TRADE_JOURNAL_COMPRESSION must be one of {COMPRESSIONS}")
+    return value
+
+
+def manifest_path_for(path: str) -> str:
+    stem, _ = os.path.splitext(path)
+    return f"{stem}.segments.json"
+
+
+def load_manifest(path: str) -> Dict[str, Any]:
+    """Manifest for the journal at `path` (empty if none exists yet)."""
+    try:
+        with open(manifest_path_for(path), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {"schema_version": MANIFEST_SCHEMA, "segments": []}
+
+
+def _atomic_write_json(path: str, obj: Dict[str, Any]) -> None:
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(obj, f, sort_keys=True, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _compress_file(src: str, compression: str) -> str:
+    dst = src + _SUFFIXES[compression]
+    tmp = dst + ".tmp"
+    with open(src, "rb") as fin, open(tmp, "wb") as fout:
+        if compression == COMPRESSION_GZIP:
+            with gzip.GzipFile(fileobj=fout, mode="wb", compresslevel=6) as gz:
+                shutil.copyfileobj(fin, gz, 1 << 20)
+        else:
+            zstandard.ZstdCompressor(level=3).copy_stream(fin, fout)
+        fout.flush()
+        os.fsync(fout.fileno())
+    os.replace(tmp, dst)
+    os.unlink(src)
+    return dst
+
+
+def _scan_rows(path: str) -> Tuple[int, Optional[int], Optional[int]]:
+    """Row count and first/last `ts` of an existing journal file."""
+    rows = 0
+    first_ts = last_ts = None
+    try:
+        with open(path, "r", newline="") as f:
+            for row in csv.DictReader(f):
+                rows += 1
+                ts = _ts_of(row)
+                if ts is not None:
+                    if first_ts is None:
+                        first_ts = ts
+                    last_ts = ts
+    except OSError:
+        pass
+    return rows, first_ts, last_ts
+
+
+def _ts_of(row: Dict[str, Any]) -> Optional[int]:
+    try:
+        return int(float(row.get("ts")))
+    except (TypeError, ValueError):
+        return None
+
+
+class SegmentedTradeJournal:
+    """TradeJournal with rotation, background compression and retention."""
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        rotate_mb: Optional[float] = None,
+        rotate_interval_sec: Optional[float] = None,
+        compression: Optional[str] = None,
+        retention_mb: Optional[float] = None,
+        **journal_kwargs: Any,
+    ) -> None:
+        self.path = path
+        if rotate_mb is None:
+            rotate_mb = _env_float("TRADE_JOURNAL_ROTATE_MB", 0.0)
+        self.rotate_bytes = int(rotate_mb * 1024 * 1024)
+        self.rotate_interval_sec = (
+            rotate_interval_sec
+            if rotate_interval_sec is not None
+            else _env_float("TRADE_JOURNAL_ROTATE_INTERVAL_SEC", 0.0)
+        )
+        self.compression = compression if compression is not None else _env_compression()
+        if self.compression not in COMPRESSIONS:
+            raise ValueError(f"compression must be one of {COMPRESSIONS}")
+        if self.compression == COMPRESSION_ZSTD and zstandard is None:
+            raise ImportError("zstd compression requires the zstandard package")
+        if retention_mb is None:
+            retention_mb = _env_float("TRADE_JOURNAL_RETENTION_MB", 0.0)
+        self.retention_bytes = int(retention_mb * 1024 * 1024)
+        self._journal_kwargs = journal_kwargs
+
+        self._manifest_lock = threading.Lock()
+        self._compressor = AsyncWriter(
+            max_queue=64, overflow=OverflowPolicy.BLOCK, name="journal-compress"
+        )
+        self._open_active()
+        self.rows_written = 0
+        self.segments_rotated = 0
+
+        # Finish work a previous process left behind (rotated but not compressed).
+        for entry in load_manifest(path)["segments"]:
+            if entry.get("compression") == "pending":
+                self._compressor.submit(self._finish_segment, entry["file"])
+
+    def _open_active(self) -> None:
+        self._journal = TradeJournal(self.path, **self._journal_kwargs)
+        # A reopened active segment keeps its row count and age, so the
+        # manifest stays exact and restarts do not postpone interval rotation.
+        self._rows, self._first_ts, self._last_ts = _scan_rows(self.path)
+        age_sec = 0.0
+        if self._first_ts is not None:
+            # Journal ts values are epoch milliseconds.
+            age_sec = max(0.0, time.time() - self._first_ts / 1000.0)
+        self._opened_at = time.monotonic() - age_sec
+
+    @property
+    def closed(self) -> bool:
+        return self._journal.closed
+
+    def record_decision(self, row: Dict[str, object]) -> None:
+        self._journal.record_decision(row)
+        ts = _ts_of(row)
+        if ts is not None:
+            if self._first_ts is None:
+                self._first_ts = ts
+            self._last_ts = ts
+        self._rows += 1
+        self.rows_written += 1
+        if self._should_rotate():
+            self.rotate()
+
+    def _should_rotate(self) -> bool:
+        if (
+            self.rotate_interval_sec > 0
+            and time.monotonic() - self._opened_at >= self.rotate_interval_sec
+        ):
+            return True
+        # Size is checked only right after a flush, so buffered rows stay buffered.
+        return (
+            self.rotate_bytes > 0
+            and self._journal.pending_rows == 0
+            and self._journal.size_bytes >= self.rotate_bytes
+        )
+
+    def rotate(self) -> Optional[str]:
+        """Close the active segment and queue it for compression."""
+        self._journal.close()
+        if self._rows == 0:
+            self._open_active()
+            return None
+        stem, ext = os.path.splitext(self.path)
+        with self._manifest_lock:
+            manifest = load_manifest(self.path)
+            seq = max((e.get("seq", 0) for e in manifest["segments"]), default=0) + 1
+            stamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime())
+            segment = f"{stem}.{stamp}.{seq:04d}{ext}"
+            os.replace(self.path, segment)
+            # The sparse index describes the active file only.
+            try:
+                os.unlink(index_path_for(self.path))
+            except FileNotFoundError:
+                pass
+            manifest["segments"].append({
+                "file": os.path.basename(segment),
+                "seq": seq,
+                "first_ts": self._first_ts,
+                "last_ts": self._last_ts,
+                "rows": self._rows,
+                "bytes": os.path.getsize(segment),
+                "compression": "pending",
+            })
+            _atomic_write_json(manifest_path_for(self.path), manifest)
+        self.segments_rotated += 1
+        self._compressor.submit(self._finish_segment, os.path.basename(segment))
+        self._open_active()
+        return segment
+
+    def _finish_segment(self, name: str) -> None:
+        directory = os.path.dirname(self.path) or "."
+        src = os.path.join(directory, name)
+        final = src
+        if self.compression != COMPRESSION_NONE:
+            if os.path.exists(src):
+                final = _compress_file(src, self.compression)
+            else:
+                # Compressed before a crash, manifest not yet updated.
+                final = src + _SUFFIXES[self.compression]
+        with self._manifest_lock:
+            manifest = load_manifest(self.path)
+            for entry in manifest["segments"]:
+                if entry["file"] == name:
+                    entry["file"] = os.path.basename(final)
+                    entry["compression"] = self.compression
+                    entry["bytes"] = os.path.getsize(final) if os.path.exists(final) else 0
+            self._apply_retention(manifest, directory)
+            _atomic_write_json(manifest_path_for(self.path), manifest)
+
+    def _apply_retention(self, manifest: Dict[str, Any], directory: str) -> None:
+        if self.retention_bytes <= 0:
+            return
+        segments: List[Dict[str, Any]] = manifest["segments"]
+        total = sum(e.get("bytes", 0) for e in segments if e.get("compression") != "pending")
+        while segments and total > self.retention_bytes:
+            oldest = segments[0]
+            if oldest.get("compression") == "pending":
+                break
+            try:
+                os.unlink(os.path.join(directory, oldest["file"]))
+            except FileNotFoundError:
+                pass
+            total -= oldest.get("bytes", 0)
+            segments.pop(0)
+
+    def flush(self) -> None:
+        self._journal.flush()
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Block until queued compression work has finished."""
+        return self._compressor.drain(timeout)
+
+    def close(self) -> None:
+        self._journal.close()
+        self._compressor.close()
+
+    def __enter__(self) -> "SegmentedTradeJournal":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def open_trade_journal(path: str, **kwargs: Any):
+    """SegmentedTradeJournal if rotation is configured, else TradeJournal."""
+    rotate_mb = kwargs.pop("rotate_mb", None)
+    rotate_interval_sec = kwargs.pop("rotate_interval_sec", None)
+    if rotate_mb is None:
+        rotate_mb = _env_float("TRADE_JOURNAL_ROTATE_MB", 0.0)
+    if rotate_interval_sec is None:
+        rotate_interval_sec = _env_float("TRADE_JOURNAL_ROTATE_INTERVAL_SEC", 0.0)
+    if rotate_mb <= 0 and rotate_interval_sec <= 0:
+        return TradeJournal(path, **kwargs)
+    return SegmentedTradeJournal(
+        path, rotate_mb=rotate_mb, rotate_interval_sec=rotate_interval_sec, **kwargs
+    )
+
+
+def _open_text(path: str) -> io.TextIOBase:
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", newline="")
+    if path.endswith(".zst"):
+        if zstandard is None:
+            raise ImportError("reading .zst segments requires the zstandard package")
+        raw = open(path, "rb")
+        return io.TextIOWrapper(zstandard.ZstdDecompressor().stream_reader(raw, closefd=True), newline="")
+    return open(path, "r", newline="")
+
+
+def iter_journal_rows(
+    path: str,
+    *,
+    start_ts: Optional[int] = None,
+    end_ts: Optional[int] = None,
+) -> Iterator[Dict[str, str]]:
+    """Stream rows from closed segments (oldest first) then the active file.
+
+    Segments whose manifest time range lies entirely outside
+    [start_ts, end_ts) are skipped; rows are filtered on `ts` as well.
+    """
+    directory = os.path.dirname(path) or "."
+    files = []
+    for entry in load_manifest(path)["segments"]:
+        first, last = entry.get("first_ts"), entry.get("last_ts")
+        if start_ts is not None and last is not None and last < start_ts:
+            continue
+        if end_ts is not None and first is not None and first >= end_ts:
+            continue
+        files.append(os.path.join(directory, entry["file"]))
+    if os.path.exists(path):
+        files.append(path)
+
+    for file_path in files:
+        if not os.path.exists(file_path):
+            continue
+        with _open_text(file_path) as f:
+            for row in csv.DictReader(f):
+                if start_ts is not None or end_ts is not None:
+                    ts = _ts_of(row)
+                    if ts is None:
+                        continue
+                    if start_ts is not None and ts < start_ts:
+                        continue
+                    if end_ts is not None and ts >= end_ts:
+                        continue
+                yield row
@@ -4,7 +4,8 @@ This module implements the Shadow Artifacts Contract v1.0.
 See docs/artifacts/SHADOW_ARTIFACTS_CONTRACT.md for details.
 
 Key guarantees:
-- Atomic writes (tmp + fsync + os.replace)
+- Atomic writes (tmp + fsync + os.replace, one directory fsync per batch)
+- Unchanged files are not rewritten
 - No secrets in output (sanitization)
 - Bounded journal (configurable max rows)
 - Stable paths and schemas
@@ -13,12 +14,16 @@ Key guarantees:
 from __future__ import annotations
 
 import csv
+import hashlib
+import io
 import json
 import os
 import re
 import tempfile
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .journal_schema import JOURNAL_COLUMNS, normalize_row_for_csv
 
@@ -41,6 +46,16 @@ SECRET_PATTERN = re.compile(
     re.IGNORECASE,
 )
 
+# Lowercase literals at least one of which occurs in every SECRET_PATTERN
+# match of an ASCII string. Text containing none of them cannot match, so the
+# regex is skipped. Non-ASCII text always takes the regex path because
+# IGNORECASE also folds characters such as U+017F (long s) and U+212A (Kelvin).
+_SECRET_KEYWORDS = ("api", "secret", "token", "authorization", "bearer", "private", "password")
+
+# Short strings (reason codes, statuses) repeat on every write; memoize them.
+_MEMO_MAX_LEN = 256
+_MEMO_SIZE = 4096
+
 # File names (stable contract paths)
 SUMMARY_FILE = "latest_summary.json"
 JOURNAL_FILE = "latest_journal.csv"
@@ -86,6 +101,9 @@ def sanitize_text(text: Optional[str]) -> str:
     2. Strip newlines (replace with space)
     3. Cap at MAX_TEXT_LENGTH characters
 
+    The regex is skipped for ASCII text containing no secret keyword, and
+    short inputs are memoized; output is identical to always applying it.
+
     Args:
         text: Input text (may be None)
 
@@ -96,9 +114,15 @@ def sanitize_text(text: Optional[str]) -> str:
         return ""
 
     text = str(text)
+    if len(text) <= _MEMO_MAX_LEN:
+        return _sanitize_memo(text)
+    return _sanitize(text)
+
 
+def _sanitize(text: str) -> str:
     # Remove secret patterns
-    text = SECRET_PATTERN.sub("[REDACTED]", text)
+    if not text.isascii() or any(k in text.lower() for k in _SECRET_KEYWORDS):
+        text = SECRET_PATTERN.sub("[REDACTED]", text)
 
     # Strip newlines
     text = text.replace("\n", " ").replace("\r", " ")
@@ -110,32 +134,83 @@ def sanitize_text(text: Optional[str]) -> str:
     return text
 
 
-def atomic_write_json(path: Path, obj: Dict[str, Any]) -> None:
-    """Write JSON atomically using tmp + fsync + replace.
+_sanitize_memo = lru_cache(maxsize=_MEMO_SIZE)(_sanitize)
 
-    Args:
-        path: Target file path
-        obj: Dictionary to serialize as JSON
 
-    Raises:
-        ValueError: If resulting JSON exceeds 10KB
+class ArtifactWriteState:
+    """Per-process record of artifact files this writer last produced.
+
+    A file is skipped when its new content hashes the same as the last write
+    AND the file on disk still has the size/mtime that write produced (so an
+    externally modified or deleted file is always rewritten). How often
+    changed content is published is up to the caller (see
+    recorder.artifact_publisher, SHADOW_ARTIFACTS_MIN_INTERVAL_SEC).
     """
-    content = json.dumps(obj, sort_keys=True, ensure_ascii=True, indent=2)
 
-    # Check size limit (10KB)
-    if len(content.encode("utf-8")) > 10240:
-        raise ValueError(f"JSON content exceeds 10KB limit: {len(content)} bytes")
+    def __init__(self) -> None:
+        self._entries: Dict[str, Tuple[str, int, int, Optional[List[str]]]] = {}
+        self._lock = threading.Lock()
+        self.writes = 0
+        self.skipped_unchanged = 0
+
+    def _current(self, path: Path):
+        entry = self._entries.get(str(path))
+        if entry is None:
+            return None
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        if (st.st_mtime_ns, st.st_size) != (entry[1], entry[2]):
+            return None
+        return entry
+
+    def known_header(self, path: Path) -> Optional[List[str]]:
+        """Header of the CSV at `path` if it is still the one written here."""
+        with self._lock:
+            entry = self._current(path)
+            return entry[3] if entry is not None else None
+
+    def decide(self, path: Path, digest: str) -> bool:
+        with self._lock:
+            entry = self._current(path)
+            if entry is not None and entry[0] == digest:
+                self.skipped_unchanged += 1
+                return False
+            return True
+
+    def record(self, path: Path, digest: str, header: Optional[List[str]] = None) -> None:
+        st = os.stat(path)
+        with self._lock:
+            self._entries[str(path)] = (digest, st.st_mtime_ns, st.st_size, header)
+            self.writes += 1
 
-    # Ensure parent directory exists
-    path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Write to temp file, fsync, then replace
+_WRITE_STATE = ArtifactWriteState()
+
+
+def _fsync_dir(directory: Path) -> None:
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _atomic_replace(path: Path, data: bytes) -> None:
+    """Write bytes to a temp file, fsync it and rename it over `path`."""
+    path.parent.mkdir(parents=True, exist_ok=True)
     fd, tmp_path = tempfile.mkstemp(
         dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
     )
     try:
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
-            f.write(content)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
             f.flush()
             os.fsync(f.fileno())
         os.replace(tmp_path, path)
@@ -148,12 +223,130 @@ def atomic_write_json(path: Path, obj: Dict[str, Any]) -> None:
         raise
 
 
+def _write_if_changed(
+    path: Path,
+    data: bytes,
+    state: ArtifactWriteState,
+    header: Optional[List[str]] = None,
+) -> bool:
+    digest = hashlib.sha256(data).hexdigest()
+    if not state.decide(path, digest):
+        return False
+    _atomic_replace(path, data)
+    state.record(path, digest, header)
+    return True
+
+
+def _render_json(obj: Dict[str, Any]) -> bytes:
+    content = json.dumps(obj, sort_keys=True, ensure_ascii=True, indent=2)
+
+    # Check size limit (10KB)
+    if len(content.encode("utf-8")) > 10240:
+        raise ValueError(f"JSON content exceeds 10KB limit: {len(content)} bytes")
+    return content.encode("utf-8")
+
+
+def _render_csv(
+    path: Path,
+    header_cols: List[str],
+    rows: List[Dict[str, Any]],
+    max_rows: int,
+    check_existing_header: bool,
+    state: Optional[ArtifactWriteState],
+) -> Tuple[bytes, List[str], bool]:
+    if not header_cols:
+        raise ValueError("header_cols cannot be empty")
+
+    # Check existing header for schema mismatch
+    schema_mismatch = False
+    actual_header = header_cols
+
+    if check_existing_header:
+        existing_header = state.known_header(path) if state is not None else None
+        if existing_header is None and path.exists():
+            try:
+                with open(path, "r", encoding="utf-8", newline="") as f:
+                    reader = csv.reader(f)
+                    existing_header = next(reader, None)
+            except Exception:
+                # If we can't read existing file, use new header
+                existing_header = None
+        if existing_header and existing_header != header_cols:
+            # Schema mismatch - preserve existing header
+            actual_header = existing_header
+            schema_mismatch = True
+
+    # Bound rows (keep newest)
+    if len(rows) > max_rows:
+        rows = rows[-max_rows:]
+
+    buf = io.StringIO(newline="")
+    writer = csv.DictWriter(buf, fieldnames=actual_header, extrasaction="ignore")
+    writer.writeheader()
+    for row in rows:
+        # Normalize row to have all columns
+        normalized = {col: row.get(col, "") for col in actual_header}
+        writer.writerow(normalized)
+    return buf.getvalue().encode("utf-8"), list(actual_header), not schema_mismatch
+
+
+def atomic_write_bytes(path: Path, data: bytes, *, fsync_dir: bool = True) -> None:
+    """Write bytes atomically using tmp + fsync + replace.
+
+    Unlike atomic_write_json there is no size limit; meant for caches and
+    snapshots rather than contract artifacts.
+
+    Args:
+        path: Target file path (parent directories are created)
+        data: Complete file content
+        fsync_dir: fsync the parent directory after the rename
+    """
+    _atomic_replace(path, data)
+    if fsync_dir:
+        _fsync_dir(path.parent)
+
+
+def atomic_write_json(
+    path: Path,
+    obj: Dict[str, Any],
+    *,
+    state: Optional[ArtifactWriteState] = None,
+    fsync_dir: bool = True,
+) -> bool:
+    """Write JSON atomically using tmp + fsync + replace.
+
+    Args:
+        path: Target file path
+        obj: Dictionary to serialize as JSON
+        state: Optional write state; unchanged content is then skipped
+        fsync_dir: fsync the parent directory after the rename
+
+    Returns:
+        True if the file was written, False if skipped
+
+    Raises:
+        ValueError: If resulting JSON exceeds 10KB
+    """
+    data = _render_json(obj)
+    if state is None:
+        _atomic_replace(path, data)
+        written = True
+    else:
+        written = _write_if_changed(path, data, state)
+    if written and fsync_dir:
+        _fsync_dir(path.parent)
+    return written
+
+
 def atomic_write_csv_bounded(
     path: Path,
     header_cols: List[str],
     rows: List[Dict[str, Any]],
     max_rows: int,
     check_existing_header: bool = True,
+    *,
+    state: Optional[ArtifactWriteState] = None,
+    fsync_dir: bool = True,
 ) -> bool:
     """Write CSV atomically with bounded rows.
 
@@ -163,6 +356,8 @@ def atomic_write_csv_bounded(
         rows: List of row dictionaries
         max_rows: Maximum number of rows to keep (newest)
         check_existing_header: If True, preserve existing header if different
+        state: Optional write state; unchanged content is then skipped
+        fsync_dir: fsync the parent directory after the rename
 
     Returns:
         True if schema matches expected, False if mismatch detected
@@ -170,57 +365,17 @@ def atomic_write_csv_bounded(
     Raises:
         ValueError: If header_cols is empty
     """
-    if not header_cols:
-        raise ValueError("header_cols cannot be empty")
-
-    # Check existing header for schema mismatch
-    schema_mismatch = False
-    actual_header = header_cols
-
-    if check_existing_header and path.exists():
-        try:
-            with open(path, "r", encoding="utf-8", newline="") as f:
-                reader = csv.reader(f)
-                existing_header = next(reader, None)
-                if existing_header and existing_header != header_cols:
-                    # Schema mismatch - preserve existing header
-                    actual_header = existing_header
-                    schema_mismatch = True
-        except Exception:
-            # If we can't read existing file, use new header
-            pass
-
-    # Bound rows (keep newest)
-    if len(rows) > max_rows:
-        rows = rows[-max_rows:]
-
-    # Ensure parent directory exists
-    path.parent.mkdir(parents=True, exist_ok=True)
-
-    # Write to temp file, fsync, then replace
-    fd, tmp_path = tempfile.mkstemp(
-        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    data, header, schema_ok = _render_csv(
+        path, header_cols, rows, max_rows, check_existing_header, state
     )
-    try:
-        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=actual_header, extrasaction="ignore")
-            writer.writeheader()
-            for row in rows:
-                # Normalize row to have all columns
-                normalized = {col: row.get(col, "") for col in actual_header}
-                writer.writerow(normalized)
-            f.flush()
-            os.fsync(f.fileno())
-        os.replace(tmp_path, path)
-    except Exception:
-        # Clean up temp file on error
-        try:
-            os.unlink(tmp_path)
-        except OSError:
-            pass
-        raise
-
-    return not schema_mismatch
+    if state is None:
+        _atomic_replace(path, data)
+        written = True
+    else:
+        written = _write_if_changed(path, data, state, header)
+    if written and fsync_dir:
+        _fsync_dir(path.parent)
+    return schema_ok
 
 
 def write_shadow_artifacts(
@@ -243,6 +398,10 @@ def write_shadow_artifacts(
         artifacts_dir: Optional directory override
         header_cols: Optional column list (defaults to JOURNAL_COLUMNS)
 
+    Files whose content is unchanged since this process last wrote them are
+    skipped. Every changed file is rewritten in the same call, so the three
+    files always describe the same publish.
+
     Returns:
         True if all writes successful and schema matches,
         False if schema mismatch detected
@@ -269,9 +428,10 @@ def write_shadow_artifacts(
     # Normalize journal rows
     normalized_rows = [normalize_row_for_csv(row) for row in journal_rows]
 
-    # Write CSV first (may detect schema mismatch)
-    schema_ok = atomic_write_csv_bounded(
-        journal_path, cols, normalized_rows, max_rows
+    # Render CSV first (may detect schema mismatch)
+    state = _WRITE_STATE
+    csv_data, csv_header, schema_ok = _render_csv(
+        journal_path, cols, normalized_rows, max_rows, True, state
     )
 
     # Update health with schema mismatch status
@@ -281,9 +441,18 @@ def write_shadow_artifacts(
     _validate_health(health)
     sanitized_health = _sanitize_health(health)
 
-    # Write JSON files
-    atomic_write_json(summary_path, sanitized_summary)
-    atomic_write_json(health_path, sanitized_health)
+    summary_data = _render_json(sanitized_summary)
+    health_data = _render_json(sanitized_health)
+
+    # Each file is replaced atomically; unchanged files are skipped, and the
+    # directory is fsynced once for the whole batch.
+    written = [
+        _write_if_changed(journal_path, csv_data, state, csv_header),
+        _write_if_changed(summary_path, summary_data, state),
+        _write_if_changed(health_path, health_data, state),
+    ]
+    if any(written):
+        _fsync_dir(base_dir)
 
     return schema_ok
 
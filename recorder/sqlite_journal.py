@@ -0,0 +1,194 @@
+"""SQLite decision journal mirroring JOURNAL_COLUMNS as a typed table.
+
+Connection PRAGMAs match the Rust engine (engine-rust/src/db.rs): WAL,
+synchronous=NORMAL, busy_timeout=5000, temp_store=MEMORY. Rows are buffered
+and inserted with executemany inside one transaction every `batch_rows` rows
+or `flush_interval_sec` seconds (checked on write), and on close().
+
+The table is created on first use with indexes on (ts), (market_id, ts) and
+(reason). JOURNAL_COLUMNS is additive-only, so columns appended to the schema
+later are added with ALTER TABLE when an existing database is opened.
+
+Defaults come from SQLITE_JOURNAL_BATCH_ROWS and SQLITE_JOURNAL_FLUSH_INTERVAL_SEC.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import sqlite3
+import time
+import weakref
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from shared.sqlite_util import connect
+
+from .journal_schema import (
+    JOURNAL_COLUMNS,
+    KIND_BOOL,
+    KIND_FLOAT,
+    KIND_INT,
+    KIND_STR,
+    column_converter,
+    column_kind,
+)
+
+DEFAULT_TABLE = "shadow_decisions"
+DEFAULT_BATCH_ROWS = 100
+DEFAULT_FLUSH_INTERVAL_SEC = 1.0
+
+_SQL_TYPES = {KIND_INT: "INTEGER", KIND_FLOAT: "REAL", KIND_BOOL: "INTEGER", KIND_STR: "TEXT"}
+
+def _env_number(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if raw is None or raw == "":
+        return default
+    try:
+        value = float(raw)
+    except ValueError:
+        raise ValueError(f"{name} must be a non-negative number")
+    if value < 0:
+        raise ValueError(f"{name} must be a non-negative number")
+    return value
+
+
+def _quote(col: str) -> str:
+    return f'"{col}"'
+
+
+def _close_if_alive(ref: "weakref.ReferenceType[SqliteJournal]") -> None:
+    journal = ref()
+    if journal is not None:
+        journal.close()
+
+
+def ensure_schema(conn: sqlite3.Connection, table: str = DEFAULT_TABLE) -> None:
+    """Create the decisions table and indexes, adding any missing columns."""
+    columns = ",\n    ".join(
+        f"{_quote(col)} {_SQL_TYPES[column_kind(col)]}" for col in JOURNAL_COLUMNS
+    )
+    with conn:
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} (\n"
+            f"    id INTEGER PRIMARY KEY AUTOINCREMENT,\n    {columns}\n)"
+        )
+        existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        for col in JOURNAL_COLUMNS:
+            if col not in existing:
+                conn.execute(
+                    f"ALTER TABLE {table} ADD COLUMN {_quote(col)} {_SQL_TYPES[column_kind(col)]}"
+                )
+        conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_ts ON {table}(ts)")
+        conn.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{table}_market_ts ON {table}(market_id, ts)"
+        )
+        conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_reason ON {table}(reason)")
+
+
+class SqliteJournal:
+    """Batched SQLite journal. Same record_decision API as TradeJournal."""
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        table: str = DEFAULT_TABLE,
+        batch_rows: Optional[int] = None,
+        flush_interval_sec: Optional[float] = None,
+    ) -> None:
+        self.path = path
+        self.table = table
+        if batch_rows is None:
+            batch_rows = int(_env_number("SQLITE_JOURNAL_BATCH_ROWS", DEFAULT_BATCH_ROWS))
+        self.batch_rows = max(1, batch_rows)
+        self.flush_interval_sec = (
+            flush_interval_sec
+            if flush_interval_sec is not None
+            else _env_number("SQLITE_JOURNAL_FLUSH_INTERVAL_SEC", DEFAULT_FLUSH_INTERVAL_SEC)
+        )
+
+        # The journal may be driven from an AsyncWriter thread.
+        self._conn = connect(path)
+        ensure_schema(self._conn, table)
+
+        self._converters = [column_converter(col) for col in JOURNAL_COLUMNS]
+        placeholders = ", ".join("?" for _ in JOURNAL_COLUMNS)
+        names = ", ".join(_quote(col) for col in JOURNAL_COLUMNS)
+        self._insert_sql = f"INSERT INTO {table} ({names}) VALUES ({placeholders})"
+        self._pending: List[Tuple[Any, ...]] = []
+        self._last_flush = time.monotonic()
+        self._closed = False
+        self.rows_written = 0
+        atexit.register(_close_if_alive, weakref.ref(self))
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def record_decision(self, row: Dict[str, object]) -> None:
+        if self._closed:
+            raise ValueError("sqlite journal is closed")
+        self._pending.append(
+            tuple(convert(row.get(col)) for col, convert in zip(JOURNAL_COLUMNS, self._converters))
+        )
+        if (
+            len(self._pending) >= self.batch_rows
+            or time.monotonic() - self._last_flush >= self.flush_interval_sec
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        if self._pending:
+            with self._conn:
+                self._conn.executemany(self._insert_sql, self._pending)
+            self.rows_written += len(self._pending)
+            self._pending = []
+        self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self.flush()
+        self._conn.close()
+        self._closed = True
+
+    def __enter__(self) -> "SqliteJournal":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def query_decisions(
+    conn: sqlite3.Connection,
+    start_ts: int,
+    end_ts: int,
+    *,
+    market_id: Optional[str] = None,
+    reason: Optional[str] = None,
+    columns: Optional[Sequence[str]] = None,
+    limit: Optional[int] = None,
+    table: str = DEFAULT_TABLE,
+) -> List[Dict[str, Any]]:
+    """Decisions with start_ts <= ts < end_ts, oldest first.
+
+    Filters use the (market_id, ts) and (reason) indexes.
+    """
+    selected = list(columns) if columns else JOURNAL_COLUMNS
+    unknown = [c for c in selected if c not in JOURNAL_COLUMNS]
+    if unknown:
+        raise ValueError(f"Unknown journal columns: {unknown}")
+    sql = f"SELECT {', '.join(_quote(c) for c in selected)} FROM {table} WHERE ts >= ? AND ts < ?"
+    params: List[Any] = [start_ts, end_ts]
+    if market_id is not None:
+        sql += " AND market_id = ?"
+        params.append(market_id)
+    if reason is not None:
+        sql += " AND reason = ?"
+        params.append(reason)
+    sql += " ORDER BY ts ASC, id ASC"
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(int(limit))
+    cursor = conn.execute(sql, params)
+    return [dict(zip(selected, row)) for row in cursor.fetchall()]
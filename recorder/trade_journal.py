@@ -2,9 +2,17 @@
 
 from __future__ import annotations
 
+import atexit
 import csv
+import io
+import math
 import os
-from typing import Dict, List
+import threading
+import time
+import weakref
+from typing import Dict, List, Optional
+
+from .journal_index import DEFAULT_EVERY, JournalIndexWriter, index_path_for
 
 
 COLUMNS: List[str] = [
@@ -35,17 +43,225 @@ COLUMNS: List[str] = [
     "params_hash",
 ]
 
+# fsync policies: never, on every flush, or once on close.
+FSYNC_NEVER = "never"
+FSYNC_FLUSH = "flush"
+FSYNC_CLOSE = "close"
+FSYNC_POLICIES = (FSYNC_NEVER, FSYNC_FLUSH, FSYNC_CLOSE)
+
+DEFAULT_FLUSH_ROWS = 50
+DEFAULT_FLUSH_INTERVAL_SEC = 1.0
+
+
+def _env_int(name: str, default: int, minimum: int) -> int:
+    raw = os.getenv(name)
+    if raw is None or raw == "":
+        return default
+    try:
+        value = int(raw)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} must be an integer >= {minimum}")
+    if value < minimum:
+        raise ValueError(f"{name} must be an integer >= {minimum}")
+    return value
+
+
+def _env_nonnegative_float(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if raw is None or raw == "":
+        return default
+    try:
+        value = float(raw)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} must be a non-negative float")
+    if math.isnan(value) or value < 0.0:
+        raise ValueError(f"{name} must be a non-negative float")
+    return value
+
+
+def _env_fsync(name: str, default: str) -> str:
+    raw = os.getenv(name)
+    if raw is None or raw == "":
+        return default
+    if raw not in FSYNC_POLICIES:
+        raise ValueError(f"{name} must be one of: {', '.join(FSYNC_POLICIES)}")
+    return raw
+
+
+# Validated at import, like the venue threshold overrides (invalid => hard fail).
+FLUSH_ROWS = _env_int("TRADE_JOURNAL_FLUSH_ROWS", DEFAULT_FLUSH_ROWS, minimum=1)
+FLUSH_INTERVAL_SEC = _env_nonnegative_float("TRADE_JOURNAL_FLUSH_INTERVAL_SEC", DEFAULT_FLUSH_INTERVAL_SEC)
+FSYNC = _env_fsync("TRADE_JOURNAL_FSYNC", FSYNC_NEVER)
+INDEX_EVERY = _env_int("TRADE_JOURNAL_INDEX_EVERY", DEFAULT_EVERY, minimum=0)
+
+
+# Open journals, closed by one exit hook. Weak, so rotated or abandoned
+# journals drop out without a callback per journal piling up.
+_OPEN_JOURNALS: "weakref.WeakSet[TradeJournal]" = weakref.WeakSet()
+
+
+def _close_open_journals() -> None:
+    for journal in list(_OPEN_JOURNALS):
+        journal.close()
+
+
+atexit.register(_close_open_journals)
+
+
+def _flush_periodically(
+    ref: "weakref.ReferenceType[TradeJournal]", stop: threading.Event, interval: float
+) -> None:
+    # Holds only a weak reference, so an abandoned journal can still be collected.
+    while not stop.wait(interval):
+        journal = ref()
+        if journal is None:
+            return
+        journal.flush_if_due()
+        del journal
+
 
 class TradeJournal:
-    def __init__(self, path: str) -> None:
+    """Append-only CSV decision journal.
+
+    The file handle is kept open for the lifetime of the journal. Rows are
+    buffered in memory and handed to the OS whole, every `flush_rows` rows,
+    once `flush_interval_sec` has elapsed since the last flush (checked on
+    write and by a background timer, so rows do not linger while the journal
+    is idle), and on close(). The journal is closed automatically at
+    interpreter exit; runners convert SIGTERM into SystemExit so that path
+    also runs on signals.
+
+    Every `index_every` rows (TRADE_JOURNAL_INDEX_EVERY, default 1000, 0 to
+    disable) a sparse index entry is appended to `<path>.idx`; see
+    recorder.journal_index.
+
+    Defaults come from TRADE_JOURNAL_FLUSH_ROWS (>= 1),
+    TRADE_JOURNAL_FLUSH_INTERVAL_SEC (>= 0) and TRADE_JOURNAL_FSYNC
+    (never | flush | close), validated at import.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        flush_rows: Optional[int] = None,
+        flush_interval_sec: Optional[float] = None,
+        fsync: Optional[str] = None,
+        index_every: Optional[int] = None,
+    ) -> None:
         self.path = path
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-        if not os.path.exists(path):
-            with open(path, "w", newline="") as handle:
-                writer = csv.DictWriter(handle, fieldnames=COLUMNS)
-                writer.writeheader()
+        self.flush_rows = max(1, flush_rows if flush_rows is not None else FLUSH_ROWS)
+        self.flush_interval_sec = (
+            flush_interval_sec if flush_interval_sec is not None else FLUSH_INTERVAL_SEC
+        )
+        self.fsync = fsync if fsync is not None else FSYNC
+        if self.fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync must be one of {FSYNC_POLICIES}")
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        needs_header = not os.path.exists(path) or os.path.getsize(path) == 0
+        self._handle = open(path, "a", newline="")
+        # Rows are staged here and reach the file only as whole rows on flush.
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+        self._lock = threading.RLock()
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        self.rows_written = 0
+        if needs_header:
+            self._writer.writerow(COLUMNS)
+            self.flush()
+        if index_every is None:
+            index_every = INDEX_EVERY
+        self._index = (
+            JournalIndexWriter(index_path_for(path), index_every) if index_every > 0 else None
+        )
+        _OPEN_JOURNALS.add(self)
+        self._stop_timer = threading.Event()
+        if 0 < self.flush_interval_sec < float("inf"):
+            threading.Thread(
+                target=_flush_periodically,
+                args=(weakref.ref(self), self._stop_timer, self.flush_interval_sec),
+                name="journal-flush",
+                daemon=True,
+            ).start()
+
+    @property
+    def closed(self) -> bool:
+        return self._handle.closed
+
+    @property
+    def size_bytes(self) -> int:
+        """File size as of the last flush."""
+        if self._handle.closed:
+            return os.path.getsize(self.path)
+        return os.fstat(self._handle.fileno()).st_size
+
+    @property
+    def pending_rows(self) -> int:
+        return self._pending
 
     def record_decision(self, row: Dict[str, object]) -> None:
-        with open(self.path, "a", newline="") as handle:
-            writer = csv.DictWriter(handle, fieldnames=COLUMNS)
-            writer.writerow({key: row.get(key, "") for key in COLUMNS})
+        with self._lock:
+            index = self._index
+            if index is not None and index.block_rows == 0:
+                # Block offsets must be exact, so flush at block boundaries.
+                self.flush()
+                index.start_block(self.size_bytes)
+            self._writer.writerow([row.get(key, "") for key in COLUMNS])
+            self.rows_written += 1
+            self._pending += 1
+            if index is not None:
+                index.observe(row)
+                if index.block_rows >= index.every:
+                    self.flush()
+                    index.end_block(self.size_bytes)
+                    return
+            if (
+                self._pending >= self.flush_rows
+                or time.monotonic() - self._last_flush >= self.flush_interval_sec
+            ):
+                self.flush()
+
+    def flush_if_due(self) -> bool:
+        """Flush pending rows if `flush_interval_sec` has passed since the last flush."""
+        with self._lock:
+            if self._pending and time.monotonic() - self._last_flush >= self.flush_interval_sec:
+                self.flush()
+                return True
+            return False
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._handle.closed:
+                return
+            data = self._buffer.getvalue()
+            if data:
+                self._handle.write(data)
+                self._buffer.seek(0)
+                self._buffer.truncate()
+            self._handle.flush()
+            if self.fsync == FSYNC_FLUSH:
+                os.fsync(self._handle.fileno())
+            self._pending = 0
+            self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._handle.closed:
+                return
+            self._stop_timer.set()
+            _OPEN_JOURNALS.discard(self)
+            self.flush()
+            if self._index is not None:
+                self._index.end_block(self.size_bytes)
+                self._index.close()
+            if self.fsync == FSYNC_CLOSE:
+                os.fsync(self._handle.fileno())
+            self._handle.close()
+
+    def __enter__(self) -> "TradeJournal":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
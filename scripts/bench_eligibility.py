@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Benchmark scalar vs columnar Gamma eligibility filtering.
+
+Builds a synthetic catalogue shaped like Gamma /markets output (timestamps
+and date-only end dates, a mix of disabled/closed/restricted/expiring
+markets) and times the per-market _is_market_eligible loop against
+MarketColumns + reason_codes, checking that both give the same reasons.
+
+Usage:
+    python3 scripts/bench_eligibility.py --markets 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from polymarket.clob_readiness import _is_market_eligible
+from polymarket.eligibility_batch import REASONS, MarketColumns, skip_counts
+
+
+def _synthetic_catalogue(n: int, seed: int = 1) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    # Gamma markets cluster on a few hundred distinct end dates.
+    end_dates = [(now + timedelta(hours=h)).isoformat().replace("+00:00", "Z") for h in range(-48, 24 * 90, 6)]
+    end_dates += [(now + timedelta(days=d)).date().isoformat() for d in range(0, 120)]
+    markets = []
+    for i in range(n):
+        markets.append({
+            "id": str(500000 + i),
+            "enableOrderBook": rng.random() < 0.9,
+            "acceptingOrders": rng.random() < 0.9,
+            "closed": rng.random() < 0.03,
+            "restricted": rng.random() < 0.05,
+            "endDateIso": rng.choice(end_dates) if rng.random() < 0.97 else rng.choice([None, "TBD"]),
+            "liquidityNum": round(rng.random() * 50000, 2),
+            "volume24hr": round(rng.random() * 10000, 2),
+            "outcomes": '["Yes", "No"]',
+            "clobTokenIds": f'["{rng.getrandbits(128)}", "{rng.getrandbits(128)}"]',
+        })
+    return markets
+
+
+def _best_of(repeat: int, fn) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--markets", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    markets = _synthetic_catalogue(args.markets)
+
+    scalar = [_is_market_eligible(m)[1] for m in markets]
+    codes = MarketColumns.from_markets(markets).reason_codes()
+    if [REASONS[c] for c in codes] != scalar:
+        print("MISMATCH between scalar and columnar reasons", file=sys.stderr)
+        return 1
+
+    def run_scalar():
+        Counter(_is_market_eligible(m)[1] for m in markets)
+
+    def run_columnar():
+        skip_counts(MarketColumns.from_markets(markets).reason_codes())
+
+    cols = MarketColumns.from_markets(markets)
+    scalar_s = _best_of(args.repeat, run_scalar)
+    columnar_s = _best_of(args.repeat, run_columnar)
+    masks_s = _best_of(args.repeat, cols.reason_codes)
+
+    eligible = int((codes == 0).sum())
+    print(f"markets {len(markets)}  eligible {eligible}  skips {skip_counts(codes)}")
+    print(f"{'scalar':22s} {scalar_s * 1e3:8.2f} ms")
+    print(f"{'columnar (build+mask)':22s} {columnar_s * 1e3:8.2f} ms  ({scalar_s / columnar_s:5.1f}x)")
+    print(f"{'columnar (masks only)':22s} {masks_s * 1e3:8.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for decision journal write throughput.
+
+Compares the legacy reopen-per-row writer against the persistent buffered
+TradeJournal. Writes to a temp directory; nothing is left behind.
+
+Usage:
+    python3 scripts/bench_journal.py --rows 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from recorder.trade_journal import COLUMNS, TradeJournal
+
+
+def _sample_row(i: int) -> Dict[str, object]:
+    return {
+        "ts": 1_700_000_000_000 + i * 1000,
+        "market_id": "KXBTC-BENCH",
+        "now": 1_700_000_000_000 + i * 1000,
+        "market_end_ts": 1_700_003_600_000,
+        "official_mid": 97123.45 + (i % 17),
+        "official_source": "coinbase",
+        "official_age_ms": 120,
+        "book_source": "kalshi",
+        "book_latency_ms": 85,
+        "book_http_status": 200,
+        "yes_bid": 0.47,
+        "yes_ask": 0.49,
+        "no_bid": 0.51,
+        "no_ask": 0.53,
+        "book_age_ms": 40,
+        "mock_used": "false",
+        "implied_yes": 0.49,
+        "implied_no": 0.53,
+        "fair_up_prob": 0.52,
+        "edge_yes": 0.03,
+        "edge_no": -0.05,
+        "action": "NO_TRADE",
+        "reason": "EDGE_TOO_SMALL",
+        "params_hash": "",
+    }
+
+
+def _legacy_write(path: str, rows: List[Dict[str, object]]) -> None:
+    with open(path, "w", newline="") as handle:
+        csv.DictWriter(handle, fieldnames=COLUMNS).writeheader()
+    for row in rows:
+        with open(path, "a", newline="") as handle:
+            writer = csv.DictWriter(handle, fieldnames=COLUMNS)
+            writer.writerow({key: row.get(key, "") for key in COLUMNS})
+
+
+def _buffered_write(path: str, rows: List[Dict[str, object]]) -> None:
+    with TradeJournal(path) as journal:
+        for row in rows:
+            journal.record_decision(row)
+
+
+def _time(fn: Callable[[str, List[Dict[str, object]]], None], rows: List[Dict[str, object]]) -> float:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "journal.csv")
+        t0 = time.perf_counter()
+        fn(path, rows)
+        return time.perf_counter() - t0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    args = parser.parse_args()
+
+    rows = [_sample_row(i) for i in range(args.rows)]
+    results = {
+        "legacy_reopen_per_row": _time(_legacy_write, rows),
+        "trade_journal_buffered": _time(_buffered_write, rows),
+    }
+    for name, elapsed in results.items():
+        print(f"{name:28s} {elapsed:8.3f}s  {args.rows / elapsed:12.0f} rows/s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Benchmark CSV vs columnar journal storage size and analysis scan time.
+
+Writes the same JOURNAL_COLUMNS rows as CSV and with ColumnarJournal (arrow
+and parquet), then times loading three analysis columns from each. Uses a
+temp directory; nothing is left behind.
+
+Usage:
+    python3 scripts/bench_journal_columnar.py --rows 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from recorder.columnar_journal import ColumnarJournal, read_columnar_journal
+from recorder.journal_schema import JOURNAL_COLUMNS
+
+SCAN_COLUMNS = ["ts", "edge_net_bps", "reason"]
+
+
+def _sample_row(i: int) -> Dict[str, object]:
+    ts = 1_700_000_000_000 + i * 1000
+    return {
+        "ts": ts,
+        "market_id": "KXBTC-BENCH",
+        "now": ts,
+        "market_end_ts": 1_700_003_600_000,
+        "venue": "kalshi",
+        "symbol": "BTCUSD",
+        "official_used_venue": "coinbase",
+        "official_mid": 97123.45 + (i % 17),
+        "official_ok": True,
+        "official_age_ms": 120,
+        "pm_yes_bid": 0.47,
+        "pm_yes_ask": 0.49,
+        "pm_no_bid": 0.51,
+        "pm_no_ask": 0.53,
+        "book_ok": True,
+        "pm_book_age_ms": 40,
+        "implied_yes": 0.49,
+        "implied_no": 0.53,
+        "fair_up_prob": 0.52 + (i % 7) / 1000,
+        "edge_yes": 0.03,
+        "edge_no": -0.05,
+        "edge_gross_bps": 30.0 + (i % 11),
+        "edge_net_bps": 12.5 + (i % 13),
+        "spread_bps": 200.0,
+        "depth_total": 1500.0,
+        "regime": "NORMAL",
+        "action": "NO_TRADE",
+        "reason": "EDGE_TOO_SMALL" if i % 5 else "STALE_BOOK",
+        "microstructure_flags": "{}",
+        "daily_pnl": 0.0,
+        "kill_switch": False,
+    }
+
+
+def _write_csv(path: str, rows: List[Dict[str, object]]) -> None:
+    with open(path, "w", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(JOURNAL_COLUMNS)
+        for row in rows:
+            writer.writerow([row.get(col, "") for col in JOURNAL_COLUMNS])
+
+
+def _scan_csv(path: str) -> int:
+    total = 0.0
+    count = 0
+    with open(path, newline="") as handle:
+        for row in csv.DictReader(handle):
+            total += float(row["edge_net_bps"] or 0)
+            count += 1
+    return count
+
+
+def _scan_columnar(path: str) -> int:
+    table = read_columnar_journal(path, SCAN_COLUMNS)
+    table.column("edge_net_bps").to_numpy(zero_copy_only=False).sum()
+    return table.num_rows
+
+
+def _dir_size(path: str) -> int:
+    return sum(f.stat().st_size for f in Path(path).iterdir())
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100000)
+    args = parser.parse_args()
+
+    rows = [_sample_row(i) for i in range(args.rows)]
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "journal.csv")
+        t0 = time.perf_counter()
+        _write_csv(csv_path, rows)
+        write_s = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        _scan_csv(csv_path)
+        scan_s = time.perf_counter() - t0
+        print(f"{'csv':10s} size {os.path.getsize(csv_path) / 1e6:8.2f} MB  "
+              f"write {write_s:7.3f}s  scan {scan_s:7.3f}s")
+
+        for fmt in ("arrow", "parquet"):
+            out_dir = os.path.join(tmp, fmt)
+            t0 = time.perf_counter()
+            with ColumnarJournal(out_dir, fmt=fmt, batch_rows=5000) as journal:
+                for row in rows:
+                    journal.record_decision(row)
+            write_s = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            _scan_columnar(out_dir)
+            scan_s = time.perf_counter() - t0
+            print(f"{fmt:10s} size {_dir_size(out_dir) / 1e6:8.2f} MB  "
+                  f"write {write_s:7.3f}s  scan {scan_s:7.3f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Benchmark sanitize_text on realistic summary/health payload fields.
+
+Compares the plain regex implementation with the keyword-prefiltered,
+memoized recorder.shadow_artifacts.sanitize_text, and checks that both
+produce identical output for every input.
+
+Usage:
+    python3 scripts/bench_sanitize.py --iterations 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List, Optional
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from recorder.shadow_artifacts import MAX_TEXT_LENGTH, SECRET_PATTERN, sanitize_text
+
+
+def _legacy_sanitize(text: Optional[str]) -> str:
+    if text is None:
+        return ""
+    text = str(text)
+    text = SECRET_PATTERN.sub("[REDACTED]", text)
+    text = text.replace("\n", " ").replace("\r", " ")
+    if len(text) > MAX_TEXT_LENGTH:
+        text = text[:MAX_TEXT_LENGTH - 3] + "..."
+    return text
+
+
+# One tick's worth of text fields: summary notes/last_error/reason/subreason
+# and health last_error, as the runners emit them.
+PAYLOAD_FIELDS: List[Optional[str]] = [
+    "",
+    None,
+    "EDGE_TOO_SMALL",
+    "BOOK_STALE",
+    "NO_TRADE",
+    "",
+    "feed timeout after 2000ms (coinbase)",
+    "HTTPSConnectionPool(host='api.elections.kalshi.com', port=443): Read timed out.",
+    "401 Unauthorized: authorization: Bearer eyJhbGciOi.abc",
+    "END_TIME_ANOMALY",
+]
+
+
+def _time(fn: Callable[[Optional[str]], str], iterations: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(iterations):
+        for value in PAYLOAD_FIELDS:
+            fn(value)
+    return time.perf_counter() - t0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    for value in PAYLOAD_FIELDS:
+        assert sanitize_text(value) == _legacy_sanitize(value), value
+
+    legacy = _time(_legacy_sanitize, args.iterations)
+    fast = _time(sanitize_text, args.iterations)
+    calls = args.iterations * len(PAYLOAD_FIELDS)
+    print(f"{'legacy_regex':16s} {legacy:8.3f}s  {legacy / calls * 1e9:8.0f} ns/call")
+    print(f"{'prefilter_memo':16s} {fast:8.3f}s  {fast / calls * 1e9:8.0f} ns/call")
+    print(f"speedup {legacy / fast:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
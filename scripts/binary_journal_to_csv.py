@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""Convert a binary decision journal to the canonical journal_v1 CSV.
+
+Usage:
+    python3 scripts/binary_journal_to_csv.py data/flight_recorder/decisions.bin decisions.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from recorder.binary_journal import BinaryJournalReader
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("journal", help="Binary journal path (expects <journal>.dict.json and <journal>.strings alongside)")
+    parser.add_argument("output", help="CSV output path")
+    args = parser.parse_args()
+
+    rows = BinaryJournalReader(args.journal).to_csv(args.output)
+    print(f"wrote {rows} rows to {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Query a decision journal CSV by time range, market, reason or action.
+
+Uses the sparse sidecar index (<journal>.idx) written by TradeJournal to
+seek straight to matching blocks; journals without an index are scanned
+(run with --build-index once to create one).
+
+Usage:
+    python3 scripts/query_journal.py data/flight_recorder/stale_edge_decisions.csv \\
+        --market KXBTC-25JAN01 --start 2026-01-01T14:00:00Z --end 2026-01-01T14:05:00Z
+    python3 scripts/query_journal.py journal.csv --build-index
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from recorder.journal_index import DEFAULT_EVERY, build_index, query_journal
+
+
+def parse_ts_ms(value: Optional[str]) -> Optional[int]:
+    """Epoch milliseconds, epoch seconds, or ISO8601 (naive means UTC)."""
+    if value is None:
+        return None
+    try:
+        number = float(value)
+    except ValueError:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return int(parsed.timestamp() * 1000)
+    return int(number if number >= 1e12 else number * 1000)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("journal")
+    parser.add_argument("--start", help="Inclusive start (epoch s/ms or ISO8601)")
+    parser.add_argument("--end", help="Exclusive end (epoch s/ms or ISO8601)")
+    parser.add_argument("--market", help="market_id to match")
+    parser.add_argument("--reason")
+    parser.add_argument("--action")
+    parser.add_argument("--format", choices=["csv", "jsonl"], default="csv")
+    parser.add_argument("--limit", type=int)
+    parser.add_argument("--build-index", action="store_true", help="(Re)build the sidecar index and exit")
+    parser.add_argument("--every", type=int, default=DEFAULT_EVERY, help="Rows per index block")
+    parser.add_argument("--stats", action="store_true", help="Print scan statistics to stderr")
+    args = parser.parse_args()
+
+    if args.build_index:
+        count = build_index(args.journal, args.every)
+        print(f"indexed {count} blocks", file=sys.stderr)
+        return 0
+
+    stats: dict = {}
+    t0 = time.perf_counter()
+    rows = query_journal(
+        args.journal,
+        start_ts=parse_ts_ms(args.start),
+        end_ts=parse_ts_ms(args.end),
+        market_id=args.market,
+        reason=args.reason,
+        action=args.action,
+        stats=stats,
+    )
+    out = sys.stdout
+    writer = None
+    matched = 0
+    for row in rows:
+        if args.format == "jsonl":
+            out.write(json.dumps(row) + "\n")
+        else:
+            if writer is None:
+                writer = csv.DictWriter(out, fieldnames=list(row.keys()))
+                writer.writeheader()
+            writer.writerow(row)
+        matched += 1
+        if args.limit is not None and matched >= args.limit:
+            break
+    if args.stats:
+        elapsed_ms = (time.perf_counter() - t0) * 1000
+        print(
+            f"matched={matched} blocks_scanned={stats['blocks_scanned']} "
+            f"blocks_skipped={stats['blocks_skipped']} bytes_scanned={stats['bytes_scanned']} "
+            f"elapsed_ms={elapsed_ms:.1f}",
+            file=sys.stderr,
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Keep a rolling set of READY Polymarket candidates published to a file.
+
+Usage:
+    python3 scripts/run_candidate_daemon.py --output data/cache/polymarket_selection.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import signal
+import sys
+import threading
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from polymarket.candidate_daemon import (
+    DEFAULT_MAX_READY,
+    DEFAULT_REFRESH_INTERVAL_SEC,
+    DEFAULT_SELECTION_MAX_AGE_SEC,
+    CandidateDaemon,
+)
+from polymarket.clob_readiness import DEFAULT_MAX_PROBES
+
+# Same on-disk caches as the shadow entrypoint, so both share probe results.
+os.environ.setdefault("POLYMARKET_PROBE_CACHE_PATH", str(ROOT / "data/cache/clob_probe_cache.sqlite"))
+os.environ.setdefault("POLYMARKET_GAMMA_CATALOGUE_PATH", str(ROOT / "data/cache/gamma_catalogue.sqlite"))
+os.environ.setdefault("POLYMARKET_GAMMA_BACKOFF_PATH", str(ROOT / "data/cache/gamma_backoff.json"))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--output",
+        default=os.environ.get("POLYMARKET_SELECTION_PATH", str(ROOT / "data/cache/polymarket_selection.json")),
+        help="Selection file to publish (default: $POLYMARKET_SELECTION_PATH)",
+    )
+    parser.add_argument("--interval", type=float, default=DEFAULT_REFRESH_INTERVAL_SEC, help="Seconds between cycles")
+    parser.add_argument("--max-age", type=float, default=DEFAULT_SELECTION_MAX_AGE_SEC,
+                        help="Drop candidates not revalidated for this many seconds")
+    parser.add_argument("--max-ready", type=int, default=DEFAULT_MAX_READY, help="Candidates to publish")
+    parser.add_argument("--max-probes", type=int, default=DEFAULT_MAX_PROBES, help="Candidates probed per cycle")
+    parser.add_argument("--once", action="store_true", help="Run a single cycle and exit")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    daemon = CandidateDaemon(
+        args.output,
+        max_ready=args.max_ready,
+        max_probes=args.max_probes,
+        max_age_sec=args.max_age,
+        interval_sec=args.interval,
+    )
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    try:
+        daemon.run(stop_event=stop, iterations=1 if args.once else None)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
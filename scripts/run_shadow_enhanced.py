@@ -7,6 +7,7 @@ import argparse
 import json
 import logging
 import os
+import signal
 import sys
 import time
 from collections import Counter
@@ -18,7 +19,15 @@ from typing import Dict, Optional, Tuple, Any
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
 
-from recorder.trade_journal import TradeJournal
+from recorder.journal_segments import open_trade_journal
+from recorder.async_sink import (
+    ARTIFACTS_OVERFLOW,
+    ARTIFACTS_QUEUE_MAX,
+    JOURNAL_OVERFLOW,
+    JOURNAL_QUEUE_MAX,
+    AsyncTradeJournal,
+    AsyncWriter,
+)
 from risk.eligibility import EligibilityGate
 from risk.rules import ExposureTracker, RateLimiter, RiskRules
 from strategies.stale_edge import BookTop, Decision, StaleEdgeStrategy
@@ -88,7 +97,11 @@ except Exception as exc:
             return None, None, None, None
 
 # Shadow artifacts writer
-from recorder.shadow_artifacts import write_shadow_artifacts, sanitize_text
+from recorder.shadow_artifacts import sanitize_text
+from recorder.artifact_publisher import ShadowArtifactPublisher
+from recorder.columnar_journal import ColumnarJournal
+from recorder.sqlite_journal import SqliteJournal
+from recorder.binary_journal import BinaryJournal
 from recorder.journal_schema import JOURNAL_COLUMNS
 
 
@@ -139,6 +152,11 @@ def _now_ms() -> int:
     return int(time.time() * 1000)
 
 
+def _exit_on_sigterm(signum, _frame) -> None:
+    # SystemExit unwinds normally, so the journal's atexit close still flushes.
+    raise SystemExit(128 + signum)
+
+
 def _no_trade_from(decision: Decision, reason: str) -> Decision:
     return _normalize_decision(
         Decision(
@@ -300,6 +318,23 @@ def main() -> int:
     parser.add_argument("--output", default="data/flight_recorder/stale_edge_kalshi_decisions.csv")
     parser.add_argument("--signals", action="store_true", default=True, help="Enable signal analysis")
     parser.add_argument("--once", action="store_true", help="Run a single iteration and exit")
+    parser.add_argument(
+        "--async-writes",
+        action="store_true",
+        help="Write journal rows and shadow artifacts from background threads",
+    )
+    parser.add_argument(
+        "--columnar-dir",
+        help="Also write typed Arrow/Parquet journal files here (requires pyarrow)",
+    )
+    parser.add_argument(
+        "--sqlite-journal",
+        help="Also write decisions to this SQLite database (table shadow_decisions)",
+    )
+    parser.add_argument(
+        "--binary-journal",
+        help="Also write decisions to this fixed-layout binary journal (see recorder/binary_journal.py)",
+    )
     args = parser.parse_args()
 
     # Validate arguments
@@ -327,7 +362,24 @@ def main() -> int:
         strategy = StaleEdgeStrategy(rules, eligibility)
     except TypeError:
         strategy = StaleEdgeStrategy(rules)
-    journal = TradeJournal(args.output)
+    signal.signal(signal.SIGTERM, _exit_on_sigterm)
+    journal = open_trade_journal(args.output)
+    extra_sinks = []
+    if args.columnar_dir:
+        extra_sinks.append(ColumnarJournal(args.columnar_dir))
+    if args.sqlite_journal:
+        extra_sinks.append(SqliteJournal(args.sqlite_journal))
+    if args.binary_journal:
+        extra_sinks.append(BinaryJournal(args.binary_journal))
+    artifact_writer: Optional[AsyncWriter] = None
+    if args.async_writes:
+        journal = AsyncTradeJournal(
+            journal,
+            AsyncWriter(max_queue=JOURNAL_QUEUE_MAX, overflow=JOURNAL_OVERFLOW, name="journal-writer"),
+        )
+        artifact_writer = AsyncWriter(
+            max_queue=ARTIFACTS_QUEUE_MAX, overflow=ARTIFACTS_OVERFLOW, name="artifact-writer"
+        )
     order_limiter = RateLimiter(rules.max_orders_per_min)
     cancel_limiter = RateLimiter(rules.max_cancel_replace_per_min)
     exposure = ExposureTracker()
@@ -355,7 +407,8 @@ def main() -> int:
     start_timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
     artifact_last_error: Optional[str] = None
     artifact_last_success_at: Optional[str] = None
-    journal_rows_for_artifacts: list = []
+    artifact_publisher = ShadowArtifactPublisher(header_cols=JOURNAL_COLUMNS)
+    pending_artifacts: Optional[Tuple[Dict[str, Any], Dict[str, Any]]] = None
 
     print(f"Starting enhanced {args.venue} shadow run for {args.minutes} minutes...")
     print(f"Signal analysis: {'ENABLED' if args.signals else 'DISABLED'}")
@@ -548,11 +601,22 @@ def main() -> int:
             journal_row["arb_edge_cents"] = arb_data['extras'].get('arb_edge_cents')
         
         journal.record_decision(journal_row)
+        for sink in extra_sinks:
+            if args.async_writes:
+                journal.writer.submit(sink.record_decision, dict(journal_row))
+            else:
+                sink.record_decision(journal_row)
 
         # Collect for shadow artifacts
-        journal_rows_for_artifacts.append(journal_row)
+        artifact_publisher.append(journal_row)
 
         # Build and write shadow artifacts
+        if artifact_writer is not None:
+            artifact_last_error = artifact_writer.last_error
+            if artifact_writer.last_ok_at is not None:
+                artifact_last_success_at = datetime.fromtimestamp(
+                    artifact_writer.last_ok_at, timezone.utc
+                ).isoformat()
         try:
             summary = {
                 "schema_version": "shadow_summary_v1",
@@ -580,18 +644,22 @@ def main() -> int:
                 "last_error": sanitize_text(artifact_last_error),
                 "last_latency_ms": int((time.time() - start) * 1000),
                 "artifacts_written": True,
-                "journal_rows": len(journal_rows_for_artifacts),
+                "journal_rows": artifact_publisher.total_rows,
                 "build": {"git_sha": None, "version": None},
                 "uptime_sec": int(time.time() - start),
             }
 
-            write_shadow_artifacts(
-                summary,
-                journal_rows_for_artifacts,
-                health,
-                header_cols=JOURNAL_COLUMNS,
-            )
-            artifact_last_success_at = datetime.now(timezone.utc).isoformat()
+            if artifact_writer is not None:
+                health["io_queues"] = {
+                    "journal": journal.writer.stats(),
+                    "artifacts": artifact_writer.stats(),
+                }
+                written = artifact_publisher.publish(summary, health, submit=artifact_writer.submit)
+            else:
+                written = artifact_publisher.publish(summary, health)
+                if written:
+                    artifact_last_success_at = datetime.now(timezone.utc).isoformat()
+            pending_artifacts = None if written else (summary, health)
         except Exception as e:
             artifact_last_error = str(e)
             logger.warning(f"Failed to write shadow artifacts: {e}")
@@ -605,6 +673,21 @@ def main() -> int:
 
         time.sleep(args.loop_interval_sec)
 
+    if pending_artifacts is not None:
+        # Publish the final state that the cadence skipped.
+        try:
+            artifact_publisher.publish(
+                *pending_artifacts,
+                force=True,
+                submit=artifact_writer.submit if artifact_writer is not None else None,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to write shadow artifacts: {e}")
+    if artifact_writer is not None:
+        artifact_writer.close()
+    journal.close()
+    for sink in extra_sinks:
+        sink.close()
     # Enhanced summary
     avg_edge = edge_sum / edge_count if edge_count > 0 else 0.0
     logger.info(f"Summary: {total_decisions} decisions, {would_trade} would trade, avg edge {avg_edge:.1f} bps")
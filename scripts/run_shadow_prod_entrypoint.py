@@ -18,10 +18,20 @@ ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
 
 from venues.polymarket_discovery import discover_and_filter_candidates
+from polymarket.candidate_daemon import read_selection
+from polymarket.clob_readiness import get_probe_cache_metrics
 
 # Config
 ARTIFACTS_DIR = os.environ.get("SHADOW_ARTIFACTS_DIR", str(ROOT / "artifacts/shadow"))
 CROSS_REPO_DIR = "/opt/hybrid-trading-bot/artifacts/shadow"
+# Probe results, the Gamma catalogue and the Gamma 429 backoff survive between oneshot runs (systemd sets this to its StateDirectory).
+os.environ.setdefault("POLYMARKET_PROBE_CACHE_PATH", str(ROOT / "data/cache/clob_probe_cache.sqlite"))
+os.environ.setdefault("POLYMARKET_GAMMA_CATALOGUE_PATH", str(ROOT / "data/cache/gamma_catalogue.sqlite"))
+os.environ.setdefault("POLYMARKET_GAMMA_BACKOFF_PATH", str(ROOT / "data/cache/gamma_backoff.json"))
+# Probe the candidate window with one /midpoints request before single probes.
+os.environ.setdefault("POLYMARKET_PROBE_BATCH", "1")
+# READY candidates published by scripts/run_candidate_daemon.py; inline discovery runs only if none are fresh.
+SELECTION_PATH = os.environ.get("POLYMARKET_SELECTION_PATH", str(ROOT / "data/cache/polymarket_selection.json"))
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
 logger = logging.getLogger("shadow_entrypoint")
@@ -34,14 +44,22 @@ def main():
     Path(CROSS_REPO_DIR).mkdir(parents=True, exist_ok=True)
 
     # 1. Discovery
-    logger.info("Running discovery...")
-    try:
-        results = discover_and_filter_candidates(max_candidates=20)
-    except Exception as e:
-        logger.error(f"Discovery failed: {e}")
-        sys.exit(1)
+    ready = read_selection(SELECTION_PATH)
+    candidate_source = "daemon" if ready else "inline"
+    if ready:
+        logger.info(f"Using {len(ready)} pre-validated candidate(s) from {SELECTION_PATH}")
+    else:
+        logger.info("No fresh published selection. Running discovery...")
+        try:
+            results = discover_and_filter_candidates(max_candidates=20)
+        except Exception as e:
+            logger.error(f"Discovery failed: {e}")
+            sys.exit(1)
+        ready = results["ready"]
+
+    cache_metrics = get_probe_cache_metrics()
+    logger.info(f"Probe cache: {cache_metrics}")
 
-    ready = results["ready"]
     if not ready:
         logger.warning("No READY candidates found. Exiting cleanly (service will retry).")
         # Write a "stale" or "empty" summary so NUC2 knows we tried?
@@ -99,7 +117,9 @@ def main():
             "market_id": market_id,
             "status": "OK",
             "check_ts": int(time.time()),
-            "candidates_count": len(ready)
+            "candidates_count": len(ready),
+            "candidate_source": candidate_source,
+            "probe_cache": cache_metrics,
         }
         with open(f"{CROSS_REPO_DIR}/latest_summary.json", "w") as f:
             json.dump(summary, f)
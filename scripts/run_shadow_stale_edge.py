@@ -4,34 +4,66 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import logging
+import os
+import signal
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional, Tuple
 
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
 
 from feeds.router import get_official_price
-from recorder.trade_journal import TradeJournal
+from recorder.journal_segments import open_trade_journal
 from risk.rules import ExposureTracker, RateLimiter, RiskRules
 from sources.resolution_source import is_unknown, resolution_source_from_metadata
+from strategies.decision_cache import DecisionCache, book_top_fingerprint, gate_state, official_fingerprint
 from strategies.reasons import ReasonCode
 from strategies.stale_edge import BookTop, Decision, StaleEdgeStrategy
+from venuebook.fingerprint import book_fingerprint
+from venuebook.retention import RawRetention, resolve_raw_retention
 from venuebook.types import BookStatus
 from venues.polymarket import fetch_polymarket_venuebook
 from venues.kalshi import fetch_kalshi_venuebook
-from venues.kalshi_fetch import fetch_market
-from eligibility.kalshi_rules import check_kalshi_eligibility, is_market_open, EligibilityResult
+from venues.kalshi_registry import KalshiMarketRegistry
+from eligibility.kalshi_rules import is_market_open, EligibilityResult
 
 
 logger = logging.getLogger("stale_edge_shadow")
 
+_STALENESS_REASONS = {
+    ReasonCode.STALE_FEED,
+    ReasonCode.STALE_BOOK,
+    ReasonCode.OFFICIAL_FEED_MISSING,
+    ReasonCode.FEED_STALE_ABORT,
+}
+
 
 def _now_ms() -> int:
     return int(time.time() * 1000)
 
 
+def _exit_on_sigterm(signum, _frame) -> None:
+    # SystemExit unwinds normally, so the journal's atexit close still flushes.
+    raise SystemExit(128 + signum)
+
+
+def _fetch_official(symbol_pair: str) -> Tuple[Optional[tuple], int]:
+    """Official price plus the local time the response was received."""
+    feed = get_official_price(symbol_pair=symbol_pair)
+    return feed, _now_ms()
+
+
+_BOOK_FETCHERS = {
+    "kalshi": fetch_kalshi_venuebook,
+    "polymarket": fetch_polymarket_venuebook,
+}
+
+
 def _simulate_polymarket_book(
     fair_prob: float,
     now_ms: int,
@@ -134,8 +166,29 @@ def main() -> int:
         "--output",
         default="data/flight_recorder/stale_edge_decisions.csv",
     )
+    parser.add_argument(
+        "--kalshi-series",
+        default=None,
+        help="Bulk-list this Kalshi series into the market registry before resolving --market",
+    )
+    parser.add_argument(
+        "--kalshi-event",
+        default=None,
+        help="Bulk-list this Kalshi event into the market registry before resolving --market",
+    )
     parser.add_argument("--fixture-meta", help="Path to market metadata json fixture")
     parser.add_argument("--fixture-book", help="Path to orderbook json fixture")
+    parser.add_argument(
+        "--skip-unchanged",
+        action="store_true",
+        help="Reuse the last input-determined NO_TRADE decision while book, official tick and time gates are unchanged",
+    )
+    parser.add_argument(
+        "--skip-unchanged-max-sec",
+        type=float,
+        default=30.0,
+        help="Force a full evaluation at least this often when --skip-unchanged is set",
+    )
     args = parser.parse_args()
 
     market_id = args.market_id_cli or args.market_id
@@ -170,43 +223,46 @@ def main() -> int:
 
     rules = RiskRules.from_env()
     strategy = StaleEdgeStrategy(rules)
-    journal = TradeJournal(args.output)
+    signal.signal(signal.SIGTERM, _exit_on_sigterm)
+    journal = open_trade_journal(args.output)
     order_limiter = RateLimiter(rules.max_orders_per_min)
     cancel_limiter = RateLimiter(rules.max_cancel_replace_per_min)
     exposure = ExposureTracker()
+    decision_cache = (
+        DecisionCache(max_reuse_ms=int(args.skip_unchanged_max_sec * 1000))
+        if args.skip_unchanged
+        else None
+    )
 
     # Metadata & Eligibility
     source = None
     market_close_ts = None
     
     if args.venue == "kalshi":
-        # 1. Fetch Metadata
+        # Metadata, resolution source and close time come from the registry,
+        # which starts from the KALSHI_REGISTRY_PATH snapshot when set
+        # (never with fixtures, so they cannot leak into live runs).
+        fixtures = bool(args.fixture_meta or args.fixture_book)
+        registry = KalshiMarketRegistry(path=None if fixtures else os.environ.get("KALSHI_REGISTRY_PATH"))
         try:
-            meta = fetch_market(market_id)
-            # 2. Check Eligibility
-            res, src_res = check_kalshi_eligibility(meta)
-            if res != EligibilityResult.ELIGIBLE:
-                logger.error(f"KALSHI_NOT_ELIGIBLE: {res.name}")
-                return 1
-            if src_res is None:
-                logger.error("KALSHI_RESOLUTION_SOURCE_UNKNOWN")
-                return 1
-            source = src_res
-            
-            # Parse close time for time gating
-            try:
-                ct_str = meta.get("close_time", "")
-                if ct_str.endswith('Z'):
-                    ct_str = ct_str[:-1] + '+00:00'
-                from datetime import datetime
-                market_close_ts = datetime.fromisoformat(ct_str).timestamp()
-            except Exception:
-                logger.error("KALSHI_CLOSE_TIME_PARSE_ERROR")
-                return 1
-                
+            if args.kalshi_series or args.kalshi_event:
+                registry.load(series_ticker=args.kalshi_series, event_ticker=args.kalshi_event)
+            info = registry.get(market_id)
+            registry.save()
         except Exception as e:
             logger.error(f"KALSHI_METADATA_FETCH_FAILED: {e}")
             return 1
+        logger.info(f"Kalshi registry: {registry.stats()}")
+
+        res, src_res = info.eligibility()
+        if res != EligibilityResult.ELIGIBLE:
+            logger.error(f"KALSHI_NOT_ELIGIBLE: {res.name}")
+            return 1
+        if src_res is None:
+            logger.error("KALSHI_RESOLUTION_SOURCE_UNKNOWN")
+            return 1
+        source = src_res
+        market_close_ts = info.close_ts
     else:
         # Polymarket / Default fallback
         metadata = {"rules_text": args.rules_text}
@@ -232,121 +288,102 @@ def main() -> int:
     last_official_ok_ms = None
     start_ms = _now_ms()
 
-    while time.time() - start < duration_sec:
-        now_ms = _now_ms()
-        official_mid = None
-        official_ts_ms = None
-        source_name = "NONE"
-
-        # Time Gating (Kalshi only for now, or generic if we had close ts for PM)
-        if args.venue == "kalshi" and market_close_ts is not None:
-             if not is_market_open(now_ms/1000.0, market_close_ts):
-                 logger.info("MARKET_CLOSED")
-                 # We can either break or just record decision MARKET_CLOSED
-                 # For shadow runner, maybe just log and wait? 
-                 # Or treat as NO_TRADE.
-                 pass
-
-        if not is_unknown(source) and not args.force_feed_failure:
-            feed = get_official_price(symbol_pair=source.symbol)
-            if feed:
-                official_mid, official_ts_ms, _, source_name = feed
-                last_official_ok_ms = now_ms
-            else:
-                logger.warning("OFFICIAL_FEED_UNAVAILABLE")
-        elif args.force_feed_failure:
-            logger.warning("OFFICIAL_FEED_FORCED_FAILURE")
-
-        if last_official_ok_ms is not None:
-            if now_ms - last_official_ok_ms > rules.feed_stale_abort_sec * 1000:
-                feed_abort = True
-        else:
-            if now_ms - start_ms > rules.feed_stale_abort_sec * 1000:
-                feed_abort = True
-
-        fair_hint = strategy.model.fair_up_prob() or 0.5
-        mock_used = False
-        book = None
-        book_source = "NONE"
-        book_latency_ms = None
-        book_http_status = None
-        book_missing_reason = None
-
-        if args.mode == "sim":
-            book_source = "mock"
-            book = _simulate_polymarket_book(
-                fair_prob=fair_hint,
-                now_ms=now_ms,
-                spread=args.book_spread,
-                bias=args.book_bias,
+    fetch_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="tick-fetch")
+    # VenueBook.raw is never read here, so skip the per-tick digest unless
+    # VENUEBOOK_RAW_RETENTION or debug/fixture mode asks for the payload.
+    book_raw_retention = resolve_raw_retention(default=RawRetention.NONE)
+
+    # The pool and journal are released however the loop ends (SIGTERM
+    # arrives as SystemExit).
+    try:
+        while time.time() - start < duration_sec:
+            tick_start_ms = _now_ms()
+            official_mid = None
+            official_ts_ms = None
+            official_recv_ms = None
+            source_name = "NONE"
+            market_closed = (
+                args.venue == "kalshi"
+                and market_close_ts is not None
+                and not is_market_open(tick_start_ms / 1000.0, market_close_ts)
             )
-            mock_used = True
-        else:
-            # LIVE MODE: prohibit mocks.
-            if args.venue == "kalshi":
-                if market_close_ts is not None and not is_market_open(now_ms/1000.0, market_close_ts):
-                    book_missing_reason = "MARKET_CLOSED"
+
+            # Time Gating (Kalshi only for now, or generic if we had close ts for PM)
+            if market_closed:
+                logger.info("MARKET_CLOSED")
+
+            # Issue the official price and venue book fetches concurrently so the
+            # tick costs the slowest single fetch, not their sum.
+            official_future = None
+            if not is_unknown(source) and not args.force_feed_failure:
+                official_future = fetch_pool.submit(_fetch_official, source.symbol)
+            elif args.force_feed_failure:
+                logger.warning("OFFICIAL_FEED_FORCED_FAILURE")
+
+            book_future = None
+            book_fetch = _BOOK_FETCHERS.get(args.venue) if args.mode == "live" else None
+            if book_fetch is not None and not market_closed:
+                book_t0 = time.time()
+                book_future = fetch_pool.submit(
+                    functools.partial(book_fetch, market_id, raw_retention=book_raw_retention)
+                )
+
+            if official_future is not None:
+                try:
+                    feed, official_recv_ms = official_future.result()
+                except Exception as e:
+                    feed = None
+                    logger.error(f"OFFICIAL_FEED_ERROR: {e}")
+                if feed:
+                    official_mid, official_ts_ms, _, source_name = feed
+                    last_official_ok_ms = official_recv_ms
                 else:
-                    book_source = "kalshi"
-                    t0 = time.time()
-                    try:
-                        vbook = fetch_kalshi_venuebook(market_id)
-                        book_latency_ms = int((time.time() - t0) * 1000)
-                        book_http_status = 200 if vbook.status == BookStatus.OK else None
-                        
-                        if vbook.status == BookStatus.OK:
-                            # VenueBook to BookTop
-                            # Kalshi is naturally YES/NO binary.
-                            book = BookTop(
-                                yes_bid=vbook.best_bid,
-                                yes_ask=vbook.best_ask,
-                                no_bid=None,
-                                no_ask=None,
-                                ts_ms=now_ms
-                            )
-                            # Derive implicit sides (Kalshi usually gives both, but BookTop struct is weird)
-                            # We'll fill what we have.
-                            # Actually, Kalshi VenueBook should have NO side if it's there.
-                            # But VenueBook types only has best_bid/best_ask which are typically for the primary contract (YES).
-                            # If we want NO prices, we need to check if VenueBook supports it.
-                            # Looking at venues/kalshi_fetch.py and venues/kalshi.py...
-                            # venues/kalshi.py parse_kalshi_book returns best_bid/best_ask from YES side (or derived from NO).
-                            # It doesn't explicitly return NO side prices in the top level fields.
-                            # So we do strict complement 1 - yes.
-                            if book.yes_bid is not None:
-                                book.no_ask = 1.0 - book.yes_bid
-                            if book.yes_ask is not None:
-                                book.no_bid = 1.0 - book.yes_ask
-                        else:
-                            book_missing_reason = (
-                                vbook.fail_reason.name if vbook.fail_reason is not None else "UNKNOWN"
-                            )
-                            logger.error(f"BOOK_FETCH_FAILED: {book_missing_reason}")
-                            
-                    except Exception as e:
-                        book_missing_reason = "PARSE_ERROR"
-                        logger.error(f"BOOK_PARSE_FAILED: {str(e)}")
-
-            elif args.venue == "polymarket":
-                book_source = "polymarket"
-                t0 = time.time()
+                    logger.warning("OFFICIAL_FEED_UNAVAILABLE")
+
+            fair_hint = strategy.model.fair_up_prob() or 0.5
+            mock_used = False
+            book = None
+            book_source = "NONE"
+            book_latency_ms = None
+            book_http_status = None
+            book_missing_reason = None
+            book_fp = "-"
+
+            if args.mode == "sim":
+                book_source = "mock"
+                book = _simulate_polymarket_book(
+                    fair_prob=fair_hint,
+                    now_ms=_now_ms(),
+                    spread=args.book_spread,
+                    bias=args.book_bias,
+                )
+                mock_used = True
+                book_fp = book_top_fingerprint(book)
+            elif market_closed:
+                # LIVE MODE: prohibit mocks.
+                book_missing_reason = "MARKET_CLOSED"
+            elif book_future is not None:
+                book_source = args.venue
                 try:
-                    vbook = fetch_polymarket_venuebook(market_id)
-                    book_latency_ms = int((time.time() - t0) * 1000)
+                    vbook = book_future.result()
+                    # VenueBook.ts is stamped when the response was received.
+                    book_recv_ms = int(vbook.ts * 1000)
+                    book_latency_ms = max(0, book_recv_ms - int(book_t0 * 1000))
+                    book_fp = book_fingerprint(vbook)
                     book_http_status = 200 if vbook.status == BookStatus.OK else None
 
                     if vbook.status == BookStatus.OK:
-                        # Convert VenueBook to legacy BookTop for strategy compatibility
+                        # Convert VenueBook to legacy BookTop for strategy compatibility.
+                        # VenueBook only carries the YES-side BBO (Kalshi derives it from
+                        # NO levels when needed; the Polymarket token is the YES token),
+                        # so NO prices are the strict complement.
                         book = BookTop(
                             yes_bid=vbook.best_bid,
                             yes_ask=vbook.best_ask,
-                            no_bid=None,  # Polymarket CLOB is one-sided (YES token)
+                            no_bid=None,
                             no_ask=None,
-                            ts_ms=now_ms,
+                            ts_ms=book_recv_ms,
                         )
-                        # Fix for BookTop: it needs no_bid/no_ask to not crash strategy
-                        # If it's a binary market, we can derive them if we know which side the token is.
-                        # Assuming market_id is the token for YES.
                         if book.yes_bid is not None:
                             book.no_ask = 1.0 - book.yes_bid
                         if book.yes_ask is not None:
@@ -364,111 +401,172 @@ def main() -> int:
                 book_missing_reason = "NO_CONFIG"
                 mock_used = False
 
-        if is_unknown(source):
-            decision = Decision(
-                action="NO_TRADE",
-                reason=ReasonCode.RESOLUTION_SOURCE_UNKNOWN,
-                side=None,
-                price=None,
-                size=None,
-                implied_yes=None,
-                implied_no=None,
-                fair_up_prob=None,
-                edge_yes=None,
-                edge_no=None,
-                params_hash="",
-            )
-        elif feed_abort:
-            decision = Decision(
-                action="NO_TRADE",
-                reason=ReasonCode.FEED_STALE_ABORT,
-                side=None,
-                price=None,
-                size=None,
-                implied_yes=None,
-                implied_no=None,
-                fair_up_prob=None,
-                edge_yes=None,
-                edge_no=None,
-                params_hash="",
-            )
-        elif book is None:
-            decision = Decision(
-                action="NO_TRADE",
-                reason=ReasonCode.BOOK_DATA_MISSING,
-                side=None,
-                price=None,
-                size=None,
-                implied_yes=None,
-                implied_no=None,
-                fair_up_prob=None,
-                edge_yes=None,
-                edge_no=None,
-                params_hash="",
-            )
-        else:
-            decision = strategy.evaluate(
-                market_id=market_id,
-                official_mid=official_mid,
-                official_ts_ms=official_ts_ms,
-                book=book,
-                market_end_ts_ms=market_end_ts_ms,
-                now_ts_ms=now_ms,
-            )
+            # Decision time: taken after both fetches so ages are measured against
+            # the actual receive timestamps.
+            now_ms = _now_ms()
 
-        decision = _apply_rate_limits(decision, now_ms, order_limiter, cancel_limiter)
-        decision = _apply_exposure_cap(decision, market_id, exposure, rules)
-
-        if decision.cancel_all:
-            exposure.reset_market(market_id)
-
-        total_decisions += 1
-        if decision.action == "PLACE_ORDER":
-            would_trade += 1
-            edge = max(decision.edge_yes or 0.0, decision.edge_no or 0.0)
-            edge_sum += edge
-            edge_count += 1
-        if decision.reason in {ReasonCode.STALE_FEED, ReasonCode.STALE_BOOK, ReasonCode.OFFICIAL_FEED_MISSING, ReasonCode.FEED_STALE_ABORT}:
-            staleness_refusals += 1
-        if decision.reason == ReasonCode.END_TIME_ANOMALY:
-            end_time_anomalies += 1
-
-        official_age_ms = now_ms - official_ts_ms if official_ts_ms is not None else ""
-        book_age_ms = now_ms - book.ts_ms if book is not None and book.ts_ms is not None else ""
-
-        journal.record_decision(
-            {
-                "ts": now_ms,
-                "market_id": market_id,
-                "now": now_ms,
-                "market_end_ts": market_end_ts_ms,
-                "official_mid": official_mid or "",
-                "official_source": source_name,
-                "official_age_ms": official_age_ms,
-                "book_source": book_source,
-                "book_latency_ms": book_latency_ms or "",
-                "book_http_status": book_http_status or "",
-                "book_missing_reason": book_missing_reason or "",
-                "yes_bid": book.yes_bid if book else "",
-                "yes_ask": book.yes_ask if book else "",
-                "no_bid": book.no_bid if book else "",
-                "no_ask": book.no_ask if book else "",
-                "book_age_ms": book_age_ms if book else "",
-                "mock_used": str(mock_used).lower(),
-                "implied_yes": decision.implied_yes or "",
-                "implied_no": decision.implied_no or "",
-                "fair_up_prob": decision.fair_up_prob or "",
-                "edge_yes": decision.edge_yes or "",
-                "edge_no": decision.edge_no or "",
-                "action": decision.action,
-                "reason": decision.reason,
-                "params_hash": decision.params_hash,
-            }
-        )
+            if last_official_ok_ms is not None:
+                if now_ms - last_official_ok_ms > rules.feed_stale_abort_sec * 1000:
+                    feed_abort = True
+            else:
+                if now_ms - start_ms > rules.feed_stale_abort_sec * 1000:
+                    feed_abort = True
+
+            input_key = None
+            if decision_cache is not None:
+                input_key = (
+                    book_fp,
+                    book_missing_reason,
+                    official_fingerprint(official_mid, official_ts_ms, source_name),
+                    feed_abort,
+                    gate_state(
+                        rules,
+                        now_ms,
+                        official_ts_ms,
+                        book.ts_ms if book is not None else None,
+                        market_end_ts_ms,
+                    ),
+                )
+                cached = decision_cache.lookup(input_key, now_ms)
+                if cached is not None:
+                    # Only input-determined NO_TRADE decisions are cached, so a
+                    # skipped tick counts exactly as its full evaluation would.
+                    total_decisions += 1
+                    if cached.reason in _STALENESS_REASONS:
+                        staleness_refusals += 1
+                    # Compact heartbeat: inputs unchanged, previous decision still stands.
+                    journal.record_decision(
+                        {
+                            "ts": now_ms,
+                            "market_id": market_id,
+                            "now": now_ms,
+                            "official_source": source_name,
+                            "book_source": book_source,
+                            "action": "UNCHANGED",
+                            "reason": cached.reason,
+                            "params_hash": cached.params_hash,
+                        }
+                    )
+                    time.sleep(args.loop_interval_sec)
+                    continue
+
+            if is_unknown(source):
+                decision = Decision(
+                    action="NO_TRADE",
+                    reason=ReasonCode.RESOLUTION_SOURCE_UNKNOWN,
+                    side=None,
+                    price=None,
+                    size=None,
+                    implied_yes=None,
+                    implied_no=None,
+                    fair_up_prob=None,
+                    edge_yes=None,
+                    edge_no=None,
+                    params_hash="",
+                )
+            elif feed_abort:
+                decision = Decision(
+                    action="NO_TRADE",
+                    reason=ReasonCode.FEED_STALE_ABORT,
+                    side=None,
+                    price=None,
+                    size=None,
+                    implied_yes=None,
+                    implied_no=None,
+                    fair_up_prob=None,
+                    edge_yes=None,
+                    edge_no=None,
+                    params_hash="",
+                )
+            elif book is None:
+                decision = Decision(
+                    action="NO_TRADE",
+                    reason=ReasonCode.BOOK_DATA_MISSING,
+                    side=None,
+                    price=None,
+                    size=None,
+                    implied_yes=None,
+                    implied_no=None,
+                    fair_up_prob=None,
+                    edge_yes=None,
+                    edge_no=None,
+                    params_hash="",
+                )
+            else:
+                decision = strategy.evaluate(
+                    market_id=market_id,
+                    official_mid=official_mid,
+                    official_ts_ms=official_ts_ms,
+                    book=book,
+                    market_end_ts_ms=market_end_ts_ms,
+                    now_ts_ms=now_ms,
+                )
+
+            decision = _apply_rate_limits(decision, now_ms, order_limiter, cancel_limiter)
+            decision = _apply_exposure_cap(decision, market_id, exposure, rules)
+
+            if decision.cancel_all:
+                exposure.reset_market(market_id)
+
+            if decision_cache is not None:
+                decision_cache.store(input_key, decision, now_ms)
+
+            total_decisions += 1
+            if decision.action == "PLACE_ORDER":
+                would_trade += 1
+                edge = max(decision.edge_yes or 0.0, decision.edge_no or 0.0)
+                edge_sum += edge
+                edge_count += 1
+            if decision.reason in _STALENESS_REASONS:
+                staleness_refusals += 1
+            if decision.reason == ReasonCode.END_TIME_ANOMALY:
+                end_time_anomalies += 1
+
+            official_age_ms = now_ms - official_ts_ms if official_ts_ms is not None else ""
+            book_age_ms = now_ms - book.ts_ms if book is not None and book.ts_ms is not None else ""
+
+            journal.record_decision(
+                {
+                    "ts": now_ms,
+                    "market_id": market_id,
+                    "now": now_ms,
+                    "market_end_ts": market_end_ts_ms,
+                    "official_mid": official_mid or "",
+                    "official_source": source_name,
+                    "official_age_ms": official_age_ms,
+                    "book_source": book_source,
+                    "book_latency_ms": book_latency_ms or "",
+                    "book_http_status": book_http_status or "",
+                    "book_missing_reason": book_missing_reason or "",
+                    "yes_bid": book.yes_bid if book else "",
+                    "yes_ask": book.yes_ask if book else "",
+                    "no_bid": book.no_bid if book else "",
+                    "no_ask": book.no_ask if book else "",
+                    "book_age_ms": book_age_ms if book else "",
+                    "mock_used": str(mock_used).lower(),
+                    "implied_yes": decision.implied_yes or "",
+                    "implied_no": decision.implied_no or "",
+                    "fair_up_prob": decision.fair_up_prob or "",
+                    "edge_yes": decision.edge_yes or "",
+                    "edge_no": decision.edge_no or "",
+                    "action": decision.action,
+                    "reason": decision.reason,
+                    "params_hash": decision.params_hash,
+                }
+            )
 
-        time.sleep(args.loop_interval_sec)
+            time.sleep(args.loop_interval_sec)
+    finally:
+        fetch_pool.shutdown(wait=False)
+        journal.close()
 
     avg_edge = (edge_sum / edge_count) if edge_count else 0.0
+    if decision_cache is not None:
+        logger.info(
+            "skip_unchanged evaluations=%s skipped=%s",
+            decision_cache.evaluations,
+            decision_cache.skipped,
+        )
     logger.info(
         "summary decisions=%s would_trades=%s avg_edge=%.4f staleness_refusals=%s end_time_anomalies=%s",
         total_decisions,
@@ -0,0 +1,139 @@
+"""Size-bounded LRU cache with per-entry TTL and counters.
+
+Entries expire after their TTL and are dropped when read, and by a sweep
+that runs at most every `sweep_interval_sec` seconds from get/set, so
+memory stays flat in long-lived processes even for keys that are never
+read again. When full, the least recently used entry is evicted. stats()
+returns plain counters suitable for health artifacts.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+
+DEFAULT_MAX_ENTRIES = 1000
+DEFAULT_SWEEP_INTERVAL_SEC = 60.0
+
+_MISSING = object()
+
+
+class LruTtlCache:
+    """Thread-safe LRU cache; each entry carries its own TTL in seconds."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        default_ttl: Optional[float] = None,
+        sweep_interval_sec: float = DEFAULT_SWEEP_INTERVAL_SEC,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.sweep_interval_sec = sweep_interval_sec
+        self._clock = clock
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._next_sweep = clock() + sweep_interval_sec
+        self.hits = 0
+        self.misses = 0
+        self.sets = 0
+        self.evictions = 0
+        self.expired = 0
+
+    def _maybe_sweep(self, now: float):
+        if now >= self._next_sweep:
+            self._sweep(now)
+
+    def _sweep(self, now: float) -> int:
+        dead = [key for key, (expires_at, _) in self._data.items() if expires_at <= now]
+        for key in dead:
+            del self._data[key]
+        self.expired += len(dead)
+        self._next_sweep = now + self.sweep_interval_sec
+        return len(dead)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            now = self._clock()
+            self._maybe_sweep(now)
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._data[key]
+                self.expired += 1
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        ttl = self.default_ttl if ttl is None else ttl
+        if ttl is None:
+            raise ValueError("ttl is required when the cache has no default_ttl")
+        with self._lock:
+            now = self._clock()
+            self._maybe_sweep(now)
+            self._data[key] = (now + ttl, value)
+            self._data.move_to_end(key)
+            self.sets += 1
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.pop(key, _MISSING)
+        return default if entry is _MISSING else entry[1]
+
+    def sweep(self) -> int:
+        """Drops every expired entry now. Returns how many were dropped."""
+        with self._lock:
+            return self._sweep(self._clock())
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def keys(self) -> List[Hashable]:
+        with self._lock:
+            return list(self._data)
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        """Unexpired (key, value) pairs, least recently used first (not counted as hits)."""
+        with self._lock:
+            now = self._clock()
+            return [(key, value) for key, (expires_at, value) in self._data.items() if expires_at > now]
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self.keys())
+
+    def __contains__(self, key: Hashable) -> bool:
+        """True if `key` holds an unexpired entry (does not count as a hit)."""
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            return entry is not _MISSING and entry[0] > self._clock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._data),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+                "sets": self.sets,
+                "evictions": self.evictions,
+                "expired": self.expired,
+            }
@@ -0,0 +1,28 @@
+"""SQLite connection setup shared by the journal and the discovery caches.
+
+PRAGMAs match the Rust engine (engine-rust/src/db.rs): WAL,
+synchronous=NORMAL, busy_timeout=5000, temp_store=MEMORY.
+"""
+
+import os
+import sqlite3
+from typing import Tuple
+
+PRAGMAS: Tuple[str, ...] = (
+    "PRAGMA journal_mode=WAL;",
+    "PRAGMA synchronous=NORMAL;",
+    "PRAGMA busy_timeout=5000;",
+    "PRAGMA temp_store=MEMORY;",
+)
+
+
+def connect(path: str) -> sqlite3.Connection:
+    """Opens `path` (creating its directory) with PRAGMAS applied.
+
+    The connection may be used from other threads; callers serialise access.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    conn = sqlite3.connect(path, check_same_thread=False)
+    for pragma in PRAGMAS:
+        conn.execute(pragma)
+    return conn
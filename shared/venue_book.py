@@ -3,6 +3,8 @@ import math
 from dataclasses import dataclass
 from typing import List, Tuple, Optional
 
+from venuebook.ladder import BookLadder
+
 @dataclass
 class Level:
     price: float
@@ -32,6 +34,10 @@ class VenueBook:
     def total_depth(self) -> float:
         return sum(q for p, q in self.bids) + sum(q for p, q in self.asks)
 
+    def to_ladder(self) -> BookLadder:
+        """Array-backed ladder for VWAP / slippage / depth queries."""
+        return BookLadder.from_levels(self.bids, self.asks)
+
 # Canonical Reason Codes from Rust/Project standards
 class VenueBookReason:
     ThinBookNoBbo = "ThinBookNoBbo"
@@ -0,0 +1,109 @@
+"""Short-circuit for ticks whose strategy inputs did not change.
+
+Most loop iterations see the same book and the same official tick as the
+previous one. The runner builds a key from input fingerprints plus the
+outcome of every time-based gate the strategy applies, and reuses the last
+decision while that key is unchanged (bounded by max_reuse_ms).
+
+Only NO_TRADE decisions reached before the strategy touches its model are
+reused: the runner's own refusals and the time/staleness gates, which the
+key fully determines. PLACE_ORDER decisions go through the rate limiters
+and exposure tracker, and from MODEL_WARMUP on StaleEdgeStrategy.evaluate
+feeds the official tick to RollingReturnModel.update on every call, so
+reusing those would skip limiter/exposure bookkeeping or leave the model
+with fewer samples than a normal run. They are evaluated every tick.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import struct
+from dataclasses import dataclass
+from typing import Hashable, Optional, Tuple
+
+from risk.rules import RiskRules
+from strategies.reasons import ReasonCode
+from strategies.stale_edge import BookTop, Decision
+
+# NO_TRADE reasons decided from the cache key alone, without limiter,
+# exposure or model state.
+CACHEABLE_REASONS = frozenset(
+    {
+        ReasonCode.RESOLUTION_SOURCE_UNKNOWN,
+        ReasonCode.FEED_STALE_ABORT,
+        ReasonCode.BOOK_DATA_MISSING,
+        ReasonCode.TIME_TO_END_CUTOFF,
+        ReasonCode.OFFICIAL_FEED_MISSING,
+        ReasonCode.STALE_FEED,
+        ReasonCode.STALE_BOOK,
+    }
+)
+
+
+def official_fingerprint(mid: Optional[float], ts_ms: Optional[int], source: str) -> str:
+    h = hashlib.blake2b(digest_size=8)
+    h.update(source.encode("utf-8"))
+    h.update(struct.pack("<dq", float("nan") if mid is None else float(mid), ts_ms or 0))
+    return h.hexdigest()
+
+
+def book_top_fingerprint(book: Optional[BookTop]) -> str:
+    if book is None:
+        return "-"
+    prices = (book.yes_bid, book.yes_ask, book.no_bid, book.no_ask)
+    h = hashlib.blake2b(digest_size=8)
+    h.update(struct.pack("<4d", *(float("nan") if v is None else float(v) for v in prices)))
+    return h.hexdigest()
+
+
+def gate_state(
+    rules: RiskRules,
+    now_ms: int,
+    official_ts_ms: Optional[int],
+    book_ts_ms: Optional[int],
+    market_end_ts_ms: int,
+) -> Tuple[bool, ...]:
+    """Outcome of the time-dependent checks in StaleEdgeStrategy.evaluate."""
+    return (
+        now_ms >= market_end_ts_ms,
+        market_end_ts_ms - now_ms < rules.time_to_end_cutoff_sec * 1000,
+        official_ts_ms is not None and now_ms - official_ts_ms > rules.official_stale_sec * 1000,
+        book_ts_ms is not None and now_ms - book_ts_ms > rules.book_stale_sec * 1000,
+    )
+
+
+@dataclass
+class _Entry:
+    key: Hashable
+    decision: Decision
+    decided_at_ms: int
+
+
+class DecisionCache:
+    """Single-slot cache of the last decision keyed by its input signature."""
+
+    def __init__(self, max_reuse_ms: int = 30_000) -> None:
+        self.max_reuse_ms = max_reuse_ms
+        self.evaluations = 0
+        self.skipped = 0
+        self._entry: Optional[_Entry] = None
+
+    def lookup(self, key: Hashable, now_ms: int) -> Optional[Decision]:
+        entry = self._entry
+        if entry is None or entry.key != key:
+            return None
+        if now_ms - entry.decided_at_ms > self.max_reuse_ms:
+            return None
+        self.skipped += 1
+        return entry.decision
+
+    def store(self, key: Hashable, decision: Decision, now_ms: int) -> None:
+        self.evaluations += 1
+        if (
+            decision.action != "NO_TRADE"
+            or decision.cancel_all
+            or decision.reason not in CACHEABLE_REASONS
+        ):
+            self._entry = None
+            return
+        self._entry = _Entry(key=key, decision=decision, decided_at_ms=now_ms)
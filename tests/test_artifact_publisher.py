@@ -0,0 +1,106 @@
+import csv
+import json
+
+from recorder.artifact_publisher import ShadowArtifactPublisher
+from recorder.shadow_artifacts import HEALTH_FILE, JOURNAL_FILE, SUMMARY_FILE
+
+
+def _summary(decision: str = "NO_TRADE", reason: str = "EDGE_TOO_SMALL") -> dict:
+    return {
+        "schema_version": "shadow_summary_v1",
+        "mode": "SHADOW",
+        "last_refresh": "2026-01-01T00:00:00+00:00",
+        "strategy": "stale_edge_enhanced",
+        "run_id": "run",
+        "market": "KXTEST",
+        "decision": decision,
+        "reason": reason,
+        "notes": "",
+        "last_error": "",
+    }
+
+
+def _health(rows: int) -> dict:
+    return {
+        "schema_version": "shadow_health_v1",
+        "mode": "SHADOW",
+        "last_run_at": "2026-01-01T00:00:00+00:00",
+        "artifacts_written": True,
+        "journal_rows": rows,
+        "last_error": "",
+    }
+
+
+def _journal_ts(artifacts_dir) -> list:
+    with open(artifacts_dir / JOURNAL_FILE, newline="") as f:
+        return [row["ts"] for row in csv.DictReader(f)]
+
+
+def test_ring_keeps_newest_rows(tmp_path) -> None:
+    publisher = ShadowArtifactPublisher(max_rows=3, artifacts_dir=str(tmp_path))
+    for i in range(10):
+        publisher.append({"ts": i})
+    assert [r["ts"] for r in publisher.rows()] == [7, 8, 9]
+    assert publisher.total_rows == 10
+
+    assert publisher.publish(_summary(), _health(publisher.total_rows))
+    assert _journal_ts(tmp_path) == ["7", "8", "9"]
+    assert json.loads((tmp_path / HEALTH_FILE).read_text())["journal_rows"] == 10
+    assert (tmp_path / SUMMARY_FILE).exists()
+
+
+def test_publish_respects_cadence(tmp_path) -> None:
+    publisher = ShadowArtifactPublisher(
+        max_rows=100, min_interval_sec=5.0, artifacts_dir=str(tmp_path)
+    )
+    publisher.append({"ts": 1})
+    assert publisher.publish(_summary(), _health(1), now=100.0)
+
+    publisher.append({"ts": 2})
+    assert not publisher.publish(_summary(), _health(2), now=102.0)
+    assert _journal_ts(tmp_path) == ["1"]
+
+    assert publisher.publish(_summary(), _health(2), now=105.0)
+    assert _journal_ts(tmp_path) == ["1", "2"]
+    assert publisher.skipped == 1
+
+
+def test_no_new_rows_skips_even_after_interval(tmp_path) -> None:
+    publisher = ShadowArtifactPublisher(min_interval_sec=1.0, artifacts_dir=str(tmp_path))
+    publisher.append({"ts": 1})
+    assert publisher.publish(_summary(), _health(1), now=0.0)
+    assert not publisher.publish(_summary(), _health(1), now=60.0)
+
+
+def test_decision_change_publishes_immediately(tmp_path) -> None:
+    publisher = ShadowArtifactPublisher(min_interval_sec=60.0, artifacts_dir=str(tmp_path))
+    publisher.append({"ts": 1})
+    assert publisher.publish(_summary(), _health(1), now=0.0)
+    publisher.append({"ts": 2})
+    assert publisher.publish(_summary("WOULD_TRADE", "EDGE_OK"), _health(2), now=1.0)
+    summary = json.loads((tmp_path / SUMMARY_FILE).read_text())
+    assert summary["decision"] == "WOULD_TRADE"
+
+
+def test_submit_receives_snapshot(tmp_path) -> None:
+    calls = []
+    publisher = ShadowArtifactPublisher(artifacts_dir=str(tmp_path))
+    publisher.append({"ts": 1})
+    publisher.publish(_summary(), _health(1), submit=lambda fn, *a, **kw: calls.append(a))
+    publisher.append({"ts": 2})
+
+    assert len(calls) == 1
+    assert [r["ts"] for r in calls[0][1]] == [1]
+    assert not (tmp_path / JOURNAL_FILE).exists()
+
+
+def test_failed_write_is_retried(tmp_path) -> None:
+    publisher = ShadowArtifactPublisher(min_interval_sec=60.0, artifacts_dir=str(tmp_path))
+    publisher.append({"ts": 1})
+    bad = _summary()
+    del bad["run_id"]
+    try:
+        publisher.publish(bad, _health(1), now=0.0)
+    except ValueError:
+        pass
+    assert publisher.due(_summary(), now=1.0)
@@ -0,0 +1,109 @@
+import os
+
+import pytest
+
+import recorder.shadow_artifacts as sa
+from recorder.shadow_artifacts import (
+    HEALTH_FILE,
+    JOURNAL_FILE,
+    SUMMARY_FILE,
+    ArtifactWriteState,
+    atomic_write_json,
+    write_shadow_artifacts,
+)
+
+
+@pytest.fixture
+def state(monkeypatch):
+    fresh = ArtifactWriteState()
+    monkeypatch.setattr(sa, "_WRITE_STATE", fresh)
+    return fresh
+
+
+@pytest.fixture
+def dir_fsyncs(monkeypatch):
+    calls = []
+    real = sa._fsync_dir
+    monkeypatch.setattr(sa, "_fsync_dir", lambda d: (calls.append(d), real(d)))
+    return calls
+
+
+def _summary(decision: str = "NO_TRADE") -> dict:
+    return {
+        "schema_version": "shadow_summary_v1",
+        "mode": "SHADOW",
+        "last_refresh": "2026-01-01T00:00:00+00:00",
+        "strategy": "s",
+        "run_id": "r",
+        "market": "m",
+        "decision": decision,
+        "reason": "EDGE_TOO_SMALL",
+    }
+
+
+def _health(run_at: str = "2026-01-01T00:00:00+00:00") -> dict:
+    return {
+        "schema_version": "shadow_health_v1",
+        "mode": "SHADOW",
+        "last_run_at": run_at,
+        "artifacts_written": True,
+        "journal_rows": 1,
+    }
+
+
+def _mtimes(directory) -> dict:
+    return {name: os.stat(directory / name).st_mtime_ns for name in (SUMMARY_FILE, JOURNAL_FILE, HEALTH_FILE)}
+
+
+def test_unchanged_files_are_skipped(tmp_path, state, dir_fsyncs) -> None:
+    rows = [{"ts": 1}]
+    write_shadow_artifacts(_summary(), rows, _health(), artifacts_dir=str(tmp_path))
+    assert state.writes == 3
+    assert len(dir_fsyncs) == 1
+
+    before = _mtimes(tmp_path)
+    write_shadow_artifacts(_summary(), rows, _health("later"), artifacts_dir=str(tmp_path))
+    after = _mtimes(tmp_path)
+
+    assert state.writes == 4
+    assert state.skipped_unchanged == 2
+    assert after[SUMMARY_FILE] == before[SUMMARY_FILE]
+    assert after[JOURNAL_FILE] == before[JOURNAL_FILE]
+    assert len(dir_fsyncs) == 2
+
+    write_shadow_artifacts(_summary(), rows, _health("later"), artifacts_dir=str(tmp_path))
+    assert state.writes == 4
+    assert len(dir_fsyncs) == 2
+
+
+def test_externally_changed_file_is_rewritten(tmp_path, state) -> None:
+    write_shadow_artifacts(_summary(), [], _health(), artifacts_dir=str(tmp_path))
+    (tmp_path / SUMMARY_FILE).write_text("{}")
+    write_shadow_artifacts(_summary(), [], _health(), artifacts_dir=str(tmp_path))
+    assert '"decision": "NO_TRADE"' in (tmp_path / SUMMARY_FILE).read_text()
+
+    os.unlink(tmp_path / HEALTH_FILE)
+    write_shadow_artifacts(_summary(), [], _health(), artifacts_dir=str(tmp_path))
+    assert (tmp_path / HEALTH_FILE).exists()
+
+
+def test_changed_files_are_written_together(tmp_path, state) -> None:
+    write_shadow_artifacts(_summary(), [], _health(), artifacts_dir=str(tmp_path))
+    write_shadow_artifacts(_summary("WOULD_TRADE"), [], _health(), artifacts_dir=str(tmp_path))
+    assert '"WOULD_TRADE"' in (tmp_path / SUMMARY_FILE).read_text()
+    assert state.writes == 4 and state.skipped_unchanged == 2
+
+
+def test_schema_mismatch_uses_cached_header(tmp_path, state) -> None:
+    write_shadow_artifacts(_summary(), [], _health(), artifacts_dir=str(tmp_path), header_cols=["ts"])
+    assert write_shadow_artifacts(_summary(), [], _health(), artifacts_dir=str(tmp_path), header_cols=["ts", "x"]) is False
+    assert (tmp_path / JOURNAL_FILE).read_text().splitlines()[0] == "ts"
+
+
+def test_atomic_write_json_with_state_returns_written(tmp_path) -> None:
+    state = ArtifactWriteState()
+    path = tmp_path / "a.json"
+    assert atomic_write_json(path, {"a": 1}, state=state) is True
+    assert atomic_write_json(path, {"a": 1}, state=state) is False
+    assert atomic_write_json(path, {"a": 2}, state=state) is True
+    assert not [n for n in os.listdir(tmp_path) if n.endswith(".tmp")]
@@ -0,0 +1,132 @@
+import csv
+import threading
+
+import pytest
+
+from recorder.async_sink import AsyncTradeJournal, AsyncWriter, OverflowPolicy
+from recorder.trade_journal import COLUMNS, TradeJournal
+
+
+def _gated_writer(overflow: OverflowPolicy, max_queue: int = 2):
+    """Writer whose first job blocks until the returned event is set."""
+    gate = threading.Event()
+    started = threading.Event()
+    writer = AsyncWriter(max_queue=max_queue, overflow=overflow, name="test-writer")
+
+    def _hold() -> None:
+        started.set()
+        gate.wait(5)
+
+    writer.submit(_hold)
+    assert started.wait(5)
+    return writer, gate
+
+
+def test_jobs_run_in_order_and_stats_update() -> None:
+    seen = []
+    writer = AsyncWriter(max_queue=10)
+    for i in range(5):
+        assert writer.submit(seen.append, i)
+    assert writer.drain(5)
+    stats = writer.stats()
+    writer.close()
+
+    assert seen == [0, 1, 2, 3, 4]
+    assert stats["written"] == 5
+    assert stats["queue_depth"] == 0
+    assert stats["dropped"] == 0
+    assert stats["write_latency_ms_max"] >= stats["write_latency_ms_last"] >= 0
+
+
+def test_drop_newest_discards_incoming_job() -> None:
+    seen = []
+    writer, gate = _gated_writer(OverflowPolicy.DROP_NEWEST)
+    assert writer.submit(seen.append, 1)
+    assert writer.submit(seen.append, 2)
+    assert not writer.submit(seen.append, 3)
+    assert writer.stats()["queue_depth"] == 2
+    gate.set()
+    writer.close()
+
+    assert seen == [1, 2]
+    assert writer.dropped == 1
+
+
+def test_drop_oldest_keeps_latest_jobs() -> None:
+    seen = []
+    writer, gate = _gated_writer(OverflowPolicy.DROP_OLDEST)
+    for i in range(1, 5):
+        assert writer.submit(seen.append, i)
+    gate.set()
+    writer.close()
+
+    assert seen == [3, 4]
+    assert writer.dropped == 2
+
+
+def test_block_waits_for_space() -> None:
+    seen = []
+    writer, gate = _gated_writer(OverflowPolicy.BLOCK, max_queue=1)
+    writer.submit(seen.append, 1)
+
+    producer = threading.Thread(target=writer.submit, args=(seen.append, 2))
+    producer.start()
+    producer.join(0.1)
+    assert producer.is_alive()
+
+    gate.set()
+    producer.join(5)
+    writer.close()
+    assert seen == [1, 2]
+    assert writer.dropped == 0
+
+
+def test_errors_are_counted_and_sanitized() -> None:
+    def _boom() -> None:
+        raise OSError("disk full api_key=abc123")
+
+    writer = AsyncWriter(max_queue=4)
+    writer.submit(_boom)
+    writer.close()
+    stats = writer.stats()
+    assert stats["errors"] == 1
+    assert "abc123" not in stats["last_error"]
+
+
+def test_submit_after_close_raises() -> None:
+    writer = AsyncWriter(max_queue=4)
+    writer.close()
+    with pytest.raises(RuntimeError):
+        writer.submit(print)
+
+
+def test_async_trade_journal_writes_copies_of_rows(tmp_path) -> None:
+    path = tmp_path / "journal.csv"
+    journal = AsyncTradeJournal(TradeJournal(str(path)), AsyncWriter(max_queue=100))
+    row = {"ts": 1, "market_id": "m1", "action": "NO_TRADE"}
+    journal.record_decision(row)
+    row["ts"] = 2
+    journal.record_decision(row)
+    journal.close()
+
+    with open(path, newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == COLUMNS
+    assert [r[0] for r in rows[1:]] == ["1", "2"]
+
+
+def test_timed_out_close_leaves_the_journal_open(tmp_path) -> None:
+    path = tmp_path / "journal.csv"
+    writer, gate = _gated_writer(OverflowPolicy.BLOCK, max_queue=10)
+    journal = AsyncTradeJournal(TradeJournal(str(path)), writer)
+    journal.record_decision({"ts": 1, "market_id": "m1", "action": "NO_TRADE"})
+
+    assert not journal.close(timeout=0.05)
+    assert writer.pending == 2
+    assert not journal.journal._handle.closed
+
+    gate.set()
+    assert journal.close()
+    assert writer.stats()["written"] == 2
+    with open(path, newline="") as f:
+        assert [r[0] for r in list(csv.reader(f))[1:]] == ["1"]
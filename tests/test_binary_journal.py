@@ -0,0 +1,176 @@
+import csv
+import json
+import math
+import os
+
+import pytest
+
+from recorder.binary_journal import (
+    HEADER_SIZE,
+    BinaryJournal,
+    DICTIONARY_COLUMNS,
+    BinaryJournalReader,
+    dictionary_path_for,
+    read_header,
+    strings_path_for,
+)
+from recorder.journal_schema import JOURNAL_COLUMNS, SCHEMA_VERSION, normalize_row_for_csv
+
+
+def _row(i: int) -> dict:
+    return {
+        "ts": 1_700_000_000_000 + i,
+        "venue": "kalshi",
+        "market_id": f"M{i % 3}",
+        "action": "NO_TRADE" if i % 2 else "WOULD_TRADE",
+        "reason": "EDGE_TOO_SMALL" if i % 4 else "STALE",
+        "edge_net_bps": 12.5 + i if i % 5 else None,
+        "official_ok": bool(i % 2) if i % 3 else None,
+    }
+
+
+def test_columns_are_mmap_views(tmp_path) -> None:
+    path = str(tmp_path / "j.bin")
+    with BinaryJournal(path, batch_rows=4) as journal:
+        for i in range(10):
+            journal.record_decision(_row(i))
+
+    meta = read_header(path)
+    assert meta["schema_version"] == SCHEMA_VERSION
+    assert [c[0] for c in meta["columns"]] == JOURNAL_COLUMNS
+
+    reader = BinaryJournalReader(path)
+    assert len(reader) == 10
+    ts = reader.column("ts")
+    assert ts.base is not None  # view into the memory map, not a copy
+    assert ts.tolist() == [1_700_000_000_000 + i for i in range(10)]
+    edge = reader.column("edge_net_bps")
+    assert math.isnan(edge[0]) and edge[1] == 13.5
+    assert list(reader.strings("reason")[:5]) == ["STALE", "EDGE_TOO_SMALL", "EDGE_TOO_SMALL", "EDGE_TOO_SMALL", "STALE"]
+    assert (reader.column("official_ok")[:3] == [-1, 1, 0]).all()
+
+
+def test_reopen_appends_and_extends_dictionary(tmp_path) -> None:
+    path = str(tmp_path / "j.bin")
+    with BinaryJournal(path) as journal:
+        journal.record_decision(_row(0))
+    with BinaryJournal(path) as journal:
+        journal.record_decision(dict(_row(1), reason="NEW_REASON"))
+    reader = BinaryJournalReader(path)
+    assert list(reader.strings("reason")) == ["STALE", "NEW_REASON"]
+
+
+def test_trailing_partial_record_is_dropped(tmp_path) -> None:
+    path = str(tmp_path / "j.bin")
+    with BinaryJournal(path) as journal:
+        journal.record_decision(_row(0))
+    with open(path, "ab") as f:
+        f.write(b"\x01\x02\x03")
+    assert len(BinaryJournalReader(path)) == 1
+    with BinaryJournal(path) as journal:
+        journal.record_decision(_row(1))
+    assert BinaryJournalReader(path).column("ts").tolist() == [1_700_000_000_000, 1_700_000_000_001]
+
+
+def test_rejects_foreign_files(tmp_path) -> None:
+    path = tmp_path / "x.bin"
+    path.write_bytes(b"not a journal" + b"\0" * HEADER_SIZE)
+    with pytest.raises(ValueError):
+        BinaryJournalReader(str(path))
+
+
+def test_v2_files_carry_their_own_magic(tmp_path) -> None:
+    path = tmp_path / "j.bin"
+    with BinaryJournal(str(path)) as journal:
+        journal.record_decision(_row(0))
+    data = path.read_bytes()
+    assert data[:4] == b"SBJ2"
+
+    # A v1 magic in front of a v2 layout is rejected rather than misparsed.
+    path.write_bytes(b"SBJ1" + data[4:])
+    with pytest.raises(ValueError, match="does not match"):
+        BinaryJournalReader(str(path))
+
+
+def test_to_csv_matches_journal_v1_csv(tmp_path) -> None:
+    bin_path = str(tmp_path / "j.bin")
+    rows = [_row(i) for i in range(12)]
+    with BinaryJournal(bin_path) as journal:
+        for row in rows:
+            journal.record_decision(row)
+    assert os.path.exists(dictionary_path_for(bin_path))
+
+    expected_path = tmp_path / "expected.csv"
+    with open(expected_path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=JOURNAL_COLUMNS)
+        writer.writeheader()
+        for row in rows:
+            # Bools spelled the way the CSV TradeJournal rows write them.
+            writer.writerow({
+                k: "" if v is None else str(v).lower() if isinstance(v, bool) else v
+                for k, v in normalize_row_for_csv(row).items()
+            })
+
+    out_path = str(tmp_path / "converted.csv")
+    assert BinaryJournalReader(bin_path).to_csv(out_path) == 12
+    with open(out_path, newline="") as f:
+        converted = list(csv.reader(f))
+    with open(expected_path, newline="") as f:
+        assert converted == list(csv.reader(f))
+
+
+def test_only_low_cardinality_columns_use_the_dictionary(tmp_path) -> None:
+    path = str(tmp_path / "j.bin")
+    with BinaryJournal(path, batch_rows=2) as journal:
+        for i in range(6):
+            journal.record_decision(dict(_row(i), market_id=f"market-{i}", official_err="timeout ü"))
+
+    with open(dictionary_path_for(path)) as f:
+        assert set(json.load(f)) == DICTIONARY_COLUMNS
+    reader = BinaryJournalReader(path)
+    assert list(reader.strings("market_id")) == [f"market-{i}" for i in range(6)]
+    assert list(reader.strings("official_err")) == ["timeout ü"] * 6
+    assert list(reader.strings("symbol")) == [""] * 6
+    # Repeated values are appended to the side file once.
+    assert os.path.getsize(strings_path_for(path)) == sum(
+        4 + len(s.encode("utf-8")) for s in ["timeout ü"] + [f"market-{i}" for i in range(6)]
+    )
+
+    with BinaryJournal(path) as journal:
+        journal.record_decision(dict(_row(6), market_id="market-0"))
+    assert BinaryJournalReader(path).strings("market_id")[-1] == "market-0"
+
+
+def test_reader_tolerates_missing_dictionary(tmp_path) -> None:
+    path = str(tmp_path / "j.bin")
+    with BinaryJournal(path) as journal:
+        journal.record_decision(_row(0))
+        journal.record_decision(dict(_row(1), reason="NEW_REASON"))
+    os.remove(dictionary_path_for(path))
+    reader = BinaryJournalReader(path)
+    assert list(reader.strings("reason")) == ["", ""]
+    assert list(reader.strings("market_id")) == ["M0", "M1"]
+    assert reader.to_csv(str(tmp_path / "out.csv")) == 2
+
+
+def test_v1_files_remain_readable(tmp_path, monkeypatch) -> None:
+    from recorder import binary_journal
+    from recorder.journal_schema import KIND_STR, column_kind
+
+    path = str(tmp_path / "v1.bin")
+    with monkeypatch.context() as m:
+        m.setattr(binary_journal, "MAGIC", b"SBJ1")
+        m.setattr(binary_journal, "FORMAT_VERSION", "binary_journal_v1")
+        m.setattr(
+            binary_journal, "DICTIONARY_COLUMNS",
+            frozenset(c for c in JOURNAL_COLUMNS if column_kind(c) == KIND_STR),
+        )
+        with BinaryJournal(path) as journal:
+            journal.record_decision(_row(1))
+
+    assert read_header(path)["format"] == "binary_journal_v1"
+    with BinaryJournal(path) as journal:
+        journal.record_decision(_row(2))
+    reader = BinaryJournalReader(path)
+    assert list(reader.strings("market_id")) == ["M1", "M2"]
+    assert reader.column("official_ok").tolist() == [1, 0]
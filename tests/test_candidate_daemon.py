@@ -0,0 +1,140 @@
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from polymarket import clob_readiness
+from polymarket.candidate_daemon import SELECTION_FORMAT, CandidateDaemon, read_selection
+from polymarket.candidate_index import RankedCandidate
+from polymarket.clob_readiness import ProbeResult
+from polymarket.contract import FailureReason, ReadinessStatus
+
+READY = ProbeResult(ReadinessStatus.READY, FailureReason.OK, {})
+NO_BOOK = ProbeResult(ReadinessStatus.NOT_READY, FailureReason.CLOB_NO_ORDERBOOK, {})
+LIMITED = ProbeResult(ReadinessStatus.RETRYABLE_ERROR, FailureReason.CLOB_RATE_LIMITED, {})
+
+
+def _candidate(mid: str, liquidity: float, volume: float = 0.0) -> RankedCandidate:
+    return RankedCandidate(
+        market_id=mid,
+        liquidity=liquidity,
+        volume=volume,
+        end_ts=None,
+        yes_token=f"yes-{mid}",
+        no_token=f"no-{mid}",
+        parse_reason=FailureReason.OK,
+        market={"id": mid, "question": f"Q{mid}?", "slug": f"m-{mid}"},
+    )
+
+
+class Venue:
+    """Scripted ranking and batch probe answers for one daemon."""
+
+    def __init__(self, monkeypatch, candidates):
+        self.candidates = candidates
+        self.answers = {}
+        self.calls = []
+        monkeypatch.setattr(clob_readiness, "rank_clob_candidates", self.rank)
+        monkeypatch.setattr(clob_readiness, "probe_clob_readiness_batch", self.probe)
+
+    def rank(self, target):
+        return len(self.candidates), list(self.candidates), 0, None
+
+    def probe(self, tokens, gate=None, fallback=True, use_cache=True):
+        self.calls.append((list(tokens), use_cache))
+        return {t: self.answers[t] for t in tokens if t in self.answers}
+
+
+def test_publishes_ready_candidates_best_first(tmp_path, monkeypatch):
+    venue = Venue(monkeypatch, [_candidate("1", 50.0), _candidate("2", 500.0), _candidate("3", 5.0)])
+    venue.answers = {"yes-1": READY, "yes-2": READY, "yes-3": NO_BOOK}
+    path = tmp_path / "selection.json"
+    daemon = CandidateDaemon(str(path), max_ready=5)
+
+    stats = daemon.refresh(now=1000.0)
+    daemon.publish(now=1000.0)
+
+    assert venue.calls == [(["yes-1", "yes-2", "yes-3"], False)]
+    assert stats["ready"] == 2
+    ready = read_selection(str(path), now=1010.0)
+    assert [c["id"] for c in ready] == ["2", "1"]
+    assert ready[0]["clobTokenIds"] == ["yes-2", "no-2"]
+    assert ready[0]["question"] == "Q2?"
+    assert ready[0]["validated_at"] == 1000.0
+    assert json.loads(path.read_text())["format"] == SELECTION_FORMAT
+
+
+def test_not_ready_drops_and_retryable_ages_out(tmp_path, monkeypatch):
+    venue = Venue(monkeypatch, [_candidate("1", 10.0), _candidate("2", 20.0)])
+    venue.answers = {"yes-1": READY, "yes-2": READY}
+    daemon = CandidateDaemon(str(tmp_path / "s.json"), max_age_sec=60)
+    daemon.refresh(now=1000.0)
+
+    venue.answers = {"yes-1": NO_BOOK, "yes-2": LIMITED}
+    stats = daemon.refresh(now=1030.0)
+    assert [c.market_id for c in daemon.candidates()] == ["2"]
+    assert stats["dropped"] == 1
+    assert daemon.candidates()[0].validated_at == 1000.0
+
+    stats = daemon.refresh(now=1070.0)
+    assert daemon.candidates() == []
+    assert stats["expired"] == 1
+
+
+def test_read_selection_filters_stale_and_foreign_files(tmp_path, monkeypatch):
+    venue = Venue(monkeypatch, [_candidate("1", 10.0)])
+    venue.answers = {"yes-1": READY}
+    path = tmp_path / "selection.json"
+    daemon = CandidateDaemon(str(path), max_age_sec=60)
+    daemon.refresh(now=1000.0)
+    daemon.publish(now=1000.0)
+
+    assert len(read_selection(str(path), now=1059.0)) == 1
+    assert read_selection(str(path), now=1061.0) == []
+    assert read_selection(str(path), max_age_sec=3600, now=2000.0)[0]["id"] == "1"
+    assert read_selection(str(tmp_path / "missing.json")) == []
+    (tmp_path / "other.json").write_text(json.dumps({"format": "other", "candidates": []}))
+    assert read_selection(str(tmp_path / "other.json")) == []
+    (tmp_path / "torn.json").write_text("{\"format\": ")
+    assert read_selection(str(tmp_path / "torn.json")) == []
+
+
+def test_failed_cycle_still_publishes(tmp_path, monkeypatch):
+    def boom(target):
+        raise RuntimeError("gamma down")
+
+    monkeypatch.setattr(clob_readiness, "rank_clob_candidates", boom)
+    path = tmp_path / "selection.json"
+    daemon = CandidateDaemon(str(path))
+    daemon.run(iterations=1)
+    assert daemon.errors == 1
+    assert json.loads(path.read_text())["candidates"] == []
+
+
+def test_batch_revalidation_bypasses_probe_cache(monkeypatch):
+    monkeypatch.delenv("POLYMARKET_PROBE_CACHE_PATH", raising=False)
+    monkeypatch.delenv("POLYMARKET_FIXTURE_MODE", raising=False)
+    clob_readiness._probe_cache.clear()
+    clob_readiness._add_to_cache("tok", (ReadinessStatus.READY, FailureReason.OK, {}), ReadinessStatus.READY, FailureReason.OK)
+    resp = MagicMock(status_code=200)
+    resp.json.return_value = {"tok": None}
+    try:
+        with patch("polymarket.clob_readiness.requests.post", return_value=resp) as post:
+            cached = clob_readiness.probe_clob_readiness_batch(["tok"])
+            fresh = clob_readiness.probe_clob_readiness_batch(["tok"], use_cache=False)
+        assert cached["tok"].status == ReadinessStatus.READY
+        assert fresh["tok"].reason == FailureReason.CLOB_INVALID_PAYLOAD
+        assert post.call_count == 1
+    finally:
+        clob_readiness._probe_cache.clear()
+
+
+def test_equal_liquidity_ranks_by_volume(tmp_path, monkeypatch):
+    venue = Venue(monkeypatch, [_candidate("1", 50.0, 10.0), _candidate("2", 50.0, 90.0)])
+    venue.answers = {"yes-1": READY, "yes-2": READY}
+    path = tmp_path / "selection.json"
+    daemon = CandidateDaemon(str(path))
+    daemon.refresh(now=1000.0)
+    daemon.publish(now=1000.0)
+    assert [c.market_id for c in daemon.candidates()] == ["2", "1"]
+    assert [c["id"] for c in read_selection(str(path), now=1000.0)] == ["2", "1"]
@@ -0,0 +1,111 @@
+import json
+import random
+import sqlite3
+import time
+from datetime import datetime, timedelta, timezone
+
+from polymarket.candidate_index import CandidateIndex, candidate_from_market
+from polymarket.contract import FailureReason
+from polymarket.gamma_catalogue import CatalogueDiff, CatalogueRanking, GammaCatalogue
+
+NOW = datetime.now(timezone.utc)
+
+
+def _market(i, liquidity, volume=0, hours=72, **overrides) -> dict:
+    market = {
+        "id": str(i),
+        "enableOrderBook": True,
+        "acceptingOrders": True,
+        "endDateIso": (NOW + timedelta(hours=hours)).isoformat(),
+        "liquidityNum": liquidity,
+        "volume24hr": volume,
+        "clobTokenIds": json.dumps([f"yes{i}", f"no{i}"]),
+        "outcomes": json.dumps(["Yes", "No"]),
+    }
+    market.update(overrides)
+    return market
+
+
+def _ids(candidates):
+    return [c.market_id for c in candidates]
+
+
+def test_candidates_are_preparsed() -> None:
+    c = candidate_from_market(_market(1, "12.5", 3))
+    assert (c.yes_token, c.no_token, c.parse_reason) == ("yes1", "no1", FailureReason.OK)
+    assert c.liquidity == 12.5 and c.end_ts > time.time()
+
+    bad = candidate_from_market(_market(2, 1, clobTokenIds=None))
+    assert bad.yes_token is None and bad.parse_reason == FailureReason.MISSING_CLOB_TOKEN_IDS
+
+
+def test_order_matches_stable_sort_under_random_updates() -> None:
+    rng = random.Random(7)
+    index = CandidateIndex()
+    current = {}
+    order = []
+    for _ in range(500):
+        i = rng.randrange(40)
+        if rng.random() < 0.2:
+            index.remove(str(i))
+            current.pop(str(i), None)
+            if str(i) in order:
+                order.remove(str(i))
+            continue
+        m = _market(i, rng.choice([0, 5, 10, 20]), rng.choice([0, 1, 2]))
+        index.upsert(candidate_from_market(m))
+        if str(i) not in order:
+            order.append(str(i))
+        current[str(i)] = m
+    markets = [current[i] for i in order if i in current]
+    expected = sorted(markets, key=lambda m: (float(m["liquidityNum"]), float(m["volume24hr"])), reverse=True)
+    assert _ids(index.top(len(index))) == [m["id"] for m in expected]
+
+
+def test_unchanged_upsert_is_noop_and_top_skips_expiring() -> None:
+    index = CandidateIndex([candidate_from_market(_market(1, 10)), candidate_from_market(_market(2, 5, hours=30))])
+    assert index.upsert(candidate_from_market(_market(1, 10))) is False
+    assert index.upsert(candidate_from_market(_market(2, 50, hours=30))) is True
+    assert _ids(index.top(5)) == ["2", "1"]
+    assert _ids(index.top(5, min_end_ts=time.time() + 48 * 3600)) == ["1"]
+    assert _ids(index.top(1)) == ["2"]
+
+
+def _apply(catalogue, *markets) -> CatalogueDiff:
+    diff = CatalogueDiff(mode="test")
+    with catalogue._conn:
+        for m in markets:
+            catalogue._apply(m, diff)
+    return diff
+
+
+def test_catalogue_ranking_applies_diffs(tmp_path) -> None:
+    catalogue = GammaCatalogue(str(tmp_path / "c.sqlite"))
+    _apply(catalogue, _market(1, 10), _market(2, 20), _market(3, 30))
+    ranking = CatalogueRanking(catalogue)
+    assert _ids(ranking.top(10)) == ["3", "2", "1"]
+    assert ranking.top(1)[0].yes_token == "yes3"
+
+    diff = _apply(catalogue, _market(1, 99), _market(2, 20, restricted=True), _market(4, 25), dict(_market(3, 30), closed=True))
+    assert ranking.refresh(diff) == 4
+    assert _ids(ranking.top(10)) == ["1", "4"]
+    assert catalogue.get_market("4")["liquidityNum"] == 25
+
+
+def test_old_catalogue_rows_are_backfilled(tmp_path) -> None:
+    path = str(tmp_path / "old.sqlite")
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE gamma_markets (id TEXT PRIMARY KEY, digest TEXT NOT NULL, updated_ts REAL, "
+        "payload TEXT NOT NULL, static_ok INTEGER NOT NULL, reason TEXT NOT NULL, end_ts REAL, "
+        "liquidity REAL NOT NULL, volume REAL NOT NULL)"
+    )
+    conn.execute(
+        "INSERT INTO gamma_markets VALUES ('7', 'd', NULL, ?, 1, 'OK', ?, 5, 0)",
+        (json.dumps(_market(7, 5)), time.time() + 86400 * 3),
+    )
+    conn.commit()
+    conn.close()
+
+    [candidate] = GammaCatalogue(path).ranked_candidates()
+    assert (candidate.yes_token, candidate.no_token, candidate.parse_reason) == ("yes7", "no7", FailureReason.OK)
@@ -0,0 +1,108 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from polymarket import clob_readiness
+from polymarket.clob_readiness import probe_clob_readiness_batch, select_best_clob_candidate
+from polymarket.contract import FailureReason, ReadinessStatus
+
+
+def _resp(status_code: int, payload=None) -> MagicMock:
+    resp = MagicMock(status_code=status_code)
+    resp.json.return_value = payload
+    return resp
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache(monkeypatch):
+    monkeypatch.delenv("POLYMARKET_PROBE_CACHE_PATH", raising=False)
+    monkeypatch.delenv("POLYMARKET_FIXTURE_MODE", raising=False)
+    clob_readiness._probe_cache.clear()
+    yield
+    clob_readiness._probe_cache.clear()
+
+
+def test_one_round_trip_with_single_fallback_for_missing() -> None:
+    batch = _resp(200, {"tok-a": "0.45", "tok-b": None})
+    no_book = _resp(404, {"error": "No orderbook exists for the requested token id"})
+    with patch("polymarket.clob_readiness.requests.post", return_value=batch) as post, \
+            patch("polymarket.clob_readiness.requests.get", return_value=no_book) as get:
+        results = probe_clob_readiness_batch(["tok-a", "tok-b", "tok-c"])
+
+    assert post.call_count == 1
+    assert post.call_args.kwargs["json"] == [{"token_id": t} for t in ("tok-a", "tok-b", "tok-c")]
+    assert tuple(results["tok-a"]) == (ReadinessStatus.READY, FailureReason.OK, {"mid": "0.45"})
+    assert results["tok-b"].reason == FailureReason.CLOB_INVALID_PAYLOAD
+    assert results["tok-c"].reason == FailureReason.CLOB_NO_ORDERBOOK
+    assert get.call_count == 1
+    assert set(clob_readiness._probe_cache) == {"tok-a", "tok-b", "tok-c"}
+
+
+def test_rejected_batch_resolves_each_token_singly() -> None:
+    rejected = _resp(404, {"error": "No orderbook exists for the requested token id"})
+    ready = _resp(200, {"mid": "0.5"})
+    with patch("polymarket.clob_readiness.requests.post", return_value=rejected), \
+            patch("polymarket.clob_readiness.requests.get", return_value=ready) as get:
+        results = probe_clob_readiness_batch(["t1", "t2"])
+    assert get.call_count == 2
+    assert all(r.status == ReadinessStatus.READY for r in results.values())
+
+
+def test_without_fallback_unresolved_are_left_out() -> None:
+    with patch("polymarket.clob_readiness.requests.post", return_value=_resp(400, {"error": "bad"})):
+        assert probe_clob_readiness_batch(["t1"], fallback=False) == {}
+
+
+def test_rate_limited_batch_marks_every_token_retryable() -> None:
+    with patch("polymarket.clob_readiness.requests.post", return_value=_resp(429, {})) as post, \
+            patch("polymarket.clob_readiness.time.sleep"):
+        results = probe_clob_readiness_batch(["t1", "t2"])
+    assert post.call_count == clob_readiness.MAX_RETRIES + 1
+    assert {(r.status, r.reason) for r in results.values()} == {
+        (ReadinessStatus.RETRYABLE_ERROR, FailureReason.CLOB_RATE_LIMITED)
+    }
+
+
+def test_cached_tokens_and_chunking() -> None:
+    clob_readiness._add_to_cache("cached", (ReadinessStatus.READY, FailureReason.OK, {}), ReadinessStatus.READY, FailureReason.OK)
+    tokens = ["cached"] + [f"t{i}" for i in range(clob_readiness.MAX_PROBES_PER_RUN + 5)]
+
+    def post(url, json=None, timeout=None):
+        return _resp(200, {item["token_id"]: "0.5" for item in json})
+
+    with patch("polymarket.clob_readiness.requests.post", side_effect=post) as mock_post:
+        results = probe_clob_readiness_batch(tokens)
+    assert mock_post.call_count == 2
+    assert "cached" not in [item["token_id"] for call in mock_post.call_args_list for item in call.kwargs["json"]]
+    assert len(results) == len(tokens)
+
+
+def test_selection_uses_batch_when_enabled(monkeypatch) -> None:
+    monkeypatch.setenv("POLYMARKET_PROBE_BATCH", "1")
+    end = (datetime.now(timezone.utc) + timedelta(days=2)).isoformat()
+    markets = [
+        {"id": f"m{i}", "enableOrderBook": True, "acceptingOrders": True, "endDateIso": end,
+         "liquidityNum": i, "clobTokenIds": [f"yes{i}", f"no{i}"], "outcomes": ["Yes", "No"]}
+        for i in range(3)
+    ]
+    batch = _resp(200, {"yes0": "0.5", "yes1": "0.5", "yes2": "0.5"})
+    with patch.object(clob_readiness, "discover_gamma_candidates", return_value=markets), \
+            patch("polymarket.clob_readiness.requests.post", return_value=batch) as post, \
+            patch("polymarket.clob_readiness.requests.get") as get:
+        result = select_best_clob_candidate(max_probes=3)
+    assert result.selected_market_id == "m2"
+    assert post.call_count == 1
+    get.assert_not_called()
+
+
+def test_use_cache_false_also_bypasses_cache_in_fallback() -> None:
+    clob_readiness._add_to_cache(
+        "t1", (ReadinessStatus.READY, FailureReason.OK, {}), ReadinessStatus.READY, FailureReason.OK
+    )
+    rejected = _resp(404, {"error": "No orderbook exists for the requested token id"})
+    with patch("polymarket.clob_readiness.requests.post", return_value=rejected), \
+            patch("polymarket.clob_readiness.requests.get", return_value=rejected) as get:
+        results = probe_clob_readiness_batch(["t1"], use_cache=False)
+    assert get.call_count == 1
+    assert results["t1"].reason == FailureReason.CLOB_NO_ORDERBOOK
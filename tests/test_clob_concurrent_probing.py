@@ -0,0 +1,127 @@
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from polymarket import clob_readiness
+from polymarket.clob_readiness import ProbeRequestGate, probe_clob_readiness, select_best_clob_candidate
+from polymarket.contract import FailureReason, ReadinessStatus
+
+
+def _market(market_id: str, liquidity: float) -> dict:
+    return {
+        "id": market_id,
+        "enableOrderBook": True,
+        "acceptingOrders": True,
+        "restricted": False,
+        "endDateIso": (datetime.now(timezone.utc) + timedelta(days=2)).isoformat(),
+        "liquidityNum": liquidity,
+        "volume24hr": 0,
+        "clobTokenIds": [f"yes_{market_id}", f"no_{market_id}"],
+        "outcomes": ["Yes", "No"],
+    }
+
+
+def _probe_by_token(answers: dict, delays: dict):
+    def probe(token_id, gate=None):
+        time.sleep(delays.get(token_id, 0))
+        return answers[token_id], FailureReason.OK if answers[token_id] == ReadinessStatus.READY else FailureReason.CLOB_NO_ORDERBOOK, {}
+    return probe
+
+
+def test_highest_ranked_ready_wins_even_if_slower() -> None:
+    markets = [_market("low", 10), _market("high", 100)]
+    answers = {"yes_high": ReadinessStatus.READY, "yes_low": ReadinessStatus.READY}
+    with patch.object(clob_readiness, "discover_gamma_candidates", return_value=markets), \
+            patch.object(clob_readiness, "probe_clob_readiness", side_effect=_probe_by_token(answers, {"yes_high": 0.1})):
+        result = select_best_clob_candidate(max_probes=5, concurrency=4)
+    assert result.selected_market_id == "high"
+    assert result.probes_attempted == 1
+
+
+def test_returns_without_waiting_for_lower_ranked_probes() -> None:
+    markets = [_market("a", 300), _market("b", 200), _market("c", 100)]
+    release = threading.Event()
+
+    def probe(token_id, gate=None):
+        if token_id == "yes_c":
+            release.wait(5)
+            return ReadinessStatus.READY, FailureReason.OK, {}
+        if token_id == "yes_a":
+            return ReadinessStatus.NOT_READY, FailureReason.CLOB_NO_ORDERBOOK, {}
+        return ReadinessStatus.READY, FailureReason.OK, {}
+
+    with patch.object(clob_readiness, "discover_gamma_candidates", return_value=markets), \
+            patch.object(clob_readiness, "probe_clob_readiness", side_effect=probe):
+        started = time.monotonic()
+        result = select_best_clob_candidate(max_probes=5, concurrency=3)
+        elapsed = time.monotonic() - started
+    release.set()
+    assert result.selected_market_id == "b"
+    assert result.probes_attempted == 2
+    assert elapsed < 1.0
+
+
+def test_gate_enforces_budget_rate_and_close() -> None:
+    gate = ProbeRequestGate(budget=3, rate_per_sec=20)
+    started = time.monotonic()
+    assert [gate.acquire() for _ in range(4)] == [True, True, True, False]
+    assert time.monotonic() - started >= 0.09
+    assert gate.used == 3 and gate.denied == 1
+
+    gate = ProbeRequestGate(budget=10, rate_per_sec=0)
+    gate.close()
+    assert gate.acquire() is False
+
+
+def test_gate_from_env_prefers_explicit_values(monkeypatch) -> None:
+    monkeypatch.setenv("POLYMARKET_PROBE_REQUEST_BUDGET", "7")
+    monkeypatch.setenv("POLYMARKET_PROBE_RATE_PER_SEC", "4")
+    gate = ProbeRequestGate.from_env()
+    assert (gate.budget, gate.interval) == (7, 0.25)
+    assert ProbeRequestGate.from_env(budget=2).budget == 2
+
+    monkeypatch.setenv("POLYMARKET_PROBE_REQUEST_BUDGET", "lots")
+    with pytest.raises(ValueError, match="POLYMARKET_PROBE_REQUEST_BUDGET"):
+        ProbeRequestGate.from_env()
+
+
+def test_exhausted_budget_skips_http_and_is_not_cached() -> None:
+    gate = ProbeRequestGate(budget=0, rate_per_sec=0)
+    with patch("polymarket.clob_readiness.requests.get") as mock_get:
+        status, reason, _ = probe_clob_readiness("tok-budget", gate=gate)
+    assert status == ReadinessStatus.RETRYABLE_ERROR
+    assert reason == FailureReason.CLOB_BUDGET_EXHAUSTED
+    mock_get.assert_not_called()
+    assert "tok-budget" not in clob_readiness._probe_cache
+
+
+def test_budget_exhausted_higher_rank_stops_selection() -> None:
+    markets = [_market("high", 100), _market("low", 10)]
+
+    def probe(token_id, gate=None):
+        if token_id == "yes_high":
+            time.sleep(0.05)
+            return ReadinessStatus.RETRYABLE_ERROR, FailureReason.CLOB_BUDGET_EXHAUSTED, {}
+        return ReadinessStatus.READY, FailureReason.OK, {}
+
+    with patch.object(clob_readiness, "discover_gamma_candidates", return_value=markets), \
+            patch.object(clob_readiness, "probe_clob_readiness", side_effect=probe):
+        result = select_best_clob_candidate(max_probes=5, concurrency=2)
+    assert result.selected_market_id is None
+    assert result.readiness_status == ReadinessStatus.NOT_READY
+    assert result.failure_reason == FailureReason.CLOB_BUDGET_EXHAUSTED
+
+
+def test_closing_the_gate_interrupts_retry_backoff() -> None:
+    gate = ProbeRequestGate(budget=10, rate_per_sec=0)
+    threading.Timer(0.05, gate.close).start()
+    with patch("polymarket.clob_readiness.requests.get", return_value=type("R", (), {"status_code": 503})()), \
+            patch.object(clob_readiness, "MAX_BACKOFF_SECONDS", 5.0), \
+            patch.object(clob_readiness, "BASE_BACKOFF_SECONDS", 5.0):
+        started = time.monotonic()
+        status, reason, _ = probe_clob_readiness("tok-closed", gate=gate)
+    assert time.monotonic() - started < 1.0
+    assert reason == FailureReason.CLOB_BUDGET_EXHAUSTED
@@ -0,0 +1,93 @@
+import os
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from recorder.columnar_journal import ColumnarJournal, read_columnar_journal
+from recorder.journal_schema import JOURNAL_COLUMNS
+from strategies.reasons import ReasonCode
+
+HOUR_MS = 3_600_000
+BASE_TS = 1_700_000_000_000 - (1_700_000_000_000 % HOUR_MS)
+
+
+def _row(i: int, ts: int = BASE_TS) -> dict:
+    return {
+        "ts": ts + i,
+        "market_id": "KXTEST",
+        "official_mid": "97000.5",
+        "official_ok": "true",
+        "edge_net_bps": 12.5,
+        "reason": ReasonCode.EDGE_OK,
+        "filter_reason": "",
+        "open_markets": "3",
+    }
+
+
+@pytest.mark.parametrize("fmt", ["arrow", "parquet"])
+def test_roundtrip_typed_columns(tmp_path, fmt) -> None:
+    with ColumnarJournal(str(tmp_path), fmt=fmt, batch_rows=2) as journal:
+        for i in range(5):
+            journal.record_decision(_row(i))
+    assert journal.rows_written == 5
+
+    table = read_columnar_journal(str(tmp_path))
+    assert table.num_rows == 5
+    assert table.column_names == JOURNAL_COLUMNS
+    first = table.slice(0, 1).to_pylist()[0]
+    assert first["ts"] == BASE_TS
+    assert first["official_mid"] == 97000.5
+    assert first["official_ok"] is True
+    assert first["reason"] == "EDGE_OK"
+    assert first["open_markets"] == 3
+    assert first["filter_reason"] == ""
+    assert first["pm_yes_bid"] is None
+
+
+def test_reader_selects_columns(tmp_path) -> None:
+    with ColumnarJournal(str(tmp_path), fmt="parquet") as journal:
+        journal.record_decision(_row(0))
+    table = read_columnar_journal(str(tmp_path), ["ts", "edge_net_bps"])
+    assert table.column_names == ["ts", "edge_net_bps"]
+
+
+def test_rotates_on_hour_boundary(tmp_path) -> None:
+    with ColumnarJournal(str(tmp_path), fmt="arrow") as journal:
+        journal.record_decision(_row(0))
+        journal.record_decision(_row(1))
+        journal.record_decision(_row(0, ts=BASE_TS + HOUR_MS))
+    assert len(journal.files) == 2
+    names = sorted(os.path.basename(f) for f in journal.files)
+    assert names[0].endswith("_0001.arrows")
+    assert read_columnar_journal(str(tmp_path)).num_rows == 3
+
+
+def test_rotates_on_size(tmp_path) -> None:
+    with ColumnarJournal(str(tmp_path), fmt="arrow", batch_rows=1, rotate_mb=1e-6) as journal:
+        for i in range(3):
+            journal.record_decision(_row(i))
+    assert len(journal.files) == 3
+    assert read_columnar_journal(str(tmp_path), ["ts"]).column("ts").to_pylist() == [
+        BASE_TS, BASE_TS + 1, BASE_TS + 2
+    ]
+
+
+def test_live_arrow_file_is_readable(tmp_path) -> None:
+    journal = ColumnarJournal(str(tmp_path), fmt="arrow", batch_rows=2)
+    for i in range(3):
+        journal.record_decision(_row(i))
+    assert read_columnar_journal(journal.current_path, ["ts"]).num_rows == 2
+    journal.close()
+    assert read_columnar_journal(str(tmp_path), ["ts"]).num_rows == 3
+
+
+def test_empty_directory_returns_empty_table(tmp_path) -> None:
+    table = read_columnar_journal(str(tmp_path), ["ts"])
+    assert table.num_rows == 0
+    assert table.column_names == ["ts"]
+
+
+def test_invalid_format_raises(tmp_path) -> None:
+    with pytest.raises(ValueError):
+        ColumnarJournal(str(tmp_path), fmt="orc")
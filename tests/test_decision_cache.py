@@ -0,0 +1,195 @@
+import csv
+import importlib.util
+import logging
+import sys
+import types
+from pathlib import Path
+
+from risk.rules import RiskRules
+from strategies.decision_cache import (
+    DecisionCache,
+    book_top_fingerprint,
+    gate_state,
+    official_fingerprint,
+)
+from strategies.reasons import ReasonCode
+from strategies.stale_edge import BookTop, Decision
+from venuebook.fingerprint import book_fingerprint
+from venuebook.ladder import BookLadder
+from venuebook.types import BookFailReason, BookStatus, VenueBook
+
+
+def _decision(
+    reason: str = ReasonCode.STALE_FEED, cancel_all: bool = False, action: str = "NO_TRADE"
+) -> Decision:
+    return Decision(
+        action=action,
+        reason=reason,
+        side=None,
+        price=None,
+        size=None,
+        implied_yes=None,
+        implied_no=None,
+        fair_up_prob=None,
+        edge_yes=None,
+        edge_no=None,
+        params_hash="",
+        cancel_all=cancel_all,
+    )
+
+
+def _book(ts: float, best_bid: float = 0.45, ladder: BookLadder = None) -> VenueBook:
+    return VenueBook(
+        venue="polymarket",
+        ts=ts,
+        best_bid=best_bid,
+        best_ask=0.47,
+        depth_qty_total=500.0,
+        depth_notional_total_usd=230.0,
+        status=BookStatus.OK,
+        fail_reason=None,
+        raw={"retention": "digest", "sha256": str(ts), "size_bytes": 1},
+        ladder=ladder,
+    )
+
+
+def test_book_fingerprint_ignores_ts_and_raw() -> None:
+    assert book_fingerprint(_book(1.0)) == book_fingerprint(_book(2.0))
+    assert book_fingerprint(_book(1.0)) != book_fingerprint(_book(1.0, best_bid=0.44))
+
+
+def test_book_fingerprint_sees_ladder_levels() -> None:
+    a = BookLadder.from_levels([(0.45, 10.0), (0.44, 5.0)], [(0.47, 10.0)])
+    b = BookLadder.from_levels([(0.45, 10.0), (0.44, 6.0)], [(0.47, 10.0)])
+    assert book_fingerprint(_book(1.0, ladder=a)) != book_fingerprint(_book(1.0, ladder=b))
+
+
+def test_book_fingerprint_failure_books() -> None:
+    fail = VenueBook(
+        venue="kalshi",
+        ts=1.0,
+        best_bid=None,
+        best_ask=None,
+        depth_qty_total=0.0,
+        depth_notional_total_usd=None,
+        status=BookStatus.NO_TRADE,
+        fail_reason=BookFailReason.NO_BBO,
+    )
+    assert book_fingerprint(fail) == book_fingerprint(fail)
+    assert book_fingerprint(fail) != book_fingerprint(_book(1.0))
+
+
+def test_official_and_book_top_fingerprints() -> None:
+    assert official_fingerprint(100.0, 5, "coinbase") == official_fingerprint(100.0, 5, "coinbase")
+    assert official_fingerprint(100.0, 5, "coinbase") != official_fingerprint(100.0, 6, "coinbase")
+    top = BookTop(yes_bid=0.4, yes_ask=0.5, no_bid=0.5, no_ask=0.6, ts_ms=1)
+    moved = BookTop(yes_bid=0.4, yes_ask=0.5, no_bid=0.5, no_ask=0.6, ts_ms=2)
+    assert book_top_fingerprint(top) == book_top_fingerprint(moved)
+    assert book_top_fingerprint(None) == "-"
+
+
+def test_gate_state_flips_when_official_goes_stale() -> None:
+    rules = RiskRules()
+    end_ms = 10_000_000
+    fresh = gate_state(rules, 1_000_000, 1_000_000 - 1_000, 1_000_000, end_ms)
+    stale = gate_state(rules, 1_000_000, 1_000_000 - 20_000, 1_000_000, end_ms)
+    assert fresh != stale
+
+
+def test_cache_hits_only_for_same_key_within_window() -> None:
+    cache = DecisionCache(max_reuse_ms=1_000)
+    decision = _decision()
+    cache.store("k", decision, now_ms=0)
+
+    assert cache.lookup("k", now_ms=500) is decision
+    assert cache.lookup("other", now_ms=600) is None
+    assert cache.lookup("k", now_ms=1_500) is None
+    assert cache.evaluations == 1
+    assert cache.skipped == 1
+
+
+def test_limiter_and_cancel_decisions_are_not_cached() -> None:
+    cache = DecisionCache()
+    cache.store("k", _decision(reason=ReasonCode.RATE_LIMIT), now_ms=0)
+    assert cache.lookup("k", now_ms=1) is None
+
+    cache.store("k", _decision(reason=ReasonCode.END_TIME_ANOMALY, cancel_all=True), now_ms=0)
+    assert cache.lookup("k", now_ms=1) is None
+
+
+def test_only_input_determined_no_trades_are_cached() -> None:
+    cache = DecisionCache()
+    for decision in (
+        _decision(reason=ReasonCode.EXPOSURE_CAP),
+        _decision(reason=ReasonCode.EDGE_TOO_SMALL),
+        _decision(reason=ReasonCode.MODEL_WARMUP),
+        _decision(reason=ReasonCode.EDGE_OK, action="PLACE_ORDER"),
+    ):
+        cache.store("k", decision, now_ms=0)
+        assert cache.lookup("k", now_ms=1) is None
+    cache.store("k", _decision(reason=ReasonCode.STALE_BOOK), now_ms=0)
+    assert cache.lookup("k", now_ms=1).reason == ReasonCode.STALE_BOOK
+
+
+def _load_runner():
+    path = Path(__file__).resolve().parents[1] / "scripts" / "run_shadow_stale_edge.py"
+    spec = importlib.util.spec_from_file_location("run_shadow_stale_edge_under_test", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _run_runner(monkeypatch, caplog, output: Path, *extra: str):
+    runner = _load_runner()
+    clock = {"now": 1_700_000_000.0}
+    start_ms = int(clock["now"] * 1000)
+    fake_time = types.SimpleNamespace(
+        time=lambda: clock["now"],
+        sleep=lambda sec: clock.__setitem__("now", clock["now"] + sec),
+    )
+    monkeypatch.setattr(runner, "time", fake_time)
+
+    def official(symbol_pair):
+        now_ms = int(clock["now"] * 1000)
+        tick = (now_ms - start_ms) // 1000
+        if tick < 8:
+            # One old tick repeated: STALE_FEED with unchanged inputs.
+            return 100.0, start_ms - 20_000, None, "binance"
+        # A new official tick every second loop iteration.
+        ts_ms = start_ms + (tick - tick % 2) * 1000
+        return 100.0 + (tick // 2) % 3, ts_ms, None, "binance"
+
+    monkeypatch.setattr(runner, "get_official_price", official)
+    monkeypatch.setenv("STALE_EDGE_MODEL_HORIZON_SEC", "1")
+    monkeypatch.setenv("STALE_EDGE_MODEL_WARMUP_SAMPLES", "2")
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["run_shadow_stale_edge.py", "--mode", "sim", "--minutes", "1", "--output", str(output), *extra],
+    )
+    caplog.clear()
+    with caplog.at_level(logging.INFO, logger="stale_edge_shadow"):
+        assert runner.main() == 0
+    summary = [r.getMessage() for r in caplog.records if r.getMessage().startswith("summary ")]
+    with open(output, newline="") as f:
+        rows = list(csv.DictReader(f))
+    return summary, rows
+
+
+def test_skip_unchanged_matches_full_evaluation(tmp_path, monkeypatch, caplog) -> None:
+    monkeypatch.delenv("TRADE_JOURNAL_ROTATE_MB", raising=False)
+    monkeypatch.delenv("TRADE_JOURNAL_ROTATE_INTERVAL_SEC", raising=False)
+    full_summary, full_rows = _run_runner(monkeypatch, caplog, tmp_path / "full.csv")
+    skip_summary, skip_rows = _run_runner(
+        monkeypatch, caplog, tmp_path / "skip.csv", "--skip-unchanged"
+    )
+
+    assert full_summary == skip_summary and len(full_summary) == 1
+    assert [r["reason"] for r in skip_rows] == [r["reason"] for r in full_rows]
+    unchanged = [r for r in skip_rows if r["action"] == "UNCHANGED"]
+    assert unchanged and {r["reason"] for r in unchanged} == {ReasonCode.STALE_FEED}
+    actions = [r["action"] for r in full_rows]
+    assert [a for a, r in zip(actions, skip_rows) if r["action"] != "UNCHANGED"] == [
+        r["action"] for r in skip_rows if r["action"] != "UNCHANGED"
+    ]
+    assert {r["reason"] for r in full_rows} - {ReasonCode.STALE_FEED}
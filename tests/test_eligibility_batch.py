@@ -0,0 +1,102 @@
+import random
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import numpy as np
+
+from polymarket import clob_readiness
+from polymarket.contract import FailureReason
+from polymarket.eligibility_batch import REASONS, MarketColumns, filter_markets, skip_counts
+
+NOW = datetime.now(timezone.utc)
+FLAGS = [True, False, None, 0, 1, "true", ""]
+
+
+def _end_date(rng: random.Random):
+    choice = rng.randrange(10)
+    if choice < 5:
+        hours = rng.choice([-5, 1, 23, 25, 48, 24 * 30])
+        return (NOW + timedelta(hours=hours)).isoformat().replace("+00:00", rng.choice(["Z", "+00:00"]))
+    if choice == 5:
+        return (NOW + timedelta(days=rng.choice([5, 40]))).date().isoformat()
+    return rng.choice([None, "", "soon", "2025-13-01", 12345, ["x"], []])
+
+
+def _market(rng: random.Random, i: int):
+    m = {
+        "id": str(i),
+        "enableOrderBook": rng.choice(FLAGS[:2]) if rng.random() < 0.8 else rng.choice(FLAGS),
+        "acceptingOrders": rng.choice(FLAGS[:2]) if rng.random() < 0.8 else rng.choice(FLAGS),
+        "closed": rng.random() < 0.1,
+        "restricted": rng.random() < 0.1,
+        "endDateIso": _end_date(rng),
+        "liquidityNum": rng.choice([0, 10.5, "250", None, "n/a"]),
+        "volume24hr": rng.random() * 1000,
+        "clobTokenIds": [f"y{i}", f"n{i}"],
+        "outcomes": ["Yes", "No"],
+    }
+    if rng.random() < 0.1:
+        del m["endDateIso"]
+    return m
+
+
+def test_reasons_agree_with_scalar_filter():
+    rng = random.Random(7)
+    markets = [_market(rng, i) for i in range(3000)]
+    codes = MarketColumns.from_markets(markets).reason_codes()
+    vector = [REASONS[c] for c in codes]
+    scalar = [clob_readiness._is_market_eligible(m)[1] for m in markets]
+    assert vector == scalar
+    assert set(scalar) == set(REASONS)
+
+
+def test_columns_and_skip_counts():
+    markets = [
+        {"enableOrderBook": True, "acceptingOrders": True, "endDateIso": "2099-01-01", "liquidityNum": "12.5"},
+        {"enableOrderBook": False, "endDateIso": "2099-01-01"},
+        {"enableOrderBook": True, "acceptingOrders": True, "endDateIso": "bad"},
+        {"enableOrderBook": True, "acceptingOrders": True, "endDateIso": "2000-01-01"},
+    ]
+    cols = MarketColumns.from_markets(markets)
+    assert cols.liquidity.tolist() == [12.5, 0.0, 0.0, 0.0]
+    assert np.isnan(cols.end_ts[2])
+    codes = cols.reason_codes()
+    assert skip_counts(codes) == {"ORDERBOOK_DISABLED": 1, "BAD_DATE_FORMAT": 1, "EXPIRING_SOON": 1}
+
+    eligible, counts = filter_markets(markets)
+    assert eligible == [markets[0]]
+    assert sum(counts.values()) == 3
+
+
+def test_expiry_window_uses_given_now():
+    end = NOW + timedelta(hours=30)
+    cols = MarketColumns.from_markets(
+        [{"enableOrderBook": True, "acceptingOrders": True, "endDateIso": end.isoformat()}]
+    )
+    assert cols.reason_codes(NOW.timestamp())[0] == 0
+    assert REASONS[cols.reason_codes((NOW + timedelta(hours=7)).timestamp())[0]] == FailureReason.EXPIRING_SOON
+
+
+def test_streaming_counts_match_scalar_walk(monkeypatch):
+    monkeypatch.delenv("POLYMARKET_GAMMA_CATALOGUE_PATH", raising=False)
+    monkeypatch.setenv("POLYMARKET_GAMMA_PAGE_SIZE", "7")
+    rng = random.Random(3)
+    markets = [dict(_market(rng, i), liquidityNum=rng.random()) for i in range(200)]
+
+    for target in (1, 5, 20, 500):
+        seen = skipped = 0
+        ids = []
+        for m in markets:
+            seen += 1
+            if clob_readiness._is_market_eligible(m)[0]:
+                ids.append(m["id"])
+                if len(ids) >= target:
+                    break
+            else:
+                skipped += 1
+
+        with patch("polymarket.clob_readiness.discover_gamma_candidates", return_value=iter(markets)):
+            got_seen, ranked, got_skipped, _ = clob_readiness.rank_clob_candidates(target)
+        assert (got_seen, got_skipped) == (seen, skipped)
+        assert Counter(c.market_id for c in ranked) == Counter(ids)
@@ -0,0 +1,230 @@
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from polymarket import clob_readiness
+from polymarket.contract import FailureReason, ReadinessStatus
+from polymarket.gamma_catalogue import MODE_FULL, MODE_INCREMENTAL, GammaCatalogue
+
+
+def _iso(ts: float) -> str:
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat()
+
+
+def _market(i: int, updated: float, **overrides) -> dict:
+    market = {
+        "id": str(i),
+        "active": True,
+        "closed": False,
+        "enableOrderBook": True,
+        "acceptingOrders": True,
+        "restricted": False,
+        "endDateIso": _iso(time.time() + 3 * 86400),
+        "updatedAt": _iso(updated),
+        "liquidityNum": 100 + i,
+        "volume24hr": 0,
+        "clobTokenIds": [f"yes_{i}", f"no_{i}"],
+        "outcomes": ["Yes", "No"],
+    }
+    market.update(overrides)
+    return market
+
+
+class FakeGamma:
+    """Serves /markets from a dict, honouring order/offset/limit and ETags."""
+
+    def __init__(self, markets):
+        self.markets = {m["id"]: m for m in markets}
+        self.calls = []
+        self.etag = "v1"
+
+    def get(self, url, params=None, timeout=None, headers=None):
+        self.calls.append((dict(params), dict(headers or {})))
+        if headers and headers.get("If-None-Match") == self.etag:
+            return MagicMock(status_code=304, headers={})
+        rows = list(self.markets.values())
+        if params.get("closed") == "false":
+            rows = [m for m in rows if not m["closed"]]
+        if params["order"] == "updatedAt":
+            rows.sort(key=lambda m: m["updatedAt"], reverse=True)
+        else:
+            rows.sort(key=lambda m: int(m["id"]))
+        start = params["offset"]
+        resp = MagicMock(status_code=200, headers={"ETag": self.etag})
+        resp.json.return_value = rows[start:start + params["limit"]]
+        return resp
+
+
+@pytest.fixture(autouse=True)
+def _reset_backoff(monkeypatch):
+    monkeypatch.delenv("POLYMARKET_GAMMA_BACKOFF_PATH", raising=False)
+    monkeypatch.setattr(clob_readiness, "_gamma_backoff_until", 0.0)
+
+
+def _catalogue(tmp_path) -> GammaCatalogue:
+    return GammaCatalogue(str(tmp_path / "catalogue.sqlite"), page_size=3, full_resync_sec=3600)
+
+
+def test_full_then_incremental_diff(tmp_path) -> None:
+    t0 = time.time() - 1000
+    gamma = FakeGamma([_market(i, t0 + i) for i in range(7)])
+    catalogue = _catalogue(tmp_path)
+    with patch("polymarket.clob_readiness.requests.get", side_effect=gamma.get):
+        diff = catalogue.sync()
+        assert diff.mode == MODE_FULL and diff.complete
+        assert sorted(diff.added, key=int) == [str(i) for i in range(7)]
+        assert len(catalogue) == 7
+
+        gamma.etag = "v2"
+        gamma.markets["2"] = _market(2, t0 + 100, liquidityNum=999)
+        gamma.markets["5"] = _market(5, t0 + 101, closed=True)
+        gamma.markets["9"] = _market(9, t0 + 102)
+        gamma.calls.clear()
+        diff = catalogue.sync()
+
+    assert diff.mode == MODE_INCREMENTAL
+    assert (diff.added, diff.changed, diff.removed) == (["9"], ["2"], ["5"])
+    assert len(gamma.calls) == 2  # stopped at the watermark, not the whole catalogue
+    assert [m["id"] for m in catalogue.eligible_markets(limit=2)] == ["2", "9"]
+
+
+def test_not_modified_costs_one_request(tmp_path) -> None:
+    gamma = FakeGamma([_market(i, time.time() - 100) for i in range(4)])
+    catalogue = _catalogue(tmp_path)
+    with patch("polymarket.clob_readiness.requests.get", side_effect=gamma.get):
+        catalogue.sync()
+        catalogue.sync()  # first incremental sync records the ETag
+        gamma.calls.clear()
+        diff = catalogue.sync()
+    assert diff.not_modified and diff.churn == 0
+    assert len(gamma.calls) == 1
+
+
+def test_full_resync_removes_markets_missing_from_listing(tmp_path) -> None:
+    gamma = FakeGamma([_market(i, time.time() - 100) for i in range(4)])
+    catalogue = _catalogue(tmp_path)
+    with patch("polymarket.clob_readiness.requests.get", side_effect=gamma.get):
+        catalogue.sync()
+        del gamma.markets["1"]
+        diff = catalogue.sync(full=True)
+    assert diff.removed == ["1"] and diff.added == [] and diff.changed == []
+
+
+def test_truncated_full_sync_removes_nothing(tmp_path) -> None:
+    gamma = FakeGamma([_market(i, time.time() - 100) for i in range(9)])
+    catalogue = _catalogue(tmp_path)
+    with patch("polymarket.clob_readiness.requests.get", side_effect=gamma.get):
+        catalogue.sync()
+        diff = catalogue.sync(full=True, max_pages=1)
+    assert not diff.complete and diff.removed == []
+    assert len(catalogue) == 9
+
+
+def test_eligibility_stored_and_expiry_applied_at_query(tmp_path) -> None:
+    now = time.time()
+    markets = [
+        _market(1, now, enableOrderBook=False),
+        _market(2, now, endDateIso=_iso(now + 30 * 3600)),
+        _market(3, now, endDateIso="not a date"),
+        _market(4, now),
+    ]
+    gamma = FakeGamma(markets)
+    catalogue = _catalogue(tmp_path)
+    with patch("polymarket.clob_readiness.requests.get", side_effect=gamma.get):
+        catalogue.sync()
+    assert [m["id"] for m in catalogue.eligible_markets(now=now)] == ["4", "2"]
+    assert [m["id"] for m in catalogue.eligible_markets(now=now + 7 * 3600)] == ["4"]
+    assert catalogue.skip_counts(now=now + 7 * 3600) == {
+        FailureReason.ORDERBOOK_DISABLED.name: 1,
+        FailureReason.BAD_DATE_FORMAT.name: 1,
+        FailureReason.EXPIRING_SOON.name: 1,
+    }
+
+
+def test_selection_uses_catalogue_when_configured(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("POLYMARKET_GAMMA_CATALOGUE_PATH", str(tmp_path / "sel.sqlite"))
+    gamma = FakeGamma([_market(i, time.time() - 100) for i in range(3)] + [_market(7, time.time(), restricted=True)])
+    probe = MagicMock(return_value=(ReadinessStatus.READY, FailureReason.OK, {}))
+    with patch("polymarket.clob_readiness.requests.get", side_effect=gamma.get), \
+            patch.object(clob_readiness, "probe_clob_readiness", probe):
+        result = clob_readiness.select_best_clob_candidate(max_probes=5)
+    assert result.selected_market_id == "2"
+    assert result.skipped_count == 1
+
+
+def test_full_pass_longer_than_page_cap_resumes_across_syncs(tmp_path) -> None:
+    t0 = time.time() - 1000
+    # Liquidity grows with id, so the most liquid markets are at the end of the id-ordered listing.
+    gamma = FakeGamma([_market(i, t0 + i) for i in range(25)])
+    catalogue = _catalogue(tmp_path)
+    diffs = []
+    with patch("polymarket.clob_readiness.requests.get", side_effect=gamma.get):
+        for _ in range(5):
+            diffs.append(catalogue.sync(max_pages=2))
+            if not diffs[-1].complete:
+                assert catalogue.watermark is None
+        assert [d.mode for d in diffs] == [MODE_FULL] * 5
+        assert [d.complete for d in diffs] == [False] * 4 + [True]
+        assert catalogue.watermark is not None
+        assert len(catalogue) == 25
+
+        from polymarket.gamma_catalogue import CatalogueRanking
+        assert [c.market_id for c in CatalogueRanking(catalogue).top(3)] == ["24", "23", "22"]
+
+        gamma.calls.clear()
+        assert catalogue.sync().mode == MODE_INCREMENTAL
+
+
+def test_resumed_full_pass_removes_markets_unseen_in_the_pass(tmp_path) -> None:
+    gamma = FakeGamma([_market(i, time.time() - 100) for i in range(12)])
+    catalogue = _catalogue(tmp_path)
+    with patch("polymarket.clob_readiness.requests.get", side_effect=gamma.get):
+        catalogue.sync(max_pages=10)
+        first = catalogue.sync(full=True, max_pages=2)
+        del gamma.markets["10"]
+        second = catalogue.sync(max_pages=2)
+    assert first.mode == MODE_FULL and not first.complete and first.removed == []
+    assert second.mode == MODE_FULL and second.complete
+    assert second.removed == ["10"]
+    assert len(catalogue) == 11
+
+
+def test_pages_are_fetched_without_holding_a_write_transaction(tmp_path) -> None:
+    path = str(tmp_path / "shared.sqlite")
+    gamma = FakeGamma([_market(i, time.time() - 100) for i in range(9)])
+    catalogue = GammaCatalogue(path, page_size=3, full_resync_sec=3600)
+    other = GammaCatalogue(path, page_size=3, full_resync_sec=3600)
+    other._conn.execute("PRAGMA busy_timeout=100")
+
+    def get(url, params=None, timeout=None, headers=None):
+        if params["offset"] > 0:
+            # Another process writes while this one is between pages.
+            with other._conn:
+                other._set_state("other_writer", params["offset"])
+        return gamma.get(url, params=params, timeout=timeout, headers=headers)
+
+    with patch("polymarket.clob_readiness.requests.get", side_effect=get):
+        diff = catalogue.sync()
+    assert diff.complete and len(catalogue) == 9
+    assert other._get_state("other_writer") == "9"
+
+
+def test_catalogue_sync_errors_fall_back_to_stored_markets(tmp_path, monkeypatch) -> None:
+    import sqlite3
+
+    from polymarket.gamma_catalogue import GammaCatalogue as Catalogue
+
+    monkeypatch.setenv("POLYMARKET_GAMMA_CATALOGUE_PATH", str(tmp_path / "locked.sqlite"))
+    gamma = FakeGamma([_market(i, time.time() - 100) for i in range(3)])
+    with patch("polymarket.clob_readiness.requests.get", side_effect=gamma.get):
+        seen, ranked, _, _ = clob_readiness.rank_clob_candidates(5)
+    assert seen == 3
+
+    def locked(self, *args, **kwargs):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(Catalogue, "sync", locked)
+    seen, ranked, _, _ = clob_readiness.rank_clob_candidates(5)
+    assert seen == 3 and [c.market_id for c in ranked] == ["2", "1", "0"]
@@ -0,0 +1,123 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from polymarket import clob_readiness
+from polymarket.clob_readiness import iter_gamma_markets, select_best_clob_candidate
+from polymarket.contract import FailureReason, ReadinessStatus
+
+
+def _market(i: int, eligible: bool = True) -> dict:
+    return {
+        "id": f"m{i}",
+        "enableOrderBook": eligible,
+        "acceptingOrders": True,
+        "restricted": False,
+        "endDateIso": (datetime.now(timezone.utc) + timedelta(days=2)).isoformat(),
+        "liquidityNum": 1000 - i,
+        "volume24hr": 0,
+        "clobTokenIds": [f"yes_{i}", f"no_{i}"],
+        "outcomes": ["Yes", "No"],
+    }
+
+
+def _gamma(catalogue):
+    def get(url, params=None, timeout=None):
+        start = params["offset"]
+        resp = MagicMock(status_code=200)
+        resp.json.return_value = catalogue[start:start + params["limit"]]
+        return resp
+    return get
+
+
+@pytest.fixture(autouse=True)
+def _reset_backoff(monkeypatch):
+    monkeypatch.delenv("POLYMARKET_FIXTURE_MODE", raising=False)
+    monkeypatch.delenv("POLYMARKET_GAMMA_BACKOFF_PATH", raising=False)
+    monkeypatch.setattr(clob_readiness, "_gamma_backoff_until", 0.0)
+    monkeypatch.setattr(clob_readiness, "_gamma_backoff_attempt", 0)
+
+
+def test_pages_until_short_page() -> None:
+    catalogue = [_market(i) for i in range(25)]
+    stats = {}
+    with patch("polymarket.clob_readiness.requests.get", side_effect=_gamma(catalogue)) as mock_get:
+        markets = list(iter_gamma_markets(page_size=10, max_pages=5, stats=stats))
+    assert [m["id"] for m in markets] == [m["id"] for m in catalogue]
+    assert mock_get.call_count == 3
+    assert stats == {"pages": 3, "markets": 25, "rate_limited": False}
+    params = mock_get.call_args.kwargs["params"]
+    assert params["order"] == "liquidityNum" and params["ascending"] == "false"
+
+
+def test_max_pages_caps_requests() -> None:
+    catalogue = [_market(i) for i in range(100)]
+    with patch("polymarket.clob_readiness.requests.get", side_effect=_gamma(catalogue)) as mock_get:
+        assert len(list(iter_gamma_markets(page_size=10, max_pages=2))) == 20
+    assert mock_get.call_count == 2
+
+
+def test_selection_stops_paging_once_enough_eligible(monkeypatch) -> None:
+    monkeypatch.setenv("POLYMARKET_GAMMA_PAGE_SIZE", "4")
+    catalogue = [_market(i, eligible=i % 2 == 0) for i in range(40)]
+    probe = MagicMock(return_value=(ReadinessStatus.NOT_READY, FailureReason.CLOB_NO_ORDERBOOK, {}))
+    with patch("polymarket.clob_readiness.requests.get", side_effect=_gamma(catalogue)) as mock_get, \
+            patch.object(clob_readiness, "probe_clob_readiness", probe):
+        result = select_best_clob_candidate(max_probes=3)
+    assert mock_get.call_count == 2  # 6 markets seen, 3 eligible
+    assert result.skipped_count == 2
+    assert result.probes_attempted == 3
+    assert result.failure_reason == FailureReason.NO_READY_CANDIDATES
+
+
+def test_rate_limit_ends_stream_without_sleeping() -> None:
+    catalogue = [_market(i) for i in range(30)]
+    limited = MagicMock(status_code=429, headers={"Retry-After": "12"})
+    responses = _gamma(catalogue)
+
+    calls = []
+
+    def get(url, params=None, timeout=None):
+        calls.append(params["offset"])
+        return limited if params["offset"] == 10 else responses(url, params, timeout)
+
+    stats = {}
+    with patch("polymarket.clob_readiness.requests.get", side_effect=get), \
+            patch("polymarket.clob_readiness.time.sleep") as sleep:
+        assert len(list(iter_gamma_markets(page_size=10, max_pages=3, stats=stats))) == 10
+        assert stats["rate_limited"] is True
+        # Backoff pending: the next discovery makes no request at all.
+        assert list(iter_gamma_markets(page_size=10, max_pages=3)) == []
+    sleep.assert_not_called()
+    assert calls == [0, 10]
+    assert clob_readiness._gamma_backoff_until > 0
+
+
+def test_backoff_deadline_survives_process_restart(tmp_path, monkeypatch) -> None:
+    state_path = tmp_path / "gamma_backoff.json"
+    monkeypatch.setenv("POLYMARKET_GAMMA_BACKOFF_PATH", str(state_path))
+    limited = MagicMock(status_code=429, headers={})
+    with patch("polymarket.clob_readiness.requests.get", return_value=limited):
+        assert list(iter_gamma_markets(page_size=10, max_pages=1)) == []
+    assert state_path.exists()
+
+    # A fresh process starts with the in-memory deadline cleared.
+    monkeypatch.setattr(clob_readiness, "_gamma_backoff_until", 0.0)
+    monkeypatch.setattr(clob_readiness, "_gamma_backoff_attempt", 0)
+    assert 0 < clob_readiness.gamma_backoff_remaining() <= 30
+    with patch("polymarket.clob_readiness.requests.get") as mock_get:
+        assert list(iter_gamma_markets(page_size=10, max_pages=1)) == []
+    mock_get.assert_not_called()
+
+    # The attempt count carries over, so the next 429 backs off longer.
+    with patch("polymarket.clob_readiness.requests.get", return_value=limited):
+        assert clob_readiness.fetch_gamma_page({"offset": 0}) == (None, True)
+    assert 30 < clob_readiness.gamma_backoff_remaining() <= 60
+
+    # A successful page clears the persisted deadline.
+    catalogue = [_market(i) for i in range(3)]
+    with patch("polymarket.clob_readiness.requests.get", side_effect=_gamma(catalogue)):
+        resp, rate_limited = clob_readiness.fetch_gamma_page({"offset": 0, "limit": 10})
+    assert resp is not None and not rate_limited
+    assert not state_path.exists()
@@ -0,0 +1,94 @@
+import csv
+import os
+
+from recorder.journal_index import build_index, index_path_for, load_index, query_journal
+from recorder.trade_journal import TradeJournal
+
+
+def _row(i: int) -> dict:
+    return {
+        "ts": 1_000 + i,
+        "market_id": "A" if i < 50 else "B",
+        "action": "NO_TRADE",
+        "reason": "STALE" if i % 10 == 0 else "EDGE_TOO_SMALL",
+    }
+
+
+def _scan(path, **filters):
+    """Reference answer from a full csv.DictReader scan."""
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    out = []
+    for row in rows:
+        ts = int(row["ts"])
+        if "start_ts" in filters and ts < filters["start_ts"]:
+            continue
+        if "end_ts" in filters and ts >= filters["end_ts"]:
+            continue
+        if "market_id" in filters and row["market_id"] != filters["market_id"]:
+            continue
+        if "reason" in filters and row["reason"] != filters["reason"]:
+            continue
+        out.append(row)
+    return out
+
+
+def _write(path, count: int, index_every: int = 10, start: int = 0) -> None:
+    with TradeJournal(str(path), index_every=index_every) as journal:
+        for i in range(start, start + count):
+            journal.record_decision(_row(i))
+
+
+def test_writer_maintains_block_index(tmp_path) -> None:
+    path = tmp_path / "j.csv"
+    _write(path, 95)
+    entries = load_index(str(path))
+    assert [e["n"] for e in entries] == [10] * 9 + [5]
+    assert entries[0]["t0"] == 1_000 and entries[0]["t1"] == 1_009
+    assert entries[0]["m"] == ["A"]
+    assert entries[-1]["e"] == os.path.getsize(path)
+    assert all(a["e"] == b["o"] for a, b in zip(entries, entries[1:]))
+
+
+def test_query_skips_blocks_and_matches_full_scan(tmp_path) -> None:
+    path = tmp_path / "j.csv"
+    _write(path, 100)
+    stats = {}
+    rows = list(query_journal(str(path), start_ts=1_062, end_ts=1_075, market_id="B", stats=stats))
+    assert rows == _scan(path, start_ts=1_062, end_ts=1_075, market_id="B")
+    assert [int(r["ts"]) for r in rows] == list(range(1_062, 1_075))
+    assert stats["blocks_scanned"] == 2
+    assert stats["blocks_skipped"] == 8
+
+    rows = list(query_journal(str(path), reason="STALE", market_id="A"))
+    assert rows == _scan(path, reason="STALE", market_id="A")
+
+
+def test_unindexed_ranges_are_scanned(tmp_path) -> None:
+    path = tmp_path / "j.csv"
+    _write(path, 30, index_every=0)
+    assert not os.path.exists(index_path_for(str(path)))
+    _write(path, 30, start=30)
+
+    rows = list(query_journal(str(path), start_ts=1_005, end_ts=1_045))
+    assert rows == _scan(path, start_ts=1_005, end_ts=1_045)
+
+
+def test_build_index_matches_writer(tmp_path) -> None:
+    path = tmp_path / "j.csv"
+    _write(path, 95)
+    written = load_index(str(path))
+    assert build_index(str(path), every=10) == 10
+    assert load_index(str(path)) == written
+
+
+def test_quoted_newlines_keep_offsets_exact(tmp_path) -> None:
+    path = tmp_path / "j.csv"
+    with TradeJournal(str(path), index_every=2) as journal:
+        for i in range(6):
+            row = _row(i)
+            row["reason"] = "multi\nline" if i == 2 else row["reason"]
+            journal.record_decision(row)
+    build_index(str(path), every=2)
+    rows = list(query_journal(str(path), start_ts=1_002, end_ts=1_004))
+    assert [r["reason"] for r in rows] == ["multi\nline", "EDGE_TOO_SMALL"]
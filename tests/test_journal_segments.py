@@ -0,0 +1,140 @@
+import os
+import time
+
+import pytest
+
+from recorder.journal_segments import (
+    SegmentedTradeJournal,
+    iter_journal_rows,
+    load_manifest,
+    open_trade_journal,
+)
+from recorder.trade_journal import TradeJournal
+
+
+def _row(i: int) -> dict:
+    return {"ts": 1_000 + i, "market_id": "m1", "action": "NO_TRADE", "reason": "EDGE_TOO_SMALL"}
+
+
+def _write(journal, start: int, count: int) -> None:
+    for i in range(start, start + count):
+        journal.record_decision(_row(i))
+
+
+def test_rotates_on_size_and_compresses(tmp_path) -> None:
+    path = str(tmp_path / "decisions.csv")
+    journal = SegmentedTradeJournal(
+        path, rotate_mb=200 / (1024 * 1024), compression="gzip", flush_rows=1
+    )
+    _write(journal, 0, 20)
+    journal.wait_idle(5)
+
+    segments = load_manifest(path)["segments"]
+    assert journal.segments_rotated == len(segments) >= 2
+    for entry in segments:
+        assert entry["compression"] == "gzip"
+        assert entry["file"].endswith(".csv.gz")
+        assert os.path.exists(tmp_path / entry["file"])
+        assert entry["first_ts"] <= entry["last_ts"]
+    assert not any(name.endswith(".csv") and name != "decisions.csv" for name in os.listdir(tmp_path))
+
+    journal.close()
+    assert [int(r["ts"]) for r in iter_journal_rows(path)] == list(range(1_000, 1_020))
+
+
+def test_time_range_reads_skip_segments(tmp_path) -> None:
+    path = str(tmp_path / "decisions.csv")
+    with SegmentedTradeJournal(path, rotate_mb=0, compression="none") as journal:
+        _write(journal, 0, 5)
+        journal.rotate()
+        _write(journal, 5, 5)
+        journal.rotate()
+        _write(journal, 10, 5)
+        journal.wait_idle(5)
+
+    segments = load_manifest(path)["segments"]
+    assert [(e["first_ts"], e["last_ts"]) for e in segments] == [(1_000, 1_004), (1_005, 1_009)]
+    os.unlink(tmp_path / segments[0]["file"])  # proves the first segment is never opened
+    assert [int(r["ts"]) for r in iter_journal_rows(path, start_ts=1_006, end_ts=1_012)] == [
+        1_006, 1_007, 1_008, 1_009, 1_010, 1_011
+    ]
+
+
+def test_retention_deletes_oldest_segments(tmp_path) -> None:
+    path = str(tmp_path / "decisions.csv")
+    with SegmentedTradeJournal(
+        path, rotate_mb=0, compression="none", retention_mb=1000 / (1024 * 1024)
+    ) as journal:
+        for start in range(0, 20, 2):
+            _write(journal, start, 2)
+            journal.rotate()
+        journal.wait_idle(5)
+
+    segments = load_manifest(path)["segments"]
+    assert 0 < len(segments) < 10
+    assert sum(e["bytes"] for e in segments) <= 1000
+    assert segments[-1]["last_ts"] == 1_019
+    kept = {e["file"] for e in segments}
+    assert kept == {n for n in os.listdir(tmp_path) if n.startswith("decisions.") and n.count(".") > 1
+                    and not n.endswith((".json", ".idx"))}
+
+
+def test_pending_segment_is_finished_on_restart(tmp_path) -> None:
+    path = str(tmp_path / "decisions.csv")
+    journal = SegmentedTradeJournal(path, rotate_mb=0, compression="gzip")
+    _write(journal, 0, 3)
+    journal._compressor.close()  # simulate a crash before compression ran
+    journal._compressor.submit = lambda *a, **kw: True
+    journal.rotate()
+    journal._journal.close()
+    assert load_manifest(path)["segments"][0]["compression"] == "pending"
+
+    with SegmentedTradeJournal(path, rotate_mb=0, compression="gzip") as restarted:
+        restarted.wait_idle(5)
+    entry = load_manifest(path)["segments"][0]
+    assert entry["compression"] == "gzip"
+    assert [int(r["ts"]) for r in iter_journal_rows(path)] == [1_000, 1_001, 1_002]
+
+
+def test_zstd_segments(tmp_path) -> None:
+    pytest.importorskip("zstandard")
+    path = str(tmp_path / "decisions.csv")
+    with SegmentedTradeJournal(path, rotate_mb=0, compression="zstd") as journal:
+        _write(journal, 0, 3)
+        journal.rotate()
+        journal.wait_idle(5)
+    assert load_manifest(path)["segments"][0]["file"].endswith(".zst")
+    assert len(list(iter_journal_rows(path))) == 3
+
+
+def test_open_trade_journal_defaults_to_plain_journal(tmp_path, monkeypatch) -> None:
+    monkeypatch.delenv("TRADE_JOURNAL_ROTATE_MB", raising=False)
+    monkeypatch.delenv("TRADE_JOURNAL_ROTATE_INTERVAL_SEC", raising=False)
+    journal = open_trade_journal(str(tmp_path / "a.csv"))
+    assert isinstance(journal, TradeJournal)
+    journal.close()
+
+    monkeypatch.setenv("TRADE_JOURNAL_ROTATE_MB", "1")
+    journal = open_trade_journal(str(tmp_path / "b.csv"))
+    assert isinstance(journal, SegmentedTradeJournal)
+    journal.close()
+
+
+def test_reopened_active_segment_keeps_rows_and_age(tmp_path) -> None:
+    path = str(tmp_path / "decisions.csv")
+    two_minutes_ago = int(time.time() * 1000) - 120_000
+    with SegmentedTradeJournal(path, rotate_mb=0, compression="none") as journal:
+        for i in range(3):
+            journal.record_decision(dict(_row(i), ts=two_minutes_ago + i))
+
+    # The restarted process still sees a segment opened two minutes ago.
+    with SegmentedTradeJournal(
+        path, rotate_mb=0, rotate_interval_sec=60, compression="none"
+    ) as journal:
+        journal.record_decision(dict(_row(3), ts=two_minutes_ago + 3))
+        assert journal.segments_rotated == 1
+        journal.wait_idle(5)
+
+    [segment] = load_manifest(path)["segments"]
+    assert segment["rows"] == 4
+    assert (segment["first_ts"], segment["last_ts"]) == (two_minutes_ago, two_minutes_ago + 3)
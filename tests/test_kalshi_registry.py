@@ -0,0 +1,137 @@
+import json
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from eligibility.kalshi_rules import EligibilityResult, KalshiMarketInfo, check_kalshi_eligibility
+from venues.kalshi_fetch import KalshiFetchError, fetch_markets
+from venues.kalshi_registry import KalshiMarketRegistry
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "kalshi"
+RULES = "Resolved by the Coinbase BTC/USD spot price."
+
+
+def _market(ticker: str, close_time: str = "2030-01-01T00:00:00Z", rules: str = RULES) -> dict:
+    return {"ticker": ticker, "event_ticker": "KXBTC-30JAN01", "rules_primary": rules, "close_time": close_time}
+
+
+def _resp(payload, status_code=200) -> MagicMock:
+    resp = MagicMock(status_code=status_code)
+    resp.json.return_value = payload
+    return resp
+
+
+def test_fetch_markets_follows_cursor():
+    pages = [
+        _resp({"markets": [_market("A"), _market("B")], "cursor": "c1"}),
+        _resp({"markets": [_market("C")], "cursor": ""}),
+    ]
+    with patch("requests.get", side_effect=pages) as get:
+        markets = fetch_markets(series_ticker="KXBTC")
+    assert [m["ticker"] for m in markets] == ["A", "B", "C"]
+    assert get.call_args_list[0].kwargs["params"]["series_ticker"] == "KXBTC"
+    assert get.call_args_list[1].kwargs["params"]["cursor"] == "c1"
+
+    with patch("requests.get", return_value=_resp({}, status_code=429)):
+        with pytest.raises(KalshiFetchError):
+            fetch_markets(event_ticker="E")
+
+
+@pytest.mark.parametrize(
+    "meta",
+    [
+        _market("OK"),
+        _market("OLD", close_time="2020-01-01T00:00:00Z"),
+        _market("NOCLOSE", close_time=""),
+        _market("BADCLOSE", close_time="soon"),
+        _market("RULES", rules="Resolved by the outcome of the Super Bowl."),
+        {"ticker": "EMPTY"},
+        json.loads((FIXTURE_DIR / "market_metadata.json").read_text()),
+    ],
+)
+def test_precomputed_info_matches_check(meta):
+    info = KalshiMarketInfo.from_metadata(meta)
+    for now in (1_700_000_000.0, time.time()):
+        assert info.eligibility(now) == check_kalshi_eligibility(meta, now_ts=now)
+
+
+def test_bulk_listing_serves_tickers_without_single_fetches():
+    registry = KalshiMarketRegistry(ttl_sec=60)
+    listing = [_market("A"), _market("B", close_time="2020-01-01T00:00:00Z")]
+    with patch("venues.kalshi_fetch.fetch_markets", return_value=listing) as bulk, \
+            patch("venues.kalshi_fetch.fetch_market") as single:
+        infos = registry.load(series_ticker="KXBTC")
+        assert [i.ticker for i in infos] == ["A", "B"]
+        registry.load(series_ticker="KXBTC")
+        info = registry.get("A")
+    assert bulk.call_count == 1
+    single.assert_not_called()
+    assert info.source.venue == "coinbase"
+    assert info.close_ts == KalshiMarketInfo.from_metadata(_market("A")).close_ts
+    assert [i.ticker for i in registry.eligible()] == ["A"]
+
+
+def test_unlisted_ticker_fetched_once_then_cached():
+    registry = KalshiMarketRegistry(ttl_sec=60)
+    with patch("venues.kalshi_fetch.fetch_market", return_value=_market("X")) as single:
+        registry.get("X")
+        registry.get("X")
+    assert single.call_count == 1
+    assert registry.stats()["market_requests"] == 1
+
+
+def test_entries_expire_after_ttl():
+    registry = KalshiMarketRegistry(ttl_sec=0.05)
+    with patch("venues.kalshi_fetch.fetch_market", return_value=_market("X")) as single:
+        registry.get("X")
+        time.sleep(0.1)
+        registry.get("X")
+    assert single.call_count == 2
+    assert registry.stats()["markets"]["expired"] == 1
+
+
+def test_snapshot_round_trip(tmp_path):
+    path = str(tmp_path / "kalshi_registry.json")
+    first = KalshiMarketRegistry(path=path, ttl_sec=60)
+    with patch("venues.kalshi_fetch.fetch_markets", return_value=[_market("A"), _market("B")]):
+        first.load(event_ticker="KXBTC-30JAN01")
+    first.save()
+
+    second = KalshiMarketRegistry(path=path, ttl_sec=60)
+    with patch("venues.kalshi_fetch.fetch_markets") as bulk, patch("venues.kalshi_fetch.fetch_market") as single:
+        assert [i.ticker for i in second.load(event_ticker="KXBTC-30JAN01")] == ["A", "B"]
+        assert second.get("B").static_result == EligibilityResult.ELIGIBLE
+    bulk.assert_not_called()
+    single.assert_not_called()
+
+    # Stale snapshots are ignored.
+    stale = KalshiMarketRegistry(path=path, ttl_sec=0.0)
+    assert stale.eligible() == []
+
+
+def test_snapshot_skips_malformed_entries(tmp_path):
+    path = tmp_path / "kalshi_registry.json"
+    now = time.time()
+    path.write_text(json.dumps({
+        "format": "kalshi_registry_v1",
+        "markets": [
+            {"ticker": "A", "fetched_at": now, "metadata": _market("A")},
+            {"ticker": "B", "fetched_at": "later", "metadata": _market("B")},
+            {"ticker": "C", "metadata": _market("C")},
+            {"ticker": "D", "fetched_at": now, "metadata": "not a dict"},
+            "garbage",
+        ],
+        "listings": {
+            "ok": {"fetched_at": now, "tickers": ["A"]},
+            "bad": {"fetched_at": None, "tickers": ["A"]},
+            "worse": ["A"],
+        },
+    }))
+    registry = KalshiMarketRegistry(path=str(path), ttl_sec=60)
+    assert [i.ticker for i in registry.eligible()] == ["A"]
+
+    registry.save()
+    assert json.loads(path.read_text())["markets"][0]["ticker"] == "A"
+    assert [p.name for p in tmp_path.iterdir()] == ["kalshi_registry.json"]
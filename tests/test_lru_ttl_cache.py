@@ -0,0 +1,109 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from polymarket import clob_readiness
+from polymarket.contract import FailureReason, ReadinessStatus
+from shared.lru_ttl_cache import LruTtlCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_get_set_and_hit_miss_counters():
+    cache = LruTtlCache(max_entries=4, default_ttl=10, clock=FakeClock())
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["sets"], stats["entries"]) == (1, 1, 1, 1)
+    assert stats["hit_rate"] == 0.5
+
+
+def test_entries_expire_per_ttl():
+    clock = FakeClock()
+    cache = LruTtlCache(max_entries=4, clock=clock)
+    cache.set("short", 1, ttl=5)
+    cache.set("long", 2, ttl=50)
+    clock.now += 6
+    assert "short" not in cache
+    assert cache.get("short") is None
+    assert cache.get("long") == 2
+    assert cache.stats()["expired"] == 1
+    assert len(cache) == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = LruTtlCache(max_entries=2, default_ttl=10, clock=FakeClock())
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.keys() == ["a", "c"]
+    assert cache.stats()["evictions"] == 1
+
+
+def test_periodic_sweep_drops_unread_expired_entries():
+    clock = FakeClock()
+    cache = LruTtlCache(max_entries=100, default_ttl=5, sweep_interval_sec=30, clock=clock)
+    for i in range(10):
+        cache.set(i, i)
+    clock.now += 10
+    cache.set("fresh", 1, ttl=100)
+    assert len(cache) == 11  # sweep not yet due
+    clock.now += 25
+    cache.get("fresh")
+    assert len(cache) == 1
+    assert cache.stats()["expired"] == 10
+
+
+def test_ttl_required_without_default():
+    cache = LruTtlCache(max_entries=1)
+    with pytest.raises(ValueError):
+        cache.set("a", 1)
+    with pytest.raises(ValueError):
+        LruTtlCache(max_entries=0)
+
+
+def test_probe_cache_is_bounded(monkeypatch):
+    monkeypatch.delenv("POLYMARKET_PROBE_CACHE_PATH", raising=False)
+    bounded = LruTtlCache(max_entries=3)
+    monkeypatch.setattr(clob_readiness, "_probe_cache", bounded)
+    for i in range(5):
+        clob_readiness._add_to_cache(
+            f"tok-{i}", (ReadinessStatus.READY, FailureReason.OK, {}), ReadinessStatus.READY, FailureReason.OK
+        )
+    assert bounded.keys() == ["tok-2", "tok-3", "tok-4"]
+    assert clob_readiness._get_from_cache("tok-0") is None
+    assert clob_readiness._get_from_cache("tok-4")[0] == ReadinessStatus.READY
+
+    metrics = clob_readiness.get_probe_cache_metrics()
+    assert metrics["persistent"] is None
+    assert metrics["memory"]["evictions"] == 2
+    assert metrics["memory"]["hits"] == 1
+
+
+def test_items_skips_expired_without_counting_hits():
+    clock = FakeClock()
+    cache = LruTtlCache(max_entries=4, clock=clock)
+    cache.set("a", 1, ttl=5)
+    cache.set("b", 2, ttl=50)
+    clock.now += 10
+    assert cache.items() == [("b", 2)]
+    assert cache.stats()["hits"] == 0
+
+
+@pytest.mark.parametrize("raw", ["lots", "0"])
+def test_invalid_probe_cache_size_fails_at_import(monkeypatch, raw):
+    monkeypatch.setenv("POLYMARKET_PROBE_CACHE_MAX_ENTRIES", raw)
+    module_path = Path(__file__).resolve().parents[1] / "polymarket" / "clob_readiness.py"
+    spec = importlib.util.spec_from_file_location("clob_readiness_env_invalid", module_path)
+    module = importlib.util.module_from_spec(spec)
+    with pytest.raises(ValueError, match="POLYMARKET_PROBE_CACHE_MAX_ENTRIES"):
+        spec.loader.exec_module(module)
@@ -0,0 +1,79 @@
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from polymarket import clob_readiness
+from polymarket.clob_readiness import get_probe_cache_stats, probe_clob_readiness
+from polymarket.contract import FailureReason, ReadinessStatus
+from polymarket.probe_cache import PersistentProbeCache
+
+
+def test_entries_survive_reopen_and_expire(tmp_path) -> None:
+    path = str(tmp_path / "cache.sqlite")
+    cache = PersistentProbeCache(path)
+    cache.put("ready", (ReadinessStatus.READY, FailureReason.OK, {"mid": "0.5"}), time.time() + 60)
+    cache.put("stale", (ReadinessStatus.NOT_READY, FailureReason.CLOB_NO_ORDERBOOK, {}), time.time() - 1)
+    cache.close()
+
+    cache = PersistentProbeCache(path)
+    assert cache.purged == 1
+    assert cache.get("ready") == (ReadinessStatus.READY, FailureReason.OK, {"mid": "0.5"})
+    assert cache.get("stale") is None
+    assert cache.get("unknown") is None
+    stats = cache.stats()
+    assert stats["hits"] == 1 and stats["misses"] == 2
+    assert stats["hit_rate"] == pytest.approx(1 / 3, abs=1e-4)
+    assert stats["entries"] == 1
+
+
+@pytest.fixture
+def persistent(tmp_path, monkeypatch):
+    monkeypatch.setenv("POLYMARKET_PROBE_CACHE_PATH", str(tmp_path / "probe.sqlite"))
+    monkeypatch.setattr(clob_readiness, "_persistent_cache", None)
+    clob_readiness._probe_cache.clear()
+    yield
+    if clob_readiness._persistent_cache is not None:
+        clob_readiness._persistent_cache.close()
+    clob_readiness._probe_cache.clear()
+
+
+def _new_run(monkeypatch) -> None:
+    """Simulate the next oneshot interpreter: empty memory cache, fresh connection."""
+    clob_readiness._probe_cache.clear()
+    clob_readiness._persistent_cache.close()
+    monkeypatch.setattr(clob_readiness, "_persistent_cache", None)
+
+
+def test_next_run_reuses_probe_without_http(persistent, monkeypatch) -> None:
+    resp = MagicMock(status_code=404)
+    resp.json.return_value = {"error": "No orderbook exists for the requested token id"}
+    with patch("polymarket.clob_readiness.requests.get", return_value=resp) as mock_get:
+        first = probe_clob_readiness("tok-persist")
+        _new_run(monkeypatch)
+        second = probe_clob_readiness("tok-persist")
+    assert mock_get.call_count == 1
+    assert (second.status, second.reason) == (first.status, first.reason) == (
+        ReadinessStatus.NOT_READY,
+        FailureReason.CLOB_NO_ORDERBOOK,
+    )
+    assert get_probe_cache_stats()["hits"] == 1
+
+
+def test_disabled_without_env(monkeypatch) -> None:
+    monkeypatch.delenv("POLYMARKET_PROBE_CACHE_PATH", raising=False)
+    assert get_probe_cache_stats() is None
+
+
+def test_persistent_hit_is_kept_in_memory(persistent, monkeypatch) -> None:
+    resp = MagicMock(status_code=200)
+    resp.json.return_value = {"mid": "0.5"}
+    with patch("polymarket.clob_readiness.requests.get", return_value=resp) as mock_get:
+        probe_clob_readiness("tok-promote")
+        _new_run(monkeypatch)
+        assert "tok-promote" not in clob_readiness._probe_cache
+        probe_clob_readiness("tok-promote")
+        assert "tok-promote" in clob_readiness._probe_cache
+        probe_clob_readiness("tok-promote")
+    assert mock_get.call_count == 1
+    assert get_probe_cache_stats()["hits"] == 1
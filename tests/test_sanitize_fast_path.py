@@ -0,0 +1,57 @@
+import random
+
+import pytest
+
+from recorder.shadow_artifacts import MAX_TEXT_LENGTH, SECRET_PATTERN, sanitize_text
+
+
+def _reference(text):
+    if text is None:
+        return ""
+    text = str(text)
+    text = SECRET_PATTERN.sub("[REDACTED]", text)
+    text = text.replace("\n", " ").replace("\r", " ")
+    if len(text) > MAX_TEXT_LENGTH:
+        text = text[:MAX_TEXT_LENGTH - 3] + "..."
+    return text
+
+
+CASES = [
+    None,
+    "",
+    "EDGE_TOO_SMALL",
+    "line one\nline two\r",
+    "API-KEY: abc def",
+    "ApiKey=xyz",
+    "x" * 300,
+    "tok" + "en=" + "y" * 300,
+    "Authorization:   Bearer   abc",
+    "PRIVATE_KEY=-----BEGIN",
+    "passWORD hunter2 more",
+    "ſecret=abc",          # long s folds to "s" under IGNORECASE
+    "api_Key=abc",          # Kelvin sign folds to "k"
+    "café token=abc",
+    12345,
+]
+
+
+@pytest.mark.parametrize("text", CASES)
+def test_matches_reference(text) -> None:
+    assert sanitize_text(text) == _reference(text)
+    # Second call goes through the memo.
+    assert sanitize_text(text) == _reference(text)
+
+
+def test_fuzz_matches_reference() -> None:
+    rng = random.Random(1234)
+    alphabet = "abcdeiknoprstwyAEKPST_-=: \nſK"
+    words = ["api", "key", "secret", "token", "bearer", "password", "private", "auth"]
+    for _ in range(3000):
+        parts = []
+        for _ in range(rng.randint(0, 8)):
+            if rng.random() < 0.3:
+                parts.append(rng.choice(words).upper() if rng.random() < 0.3 else rng.choice(words))
+            else:
+                parts.append("".join(rng.choice(alphabet) for _ in range(rng.randint(0, 6))))
+        text = "".join(parts)
+        assert sanitize_text(text) == _reference(text), repr(text)
@@ -0,0 +1,176 @@
+import csv
+import importlib.util
+import json
+import logging
+import sys
+import time
+import types
+from pathlib import Path
+
+import pytest
+
+import venues.kalshi as kalshi
+import venues.polymarket as polymarket
+from strategies.reasons import ReasonCode
+from venuebook.types import BookStatus, VenueBook
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures"
+
+
+def _load_runner():
+    path = Path(__file__).resolve().parents[1] / "scripts" / "run_shadow_stale_edge.py"
+    spec = importlib.util.spec_from_file_location("run_shadow_stale_edge_fetch_under_test", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _book(ts: float) -> VenueBook:
+    return VenueBook(
+        venue="polymarket",
+        ts=ts,
+        best_bid=0.45,
+        best_ask=0.47,
+        depth_qty_total=500.0,
+        depth_notional_total_usd=230.0,
+        status=BookStatus.OK,
+        fail_reason=None,
+        raw=None,
+    )
+
+
+@pytest.fixture(autouse=True)
+def _plain_journal(monkeypatch):
+    monkeypatch.delenv("TRADE_JOURNAL_ROTATE_MB", raising=False)
+    monkeypatch.delenv("TRADE_JOURNAL_ROTATE_INTERVAL_SEC", raising=False)
+    monkeypatch.delenv("POLYMARKET_FIXTURE_MODE", raising=False)
+
+
+def _run_live(monkeypatch, output: Path, runner, book_fetch, official, fake_time) -> list:
+    monkeypatch.setattr(runner, "time", fake_time)
+    monkeypatch.setattr(runner, "get_official_price", official)
+    monkeypatch.setitem(runner._BOOK_FETCHERS, "polymarket", book_fetch)
+    # One tick: the loop sleep jumps past the one-minute run.
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "run_shadow_stale_edge.py", "--mode", "live", "--venue", "polymarket",
+            "--minutes", "1", "--loop-interval-sec", "60", "--output", str(output),
+        ],
+    )
+    assert runner.main() == 0
+    with open(output, newline="") as f:
+        return list(csv.DictReader(f))
+
+
+def test_official_and_book_fetches_overlap(tmp_path, monkeypatch) -> None:
+    runner = _load_runner()
+    offset = {"sec": 0.0}
+    fake_time = types.SimpleNamespace(
+        time=lambda: time.time() + offset["sec"],
+        sleep=lambda sec: offset.__setitem__("sec", offset["sec"] + sec),
+    )
+
+    def official(symbol_pair):
+        time.sleep(0.3)
+        return 100.0, int(time.time() * 1000), None, "binance"
+
+    def book_fetch(market_id, raw_retention=None):
+        time.sleep(0.3)
+        return _book(time.time())
+
+    t0 = time.monotonic()
+    rows = _run_live(monkeypatch, tmp_path / "journal.csv", runner, book_fetch, official, fake_time)
+    elapsed = time.monotonic() - t0
+
+    assert len(rows) == 1 and rows[0]["official_source"] == "binance"
+    assert rows[0]["yes_bid"] == "0.45"
+    assert elapsed < 0.55
+
+
+def test_book_age_uses_receive_time(tmp_path, monkeypatch) -> None:
+    runner = _load_runner()
+    clock = {"now": 1_700_000_000.0}
+    fake_time = types.SimpleNamespace(
+        time=lambda: clock["now"],
+        sleep=lambda sec: clock.__setitem__("now", clock["now"] + sec),
+    )
+
+    def official(symbol_pair):
+        return 100.0, int(clock["now"] * 1000), None, "binance"
+
+    def book_fetch(market_id, raw_retention=None):
+        # The response arrives 400 ms after the request was sent.
+        clock["now"] += 0.4
+        return _book(clock["now"])
+
+    rows = _run_live(monkeypatch, tmp_path / "journal.csv", runner, book_fetch, official, fake_time)
+
+    assert rows[0]["book_latency_ms"] == "400"
+    assert rows[0]["book_age_ms"] == "0"
+
+
+def test_official_fetch_error_still_records_the_tick(tmp_path, monkeypatch, caplog) -> None:
+    runner = _load_runner()
+    clock = {"now": 1_700_000_000.0}
+    fake_time = types.SimpleNamespace(
+        time=lambda: clock["now"],
+        sleep=lambda sec: clock.__setitem__("now", clock["now"] + sec),
+    )
+
+    def official(symbol_pair):
+        raise RuntimeError("feed down")
+
+    def book_fetch(market_id, raw_retention=None):
+        return _book(clock["now"])
+
+    with caplog.at_level(logging.ERROR, logger="stale_edge_shadow"):
+        rows = _run_live(monkeypatch, tmp_path / "journal.csv", runner, book_fetch, official, fake_time)
+
+    assert any("OFFICIAL_FEED_ERROR: feed down" in r.getMessage() for r in caplog.records)
+    assert len(rows) == 1
+    assert rows[0]["official_source"] == "NONE"
+    assert rows[0]["yes_bid"] == "0.45"
+    assert rows[0]["reason"] == ReasonCode.OFFICIAL_FEED_MISSING
+
+
+def test_sigterm_mid_loop_closes_the_journal(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr("recorder.trade_journal.FLUSH_ROWS", 1000)
+    monkeypatch.setattr("recorder.trade_journal.FLUSH_INTERVAL_SEC", 3600.0)
+    runner = _load_runner()
+
+    def sigterm(sec):
+        raise SystemExit(143)
+
+    fake_time = types.SimpleNamespace(time=lambda: 1_700_000_000.0, sleep=sigterm)
+    output = tmp_path / "journal.csv"
+    with pytest.raises(SystemExit):
+        _run_live(
+            monkeypatch, output, runner,
+            lambda market_id, raw_retention=None: _book(1_700_000_000.0),
+            lambda symbol_pair: (100.0, 1_700_000_000_000, None, "binance"),
+            fake_time,
+        )
+
+    with open(output, newline="") as f:
+        assert len(list(csv.DictReader(f))) == 1
+
+
+@pytest.mark.parametrize("module,venue", [(polymarket, "polymarket"), (kalshi, "kalshi")])
+def test_venuebook_is_stamped_on_receipt(monkeypatch, module, venue) -> None:
+    with (FIXTURE_DIR / venue / "ok_book.json").open("r") as f:
+        payload = json.load(f)
+    clock = {"now": 1_700_000_000.0}
+    monkeypatch.setattr(module, "time", types.SimpleNamespace(time=lambda: clock["now"]))
+
+    def slow_fetch(market, **kwargs):
+        clock["now"] += 2.0
+        return payload
+
+    monkeypatch.setattr(module, "fetch_book", slow_fetch)
+    fetch = polymarket.fetch_polymarket_venuebook if venue == "polymarket" else kalshi.fetch_kalshi_venuebook
+    book = fetch("m1")
+
+    assert book.status == BookStatus.OK
+    assert book.ts == 1_700_000_002.0
@@ -0,0 +1,89 @@
+import sqlite3
+
+import pytest
+
+from recorder.journal_schema import JOURNAL_COLUMNS
+from recorder.sqlite_journal import SqliteJournal, ensure_schema, query_decisions
+
+
+def _row(i: int, market: str = "KXA", reason: str = "EDGE_TOO_SMALL") -> dict:
+    return {
+        "ts": 1_000 + i,
+        "market_id": market,
+        "official_mid": "97000.5",
+        "book_ok": True,
+        "edge_net_bps": float(i),
+        "reason": reason,
+        "open_markets": "",
+    }
+
+
+def test_schema_pragmas_and_indexes(tmp_path) -> None:
+    path = tmp_path / "journal.db"
+    with SqliteJournal(str(path)):
+        pass
+    conn = sqlite3.connect(str(path))
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    cols = [row[1] for row in conn.execute("PRAGMA table_info(shadow_decisions)")]
+    assert cols == ["id"] + JOURNAL_COLUMNS
+    types = {row[1]: row[2] for row in conn.execute("PRAGMA table_info(shadow_decisions)")}
+    assert types["ts"] == "INTEGER"
+    assert types["official_mid"] == "REAL"
+    assert types["reason"] == "TEXT"
+    indexes = {row[1] for row in conn.execute("PRAGMA index_list(shadow_decisions)")}
+    assert {
+        "idx_shadow_decisions_ts",
+        "idx_shadow_decisions_market_ts",
+        "idx_shadow_decisions_reason",
+    } <= indexes
+
+
+def test_rows_are_batched_and_typed(tmp_path) -> None:
+    path = tmp_path / "journal.db"
+    journal = SqliteJournal(str(path), batch_rows=3, flush_interval_sec=3600)
+    reader = sqlite3.connect(str(path))
+    count = lambda: reader.execute("SELECT COUNT(*) FROM shadow_decisions").fetchone()[0]
+
+    journal.record_decision(_row(0))
+    journal.record_decision(_row(1))
+    assert count() == 0
+    journal.record_decision(_row(2))
+    assert count() == 3
+    journal.record_decision(_row(3))
+    journal.close()
+    assert count() == 4
+    assert journal.rows_written == 4
+
+    mid, book_ok, open_markets = reader.execute(
+        "SELECT official_mid, book_ok, open_markets FROM shadow_decisions LIMIT 1"
+    ).fetchone()
+    assert mid == 97000.5
+    assert book_ok == 1
+    assert open_markets is None
+
+
+def test_query_decisions_filters(tmp_path) -> None:
+    path = tmp_path / "journal.db"
+    with SqliteJournal(str(path)) as journal:
+        for i in range(10):
+            journal.record_decision(_row(i, market="KXA" if i % 2 else "KXB"))
+        journal.record_decision(_row(10, reason="STALE_BOOK"))
+
+    conn = sqlite3.connect(str(path))
+    rows = query_decisions(conn, 1_002, 1_006, market_id="KXA", columns=["ts", "edge_net_bps"])
+    assert rows == [{"ts": 1_003, "edge_net_bps": 3.0}, {"ts": 1_005, "edge_net_bps": 5.0}]
+    assert [r["ts"] for r in query_decisions(conn, 0, 10_000, reason="STALE_BOOK")] == [1_010]
+    assert len(query_decisions(conn, 0, 10_000, limit=2)) == 2
+    with pytest.raises(ValueError):
+        query_decisions(conn, 0, 1, columns=["nope"])
+
+
+def test_existing_table_gains_new_columns(tmp_path) -> None:
+    path = tmp_path / "journal.db"
+    conn = sqlite3.connect(str(path))
+    conn.execute("CREATE TABLE shadow_decisions (id INTEGER PRIMARY KEY, ts INTEGER)")
+    conn.commit()
+    ensure_schema(conn)
+    cols = [row[1] for row in conn.execute("PRAGMA table_info(shadow_decisions)")]
+    assert cols[:2] == ["id", "ts"]
+    assert set(JOURNAL_COLUMNS) <= set(cols)
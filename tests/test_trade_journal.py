@@ -0,0 +1,137 @@
+import atexit
+import csv
+import importlib.util
+import time
+from pathlib import Path
+
+import pytest
+
+from recorder import trade_journal
+from recorder.trade_journal import COLUMNS, TradeJournal
+
+
+def _row(i: int) -> dict:
+    return {"ts": i, "market_id": "m1", "action": "NO_TRADE", "reason": "EDGE_TOO_SMALL"}
+
+
+def _read_rows(path) -> list:
+    with open(path, "r", newline="") as f:
+        return list(csv.reader(f))
+
+
+def test_output_matches_legacy_dictwriter(tmp_path) -> None:
+    legacy = tmp_path / "legacy.csv"
+    with open(legacy, "w", newline="") as handle:
+        csv.DictWriter(handle, fieldnames=COLUMNS).writeheader()
+    for i in range(3):
+        with open(legacy, "a", newline="") as handle:
+            csv.DictWriter(handle, fieldnames=COLUMNS).writerow(
+                {key: _row(i).get(key, "") for key in COLUMNS}
+            )
+
+    path = tmp_path / "journal.csv"
+    with TradeJournal(str(path)) as journal:
+        for i in range(3):
+            journal.record_decision(_row(i))
+
+    assert path.read_bytes() == legacy.read_bytes()
+
+
+def test_header_written_immediately_and_rows_buffered(tmp_path) -> None:
+    path = tmp_path / "journal.csv"
+    journal = TradeJournal(str(path), flush_rows=3, flush_interval_sec=3600)
+
+    assert _read_rows(path) == [COLUMNS]
+    journal.record_decision(_row(1))
+    journal.record_decision(_row(2))
+    assert len(_read_rows(path)) == 1
+    journal.record_decision(_row(3))
+    assert len(_read_rows(path)) == 4
+
+    journal.record_decision(_row(4))
+    journal.close()
+    assert len(_read_rows(path)) == 5
+    assert journal.closed
+    journal.close()
+
+
+def test_interval_flush(tmp_path) -> None:
+    path = tmp_path / "journal.csv"
+    journal = TradeJournal(str(path), flush_rows=1000, flush_interval_sec=0.0)
+    journal.record_decision(_row(1))
+    assert len(_read_rows(path)) == 2
+    journal.close()
+
+
+def test_idle_journal_flushes_on_timer(tmp_path) -> None:
+    path = tmp_path / "journal.csv"
+    journal = TradeJournal(str(path), flush_rows=1000, flush_interval_sec=0.05)
+    journal.record_decision(_row(1))
+    assert len(_read_rows(path)) == 1
+    deadline = time.monotonic() + 2.0
+    while len(_read_rows(path)) < 2 and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert len(_read_rows(path)) == 2
+    journal.close()
+
+
+def test_only_whole_rows_reach_the_file(tmp_path) -> None:
+    path = tmp_path / "journal.csv"
+    journal = TradeJournal(str(path), flush_rows=1000, flush_interval_sec=3600.0)
+    header_size = path.stat().st_size
+    big = dict(_row(1), reason="x" * 65536)
+    journal.record_decision(big)
+    assert path.stat().st_size == header_size
+    journal.flush()
+    assert path.read_bytes().endswith(b"\r\n")
+    assert _read_rows(path)[1][COLUMNS.index("reason")] == big["reason"]
+    journal.close()
+
+
+def test_reopen_appends_without_second_header(tmp_path) -> None:
+    path = tmp_path / "journal.csv"
+    with TradeJournal(str(path)) as journal:
+        journal.record_decision(_row(1))
+    with TradeJournal(str(path), fsync="flush") as journal:
+        journal.record_decision(_row(2))
+
+    rows = _read_rows(path)
+    assert rows[0] == COLUMNS
+    assert len(rows) == 3
+
+
+def test_invalid_fsync_policy_raises(tmp_path) -> None:
+    with pytest.raises(ValueError):
+        TradeJournal(str(tmp_path / "journal.csv"), fsync="sometimes")
+
+
+@pytest.mark.parametrize(
+    "name,raw",
+    [
+        ("TRADE_JOURNAL_FLUSH_ROWS", "abc"),
+        ("TRADE_JOURNAL_FLUSH_ROWS", "0"),
+        ("TRADE_JOURNAL_FLUSH_INTERVAL_SEC", "-1"),
+        ("TRADE_JOURNAL_FSYNC", "always"),
+        ("TRADE_JOURNAL_INDEX_EVERY", "-5"),
+    ],
+)
+def test_invalid_env_overrides_fail_at_import(monkeypatch, name, raw) -> None:
+    monkeypatch.setenv(name, raw)
+    module_path = Path(__file__).resolve().parents[1] / "recorder" / "trade_journal.py"
+    spec = importlib.util.spec_from_file_location(
+        "recorder.trade_journal_env_invalid", module_path, submodule_search_locations=None
+    )
+    module = importlib.util.module_from_spec(spec)
+    module.__package__ = "recorder"
+    with pytest.raises(ValueError, match=name):
+        spec.loader.exec_module(module)
+
+
+def test_exit_hook_tracks_only_open_journals(tmp_path) -> None:
+    before = atexit._ncallbacks()
+    journals = [TradeJournal(str(tmp_path / f"journal-{i}.csv")) for i in range(3)]
+    assert atexit._ncallbacks() == before
+    assert set(journals) <= set(trade_journal._OPEN_JOURNALS)
+    for journal in journals:
+        journal.close()
+    assert not set(journals) & set(trade_journal._OPEN_JOURNALS)
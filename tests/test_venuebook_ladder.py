@@ -0,0 +1,76 @@
+import json
+from pathlib import Path
+
+import pytest
+
+import venues.polymarket as polymarket
+from venuebook.ladder import ASK, BID, BookLadder, LadderSide
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "polymarket"
+
+ASKS = [(0.52, 100.0), (0.50, 50.0), (0.55, 200.0)]
+BIDS = [(0.47, 80.0), (0.49, 40.0), (0.45, 300.0)]
+
+
+def test_sides_are_sorted_best_first() -> None:
+    ladder = BookLadder.from_levels(BIDS, ASKS)
+
+    assert list(ladder.asks.prices) == [0.50, 0.52, 0.55]
+    assert list(ladder.bids.prices) == [0.49, 0.47, 0.45]
+    assert ladder.best_bid == 0.49
+    assert ladder.best_ask == 0.50
+    assert ladder.asks.total_qty == 350.0
+
+
+def test_vwap_for_size_sweeps_levels() -> None:
+    asks = LadderSide.from_levels(ASKS, ASK)
+
+    assert asks.vwap_for_size(50.0) == pytest.approx(0.50)
+    expected = (50 * 0.50 + 100 * 0.52 + 10 * 0.55) / 160.0
+    assert asks.vwap_for_size(160.0) == pytest.approx(expected)
+    assert asks.vwap_for_size(351.0) is None
+    assert asks.vwap_for_size(0.0) is None
+
+
+def test_depth_at_price_and_size_within_bps() -> None:
+    bids = LadderSide.from_levels(BIDS, BID)
+
+    assert bids.depth_at_price(0.47) == 120.0
+    assert bids.depth_at_price(0.50) == 0.0
+    assert bids.depth_at_price(0.01) == 420.0
+    # 0.49 * (1 - 500bps) = 0.4655 -> includes 0.49 and 0.47 only
+    assert bids.size_within_bps(500.0) == 120.0
+    assert bids.size_within_bps(0.0) == 40.0
+
+
+def test_slippage_for_notional() -> None:
+    asks = LadderSide.from_levels(ASKS, ASK)
+
+    assert asks.slippage_for_notional(10.0) == pytest.approx(0.0)
+    notional = 50 * 0.50 + 100 * 0.52
+    vwap = notional / 150.0
+    assert asks.slippage_for_notional(notional) == pytest.approx((vwap - 0.50) / 0.50 * 10_000)
+    assert asks.slippage_for_notional(1e9) is None
+
+
+def test_empty_side_queries() -> None:
+    side = LadderSide.from_levels([], BID)
+
+    assert len(side) == 0
+    assert side.best_price is None
+    assert side.vwap_for_size(1.0) is None
+    assert side.size_within_bps(100.0) == 0.0
+
+
+def test_parser_builds_ladder_only_on_request() -> None:
+    with (FIXTURE_DIR / "ok_book.json").open("r") as f:
+        raw = json.load(f)
+
+    plain = polymarket.parse_polymarket_book(raw, ts=123.0)
+    assert plain.ladder is None
+
+    book = polymarket.parse_polymarket_book(raw, ts=123.0, with_ladder=True)
+    assert book.ladder is not None
+    assert book.ladder.best_bid == book.best_bid
+    assert book.ladder.best_ask == book.best_ask
+    assert "ladder" not in book.to_json_dict()
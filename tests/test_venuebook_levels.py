@@ -0,0 +1,43 @@
+import random
+
+from venuebook.levels import (
+    ask_ladder,
+    best_ask_level,
+    best_bid_level,
+    bid_ladder,
+    top_asks,
+    top_bids,
+    total_depth,
+    total_notional,
+)
+
+
+def _random_levels(n: int, seed: int) -> list:
+    rng = random.Random(seed)
+    return [(round(rng.uniform(0.01, 0.99), 2), float(rng.randint(1, 500))) for _ in range(n)]
+
+
+def test_best_levels_match_sorted_head() -> None:
+    levels = _random_levels(200, seed=7)
+    assert best_bid_level(levels) == bid_ladder(levels)[0]
+    assert best_ask_level(levels) == ask_ladder(levels)[0]
+
+
+def test_best_levels_empty_side_is_none() -> None:
+    assert best_bid_level([]) is None
+    assert best_ask_level([]) is None
+
+
+def test_top_n_matches_sorted_prefix() -> None:
+    levels = _random_levels(500, seed=11)
+    assert [p for p, _ in top_bids(levels, 5)] == [p for p, _ in bid_ladder(levels)[:5]]
+    assert [p for p, _ in top_asks(levels, 5)] == [p for p, _ in ask_ladder(levels)[:5]]
+    assert top_bids(levels, 0) == []
+    assert top_asks(levels, -1) == []
+
+
+def test_totals_do_not_depend_on_order() -> None:
+    levels = [(0.4, 10.0), (0.6, 5.0), (0.5, 20.0)]
+    assert total_depth(levels) == 35.0
+    assert abs(total_notional(levels) - (4.0 + 3.0 + 10.0)) < 1e-9
+    assert total_depth([]) == 0
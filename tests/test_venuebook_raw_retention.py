@@ -0,0 +1,96 @@
+import json
+from pathlib import Path
+
+import pytest
+
+import venues.kalshi as kalshi
+import venues.polymarket as polymarket
+from venuebook.retention import RawRetention, resolve_raw_retention, retain_raw
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures"
+
+
+def _load_fixture(venue: str, name: str) -> dict:
+    with (FIXTURE_DIR / venue / name).open("r") as f:
+        return json.load(f)
+
+
+@pytest.fixture(autouse=True)
+def _clear_debug_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("VENUEBOOK_DEBUG", raising=False)
+    monkeypatch.delenv("POLYMARKET_FIXTURE_MODE", raising=False)
+
+
+def test_default_retention_is_digest() -> None:
+    raw = _load_fixture("polymarket", "ok_book.json")
+    book = polymarket.parse_polymarket_book(raw, ts=123.0)
+
+    assert book.raw is not None
+    assert set(book.raw) == {"retention", "sha256", "size_bytes"}
+    assert book.raw["retention"] == "digest"
+    assert book.raw["size_bytes"] > 0
+
+
+def test_digest_is_stable_across_key_order() -> None:
+    a = {"market": "m", "bids": [["0.4", "10"]], "asks": []}
+    b = {"asks": [], "bids": [["0.4", "10"]], "market": "m"}
+    assert retain_raw(a, RawRetention.DIGEST) == retain_raw(b, RawRetention.DIGEST)
+
+
+def test_none_retention_drops_raw_on_failures_too() -> None:
+    raw = _load_fixture("kalshi", "ambiguous.json")
+    book = kalshi.parse_kalshi_book(raw, ts=123.0, raw_retention=RawRetention.NONE)
+
+    assert book.raw is None
+    assert "raw" not in book.to_json_dict()
+
+
+def test_truncated_retention_caps_lists() -> None:
+    data = {"market": "m", "bids": [[str(i / 100), "1"] for i in range(1, 40)], "asks": [], "hashes": list(range(9))}
+    kept = retain_raw(data, RawRetention.TRUNCATED, max_items=3)
+
+    assert kept["retention"] == "truncated"
+    # Polymarket lists bids worst first; the best three survive.
+    assert kept["bids"] == [["0.39", "1"], ["0.38", "1"], ["0.37", "1"]]
+    assert kept["hashes"] == [0, 1, 2]
+    assert len(data["bids"]) == 39
+
+
+def test_truncated_retention_keeps_best_levels_per_side() -> None:
+    data = {
+        "bids": [{"price": "0.40", "size": "1"}, {"price": "0.45", "size": "2"}, {"price": "x", "size": "3"}],
+        "asks": [{"price": "0.60", "size": "1"}, {"price": "0.50", "size": "2"}, {"price": "0.55", "size": "3"}],
+        "orderbook": {"yes": [[30, 5], [47, 1], [40, 2]], "no_ask": [[60, 1], [52, 2]]},
+    }
+    kept = retain_raw(data, RawRetention.TRUNCATED, max_items=2)
+
+    assert [level["price"] for level in kept["bids"]] == ["0.45", "0.40"]
+    assert [level["price"] for level in kept["asks"]] == ["0.50", "0.55"]
+    assert kept["orderbook"]["yes"] == [[47, 1], [40, 2]]
+    assert kept["orderbook"]["no_ask"] == [[52, 2], [60, 1]]
+
+
+def test_truncated_retention_keeps_whole_kalshi_levels() -> None:
+    data = {"orderbook": {"yes": [[10, 5], [20, 3], [30, 1]], "no": [[70, 2]]}}
+    kept = retain_raw(data, RawRetention.TRUNCATED, max_items=1)
+
+    assert kept["orderbook"] == {"yes": [[30, 1]], "no": [[70, 2]]}
+    assert data["orderbook"]["yes"] == [[10, 5], [20, 3], [30, 1]]
+
+
+def test_full_retention_only_in_debug_or_fixture_mode(monkeypatch: pytest.MonkeyPatch) -> None:
+    assert resolve_raw_retention(RawRetention.FULL) == RawRetention.DIGEST
+
+    monkeypatch.setenv("VENUEBOOK_DEBUG", "1")
+    raw = _load_fixture("kalshi", "ok_book.json")
+    book = kalshi.parse_kalshi_book(raw, ts=123.0, raw_retention=RawRetention.FULL)
+    assert book.raw is raw
+    assert resolve_raw_retention() == RawRetention.FULL
+    assert resolve_raw_retention(default=RawRetention.NONE) == RawRetention.FULL
+
+
+def test_caller_default_applies_without_env_or_debug(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("venuebook.retention.RAW_RETENTION", None)
+    assert resolve_raw_retention(default=RawRetention.NONE) == RawRetention.NONE
+    monkeypatch.setattr("venuebook.retention.RAW_RETENTION", RawRetention.TRUNCATED)
+    assert resolve_raw_retention(default=RawRetention.NONE) == RawRetention.TRUNCATED
@@ -1,3 +1,4 @@
+from .retention import RawRetention
 from .types import BookFailReason, BookStatus, VenueBook
 
-__all__ = ["BookFailReason", "BookStatus", "VenueBook"]
+__all__ = ["BookFailReason", "BookStatus", "RawRetention", "VenueBook"]
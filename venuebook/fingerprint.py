@@ -0,0 +1,45 @@
+"""Cheap content fingerprints for VenueBook snapshots.
+
+Two books with the same fingerprint present identical inputs to the strategy:
+same status/fail reason, same BBO, same depth totals and (when a ladder was
+built) the same top-N levels. The receive timestamp and raw payload are
+deliberately excluded.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import struct
+from typing import Optional
+
+from .types import VenueBook
+
+DEFAULT_TOP_N = 5
+
+_NONE = float("nan")
+
+
+def _f(value: Optional[float]) -> float:
+    return _NONE if value is None else float(value)
+
+
+def book_fingerprint(book: VenueBook, top_n: int = DEFAULT_TOP_N) -> str:
+    h = hashlib.blake2b(digest_size=8)
+    h.update(book.venue.encode("utf-8"))
+    h.update(book.status.name.encode("utf-8"))
+    h.update(book.fail_reason.name.encode("utf-8") if book.fail_reason is not None else b"-")
+    h.update(
+        struct.pack(
+            "<4d",
+            _f(book.best_bid),
+            _f(book.best_ask),
+            _f(book.depth_qty_total),
+            _f(book.depth_notional_total_usd),
+        )
+    )
+    ladder = book.ladder
+    if ladder is not None and top_n > 0:
+        for side in (ladder.bids, ladder.asks):
+            h.update(side.prices[:top_n].tobytes())
+            h.update(side.qtys[:top_n].tobytes())
+    return h.hexdigest()
@@ -0,0 +1,151 @@
+"""Array-backed full-depth ladder with liquidity queries.
+
+Each side is stored best-first as contiguous float64 NumPy arrays together
+with cumulative quantity and notional sums, so every query below is a binary
+search (O(log n)) plus O(1) arithmetic, regardless of book depth.
+
+Prices use the same scale as VenueBook (0..1 probability units).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+
+BID = "bid"
+ASK = "ask"
+
+
+@dataclass(frozen=True)
+class LadderSide:
+    side: str
+    prices: np.ndarray
+    qtys: np.ndarray
+    cum_qty: np.ndarray
+    cum_notional: np.ndarray
+    # Ascending search key: prices for asks, -prices for bids.
+    _key: np.ndarray
+
+    @classmethod
+    def from_levels(cls, levels: Iterable[Tuple[float, float]], side: str) -> "LadderSide":
+        if side not in (BID, ASK):
+            raise ValueError(f"side must be '{BID}' or '{ASK}'")
+        arr = np.asarray(list(levels), dtype=np.float64).reshape(-1, 2)
+        prices = arr[:, 0]
+        qtys = arr[:, 1]
+        key = -prices if side == BID else prices
+        order = np.argsort(key, kind="stable")
+        prices = np.ascontiguousarray(prices[order])
+        qtys = np.ascontiguousarray(qtys[order])
+        key = np.ascontiguousarray(key[order])
+        for a in (prices, qtys, key):
+            a.flags.writeable = False
+        cum_qty = np.cumsum(qtys)
+        cum_notional = np.cumsum(prices * qtys)
+        cum_qty.flags.writeable = False
+        cum_notional.flags.writeable = False
+        return cls(side, prices, qtys, cum_qty, cum_notional, key)
+
+    def __len__(self) -> int:
+        return int(self.prices.shape[0])
+
+    @property
+    def best_price(self) -> Optional[float]:
+        return float(self.prices[0]) if len(self) else None
+
+    @property
+    def total_qty(self) -> float:
+        return float(self.cum_qty[-1]) if len(self) else 0.0
+
+    @property
+    def total_notional(self) -> float:
+        return float(self.cum_notional[-1]) if len(self) else 0.0
+
+    def _key_for(self, price: float) -> float:
+        return -price if self.side == BID else price
+
+    def depth_at_price(self, price: float) -> float:
+        """Quantity resting at `price` or better (inclusive)."""
+        idx = int(np.searchsorted(self._key, self._key_for(price), side="right"))
+        return float(self.cum_qty[idx - 1]) if idx > 0 else 0.0
+
+    def size_within_bps(self, bps: float) -> float:
+        """Quantity available within `bps` of the best price."""
+        best = self.best_price
+        if best is None:
+            return 0.0
+        offset = best * bps / 10_000.0
+        limit = best - offset if self.side == BID else best + offset
+        return self.depth_at_price(limit)
+
+    def _notional_for_size(self, size: float) -> Optional[float]:
+        if size <= 0.0 or size > self.total_qty:
+            return None
+        idx = int(np.searchsorted(self.cum_qty, size, side="left"))
+        filled_qty = float(self.cum_qty[idx - 1]) if idx > 0 else 0.0
+        filled_notional = float(self.cum_notional[idx - 1]) if idx > 0 else 0.0
+        return filled_notional + (size - filled_qty) * float(self.prices[idx])
+
+    def vwap_for_size(self, size: float) -> Optional[float]:
+        """Average fill price for sweeping `size` units; None if depth is insufficient."""
+        notional = self._notional_for_size(size)
+        if notional is None:
+            return None
+        return notional / size
+
+    def size_for_notional(self, notional: float) -> Optional[float]:
+        """Units filled when sweeping `notional` USD; None if depth is insufficient."""
+        if notional <= 0.0 or notional > self.total_notional:
+            return None
+        idx = int(np.searchsorted(self.cum_notional, notional, side="left"))
+        filled_qty = float(self.cum_qty[idx - 1]) if idx > 0 else 0.0
+        filled_notional = float(self.cum_notional[idx - 1]) if idx > 0 else 0.0
+        price = float(self.prices[idx])
+        if price <= 0.0:
+            return None
+        return filled_qty + (notional - filled_notional) / price
+
+    def slippage_for_notional(self, notional: float) -> Optional[float]:
+        """Slippage in bps of the sweep VWAP versus the best price (always >= 0)."""
+        best = self.best_price
+        qty = self.size_for_notional(notional)
+        if best is None or best <= 0.0 or qty is None or qty <= 0.0:
+            return None
+        vwap = notional / qty
+        diff = best - vwap if self.side == BID else vwap - best
+        return max(diff, 0.0) / best * 10_000.0
+
+
+@dataclass(frozen=True)
+class BookLadder:
+    bids: LadderSide
+    asks: LadderSide
+
+    @classmethod
+    def from_levels(
+        cls,
+        bids: Iterable[Tuple[float, float]],
+        asks: Iterable[Tuple[float, float]],
+    ) -> "BookLadder":
+        return cls(
+            bids=LadderSide.from_levels(bids, BID),
+            asks=LadderSide.from_levels(asks, ASK),
+        )
+
+    @property
+    def best_bid(self) -> Optional[float]:
+        return self.bids.best_price
+
+    @property
+    def best_ask(self) -> Optional[float]:
+        return self.asks.best_price
+
+    def buy_vwap(self, size: float) -> Optional[float]:
+        """VWAP for lifting `size` units off the asks."""
+        return self.asks.vwap_for_size(size)
+
+    def sell_vwap(self, size: float) -> Optional[float]:
+        """VWAP for hitting `size` units into the bids."""
+        return self.bids.vwap_for_size(size)
@@ -0,0 +1,58 @@
+"""Price-level helpers shared by the venue book parsers.
+
+Levels are (price, qty) tuples in arbitrary order. BBO and depth totals are
+derived with single linear scans; ordered ladders are only materialized when a
+caller explicitly asks for them (top-N via heapq, full ladder via sort).
+"""
+
+from __future__ import annotations
+
+import heapq
+from operator import itemgetter
+from typing import Iterable, List, Optional, Tuple
+
+Level = Tuple[float, float]
+
+_price = itemgetter(0)
+
+
+def best_bid_level(levels: List[Level]) -> Optional[Level]:
+    """Highest-priced level (first one on ties), or None for an empty side."""
+    return max(levels, key=_price, default=None)
+
+
+def best_ask_level(levels: List[Level]) -> Optional[Level]:
+    """Lowest-priced level (first one on ties), or None for an empty side."""
+    return min(levels, key=_price, default=None)
+
+
+def top_bids(levels: Iterable[Level], n: int) -> List[Level]:
+    """The n best bid levels, best first, without sorting the whole side."""
+    if n <= 0:
+        return []
+    return heapq.nlargest(n, levels, key=_price)
+
+
+def top_asks(levels: Iterable[Level], n: int) -> List[Level]:
+    """The n best ask levels, best first, without sorting the whole side."""
+    if n <= 0:
+        return []
+    return heapq.nsmallest(n, levels, key=_price)
+
+
+def bid_ladder(levels: Iterable[Level]) -> List[Level]:
+    """Full bid ladder sorted best (highest) first."""
+    return sorted(levels, key=_price, reverse=True)
+
+
+def ask_ladder(levels: Iterable[Level]) -> List[Level]:
+    """Full ask ladder sorted best (lowest) first."""
+    return sorted(levels, key=_price)
+
+
+def total_depth(levels: Iterable[Level]) -> float:
+    return sum(qty for _, qty in levels)
+
+
+def total_notional(levels: Iterable[Level]) -> float:
+    return sum(price * qty for price, qty in levels)
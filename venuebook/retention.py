@@ -0,0 +1,168 @@
+"""Retention policy for the decoded venue payload kept on VenueBook.raw.
+
+Long soaks over many markets used to hold every decoded orderbook payload in
+memory (and serialize it via to_json_dict). The policy decides how much of it
+survives parsing:
+
+- none:      raw is dropped (None)
+- digest:    sha256 content hash + serialized size only
+- truncated: payload copy with every list cut to N entries; order-book sides
+             (bids/asks, yes_bid/no_ask, ...) keep their N best levels, each
+             level copied whole
+- full:      payload kept as-is (only honoured in debug / fixture modes)
+
+digest is the default outside debug/fixture modes. It costs a canonical
+json.dumps plus sha256 of the payload on every parse; callers that parse in a
+tight loop and never read VenueBook.raw should pass RawRetention.NONE.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+from enum import Enum
+from typing import Any, List, Optional, Union
+
+
+class RawRetention(Enum):
+    NONE = "none"
+    DIGEST = "digest"
+    TRUNCATED = "truncated"
+    FULL = "full"
+
+
+DEFAULT_TRUNCATE_LEVELS = 5
+
+# Payload keys holding price levels, by which end of the book is best.
+# Kalshi's bare "yes"/"no" lists are the bids on each side.
+_BID_KEYS = frozenset({"bids", "yes_bid", "no_bid", "yes", "no"})
+_ASK_KEYS = frozenset({"asks", "yes_ask", "no_ask"})
+
+
+def _debug_or_fixture_mode() -> bool:
+    return (
+        os.getenv("VENUEBOOK_DEBUG") == "1"
+        or os.getenv("POLYMARKET_FIXTURE_MODE") == "1"
+    )
+
+
+def _env_retention(name: str) -> Optional[RawRetention]:
+    raw = os.getenv(name)
+    if raw is None or raw == "":
+        return None
+    try:
+        return RawRetention(raw.strip().lower())
+    except ValueError:
+        allowed = ", ".join(item.value for item in RawRetention)
+        raise ValueError(f"{name} must be one of: {allowed}")
+
+
+def _env_positive_int(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if raw is None or raw == "":
+        return default
+    try:
+        value = int(raw)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} must be a positive integer")
+    if value <= 0:
+        raise ValueError(f"{name} must be a positive integer")
+    return value
+
+
+# Validated at import, like the venue threshold overrides (invalid => hard fail).
+RAW_RETENTION = _env_retention("VENUEBOOK_RAW_RETENTION")
+TRUNCATE_LEVELS = _env_positive_int("VENUEBOOK_RAW_TRUNCATE_LEVELS", DEFAULT_TRUNCATE_LEVELS)
+
+
+def resolve_raw_retention(
+    policy: Union[RawRetention, str, None] = None,
+    *,
+    default: RawRetention = RawRetention.DIGEST,
+) -> RawRetention:
+    """Effective retention for a parse call.
+
+    An explicit policy wins over VENUEBOOK_RAW_RETENTION. Without either, debug
+    and fixture modes keep the full payload and everything else uses `default`
+    (a digest). FULL outside debug/fixture modes is downgraded to DIGEST.
+    """
+    if isinstance(policy, str):
+        policy = RawRetention(policy.strip().lower())
+    if policy is None:
+        policy = RAW_RETENTION
+    if policy is None:
+        return RawRetention.FULL if _debug_or_fixture_mode() else default
+    if policy == RawRetention.FULL and not _debug_or_fixture_mode():
+        return RawRetention.DIGEST
+    return policy
+
+
+def raw_digest(data: Any) -> dict:
+    content = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+    encoded = content.encode("utf-8")
+    return {
+        "retention": RawRetention.DIGEST.value,
+        "sha256": hashlib.sha256(encoded).hexdigest(),
+        "size_bytes": len(encoded),
+    }
+
+
+def _level_price(level: Any) -> Optional[float]:
+    price = level.get("price") if isinstance(level, dict) else (
+        level[0] if isinstance(level, (list, tuple)) and level else None
+    )
+    try:
+        return float(price)
+    except (TypeError, ValueError):
+        return None
+
+
+def _best_first(levels: List[Any], descending: bool) -> List[Any]:
+    """Levels ordered best price first; unparseable levels go last."""
+    def key(level: Any):
+        price = _level_price(level)
+        if price is None:
+            return (1, 0.0)
+        return (0, -price if descending else price)
+
+    return sorted(levels, key=key)
+
+
+def _truncate(value: Any, max_items: int) -> Any:
+    if isinstance(value, dict):
+        kept = {}
+        for key, item in value.items():
+            if isinstance(item, list) and (key in _BID_KEYS or key in _ASK_KEYS):
+                # Levels are copied whole; only the side itself is cut.
+                best = _best_first(item, descending=key in _BID_KEYS)
+                kept[key] = [copy.copy(level) for level in best[:max_items]]
+            else:
+                kept[key] = _truncate(item, max_items)
+        return kept
+    if isinstance(value, list):
+        return [_truncate(item, max_items) for item in value[:max_items]]
+    return value
+
+
+def retain_raw(
+    data: Any,
+    policy: Union[RawRetention, str, None] = None,
+    *,
+    max_items: Optional[int] = None,
+) -> Optional[dict]:
+    """Apply the retention policy to a decoded payload before it is stored."""
+    if not isinstance(data, dict):
+        return None
+    effective = resolve_raw_retention(policy)
+    if effective == RawRetention.NONE:
+        return None
+    if effective == RawRetention.DIGEST:
+        return raw_digest(data)
+    if effective == RawRetention.TRUNCATED:
+        limit = TRUNCATE_LEVELS if max_items is None else max_items
+        truncated = _truncate(data, limit)
+        truncated["retention"] = RawRetention.TRUNCATED.value
+        return truncated
+    return data
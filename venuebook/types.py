@@ -1,6 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from .ladder import BookLadder
 
 
 class BookStatus(Enum):
@@ -27,6 +30,9 @@ class VenueBook:
     status: BookStatus
     fail_reason: Optional[BookFailReason]
     raw: Optional[dict] = None
+    # Full-depth ladder, only built when a parser is asked for it (with_ladder=True).
+    # Not part of the JSON contract.
+    ladder: Optional["BookLadder"] = field(default=None, compare=False, repr=False)
 
     def to_json_dict(self) -> dict:
         payload = {
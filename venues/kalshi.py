@@ -3,6 +3,9 @@ import os
 import time
 from typing import List, Optional, Tuple
 
+from venuebook.ladder import BookLadder
+from venuebook.levels import best_ask_level, best_bid_level, total_depth, total_notional
+from venuebook.retention import RawRetention, retain_raw
 from venuebook.types import BookFailReason, BookStatus, VenueBook
 from venues.kalshi_fetch import KalshiFetchError, fetch_book
 
@@ -123,20 +126,18 @@ def _detect_scale(prices: List[float]) -> Optional[float]:
     return 100.0 if has_gt_one else 1.0
 
 
-def _total_depth(levels: List[Tuple[float, float]]) -> float:
-    return sum(qty for _, qty in levels)
-
-
-def _total_notional(levels: List[Tuple[float, float]]) -> float:
-    return sum(price * qty for price, qty in levels)
-
-
-def parse_kalshi_book(data: dict, *, ts: Optional[float] = None) -> VenueBook:
+def parse_kalshi_book(
+    data: dict,
+    *,
+    ts: Optional[float] = None,
+    raw_retention: Optional[RawRetention] = None,
+    with_ladder: bool = False,
+) -> VenueBook:
     ts_val = time.time() if ts is None else float(ts)
     if not isinstance(data, dict):
         return _fail_book(ts_val, BookFailReason.PARSE_AMBIGUOUS, raw=None)
 
-    raw = data
+    raw = retain_raw(data, raw_retention)
     payload = data.get("orderbook", data)
     if not isinstance(payload, dict):
         return _fail_book(ts_val, BookFailReason.PARSE_AMBIGUOUS, raw=raw)
@@ -189,10 +190,10 @@ def parse_kalshi_book(data: dict, *, ts: Optional[float] = None) -> VenueBook:
         yes_asks = derived
 
     if not yes_bids or not yes_asks:
-        depth_qty_total = _total_depth(yes_bids) + _total_depth(yes_asks)
+        depth_qty_total = total_depth(yes_bids) + total_depth(yes_asks)
         depth_notional_total_usd = (
-            _total_notional([(p / scale, q) for p, q in yes_bids])
-            + _total_notional([(p / scale, q) for p, q in yes_asks])
+            total_notional([(p / scale, q) for p, q in yes_bids])
+            + total_notional([(p / scale, q) for p, q in yes_asks])
         )
         return _fail_book(
             ts_val,
@@ -205,14 +206,12 @@ def parse_kalshi_book(data: dict, *, ts: Optional[float] = None) -> VenueBook:
     bids = [(price / scale, qty) for price, qty in yes_bids]
     asks = [(price / scale, qty) for price, qty in yes_asks]
 
-    bids.sort(key=lambda x: x[0], reverse=True)
-    asks.sort(key=lambda x: x[0])
-
-    best_bid = bids[0][0]
-    best_ask = asks[0][0]
+    # BBO via linear scan; nothing downstream consumes an ordered ladder.
+    best_bid = best_bid_level(bids)[0]
+    best_ask = best_ask_level(asks)[0]
     if best_bid >= best_ask:
-        depth_qty_total = _total_depth(bids) + _total_depth(asks)
-        depth_notional_total_usd = _total_notional(bids) + _total_notional(asks)
+        depth_qty_total = total_depth(bids) + total_depth(asks)
+        depth_notional_total_usd = total_notional(bids) + total_notional(asks)
         return _fail_book(
             ts_val,
             BookFailReason.PARSE_AMBIGUOUS,
@@ -221,8 +220,8 @@ def parse_kalshi_book(data: dict, *, ts: Optional[float] = None) -> VenueBook:
             depth_notional_total_usd=depth_notional_total_usd,
         )
 
-    depth_qty_total = _total_depth(bids) + _total_depth(asks)
-    depth_notional_total_usd = _total_notional(bids) + _total_notional(asks)
+    depth_qty_total = total_depth(bids) + total_depth(asks)
+    depth_notional_total_usd = total_notional(bids) + total_notional(asks)
 
     if depth_notional_total_usd < DEPTH_NOTIONAL_MIN:
         return _fail_book(
@@ -253,6 +252,7 @@ def parse_kalshi_book(data: dict, *, ts: Optional[float] = None) -> VenueBook:
         status=BookStatus.OK,
         fail_reason=None,
         raw=raw,
+        ladder=BookLadder.from_levels(bids, asks) if with_ladder else None,
     )
 
 
@@ -261,10 +261,15 @@ def fetch_kalshi_venuebook(
     *,
     token: Optional[str] = None,
     timeout_s: float = 5.0,
+    raw_retention: Optional[RawRetention] = None,
+    with_ladder: bool = False,
 ) -> VenueBook:
-    ts_val = time.time()
     try:
         raw = fetch_book(market, token=token, timeout_s=timeout_s)
     except KalshiFetchError:
-        return _fail_book(ts_val, BookFailReason.BOOK_UNAVAILABLE, raw=None)
-    return parse_kalshi_book(raw, ts=ts_val)
+        return _fail_book(time.time(), BookFailReason.BOOK_UNAVAILABLE, raw=None)
+    # Stamp the book with its receive time, not the request time.
+    ts_val = time.time()
+    return parse_kalshi_book(
+        raw, ts=ts_val, raw_retention=raw_retention, with_ladder=with_ladder
+    )
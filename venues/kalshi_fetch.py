@@ -105,3 +105,49 @@ def fetch_market(
     if resp.status_code == 404:
         raise KalshiFetchError("MARKET_NOT_FOUND", status_code=404)
     raise KalshiFetchError(f"HTTP_{resp.status_code}", status_code=resp.status_code)
+
+
+def fetch_markets(
+    *,
+    series_ticker: Optional[str] = None,
+    event_ticker: Optional[str] = None,
+    status: Optional[str] = "open",
+    token: Optional[str] = None,
+    timeout_s: float = 5.0,
+    base_url: Optional[str] = None,
+    page_limit: int = 1000,
+    max_pages: int = 10,
+) -> list[dict]:
+    """Lists markets of a series and/or event, following the cursor."""
+    url_base = base_url or _base_url()
+    url = f"{url_base}/trade-api/v2/markets"
+    headers = {}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    params: dict = {"limit": page_limit}
+    if status:
+        params["status"] = status
+    if series_ticker:
+        params["series_ticker"] = series_ticker
+    if event_ticker:
+        params["event_ticker"] = event_ticker
+
+    markets: list[dict] = []
+    for _ in range(max_pages):
+        try:
+            resp = requests.get(url, params=params, headers=headers, timeout=timeout_s)
+        except requests.exceptions.RequestException as e:
+            raise KalshiFetchError(f"NETWORK_ERROR: {e}")
+        if resp.status_code != 200:
+            raise KalshiFetchError(f"HTTP_{resp.status_code}", status_code=resp.status_code)
+        try:
+            data = resp.json()
+        except ValueError:
+            raise KalshiFetchError("JSON_PARSE_ERROR", status_code=200)
+        page = data.get("markets") or []
+        markets.extend(page)
+        cursor = data.get("cursor")
+        if not page or not cursor:
+            break
+        params["cursor"] = cursor
+    return markets
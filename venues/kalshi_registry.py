@@ -0,0 +1,170 @@
+"""
+Cached Kalshi market metadata and eligibility.
+
+KalshiMarketRegistry lists whole series or events with one paginated
+/markets request and keeps each market as a KalshiMarketInfo, with its
+ResolutionSource, close timestamp and static eligibility worked out once.
+Entries expire after KALSHI_REGISTRY_TTL_SEC (default 300) and the cache is
+bounded (LRU). A ticker that was not listed falls back to a single
+/markets/{ticker} fetch.
+
+With `path` (KALSHI_REGISTRY_PATH in the runners) the registry is also
+written as a JSON snapshot and reloaded by the next process, so oneshot
+runners start from cached metadata while it is fresh. Snapshots keep the raw
+metadata, and the derived fields are recomputed when a snapshot is loaded.
+"""
+
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from eligibility.kalshi_rules import EligibilityResult, KalshiMarketInfo
+from recorder.shadow_artifacts import atomic_write_bytes
+from shared.lru_ttl_cache import LruTtlCache
+from venues import kalshi_fetch
+from venues.kalshi import _env_nonnegative_float
+
+logger = logging.getLogger("kalshi_registry")
+
+SNAPSHOT_FORMAT = "kalshi_registry_v1"
+DEFAULT_REGISTRY_TTL_SEC = 300.0
+DEFAULT_REGISTRY_MAX_ENTRIES = 5000
+MAX_LISTINGS = 256
+
+
+def _listing_key(series_ticker: Optional[str], event_ticker: Optional[str]) -> str:
+    return f"series={series_ticker or ''}|event={event_ticker or ''}"
+
+
+class KalshiMarketRegistry:
+    """TTL/LRU cache of KalshiMarketInfo keyed by ticker."""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl_sec: Optional[float] = None,
+        max_entries: int = DEFAULT_REGISTRY_MAX_ENTRIES,
+    ):
+        self.path = path
+        self.ttl_sec = (
+            ttl_sec
+            if ttl_sec is not None
+            else _env_nonnegative_float("KALSHI_REGISTRY_TTL_SEC", DEFAULT_REGISTRY_TTL_SEC)
+        )
+        # Wall clock, so fetch times in snapshots mean the same in the next process.
+        self._markets = LruTtlCache(max_entries=max_entries, default_ttl=self.ttl_sec, clock=time.time)
+        self._listings = LruTtlCache(max_entries=MAX_LISTINGS, default_ttl=self.ttl_sec, clock=time.time)
+        self.list_requests = 0
+        self.market_requests = 0
+        if path:
+            self._load_snapshot()
+
+    def _put(self, metadata: dict, fetched_at: float, ticker: Optional[str] = None) -> Optional[KalshiMarketInfo]:
+        info = KalshiMarketInfo.from_metadata(metadata)
+        ticker = info.ticker or ticker
+        if not ticker:
+            return None
+        ttl = self.ttl_sec - (time.time() - fetched_at)
+        if ttl > 0:
+            self._markets.set(ticker, (fetched_at, info), ttl)
+        return info
+
+    def load(
+        self, *, series_ticker: Optional[str] = None, event_ticker: Optional[str] = None
+    ) -> List[KalshiMarketInfo]:
+        """All open markets of a series and/or event, listed at most once per TTL."""
+        key = _listing_key(series_ticker, event_ticker)
+        listing = self._listings.get(key)
+        if listing is not None:
+            entries = [self._markets.get(ticker) for ticker in listing[1]]
+            if all(entry is not None for entry in entries):
+                return [info for _, info in entries]
+
+        fetched_at = time.time()
+        self.list_requests += 1
+        markets = kalshi_fetch.fetch_markets(series_ticker=series_ticker, event_ticker=event_ticker)
+        infos = [info for info in (self._put(m, fetched_at) for m in markets) if info is not None]
+        self._listings.set(key, (fetched_at, [info.ticker for info in infos]))
+        return infos
+
+    def get(self, ticker: str) -> KalshiMarketInfo:
+        """Cached market, or one /markets/{ticker} fetch. Raises KalshiFetchError."""
+        entry = self._markets.get(ticker)
+        if entry is not None:
+            return entry[1]
+        fetched_at = time.time()
+        self.market_requests += 1
+        metadata = kalshi_fetch.fetch_market(ticker)
+        info = self._put(metadata, fetched_at, ticker)
+        return info if info is not None else KalshiMarketInfo.from_metadata(metadata)
+
+    def eligible(self, now_ts: Optional[float] = None, time_buffer_sec: float = 5.0) -> List[KalshiMarketInfo]:
+        """Cached markets eligible at `now_ts`, soonest close first."""
+        now_ts = time.time() if now_ts is None else now_ts
+        infos = [
+            info for _, (_, info) in self._markets.items()
+            if info.eligibility(now_ts, time_buffer_sec)[0] == EligibilityResult.ELIGIBLE
+        ]
+        return sorted(infos, key=lambda info: info.close_ts)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "markets": self._markets.stats(),
+            "list_requests": self.list_requests,
+            "market_requests": self.market_requests,
+        }
+
+    # -- snapshot -----------------------------------------------------------
+
+    def _load_snapshot(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                doc = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Kalshi registry snapshot unreadable: {type(e).__name__}")
+            return
+        if not isinstance(doc, dict) or doc.get("format") != SNAPSHOT_FORMAT:
+            return
+        now = time.time()
+        skipped = 0
+        for entry in doc.get("markets") or []:
+            try:
+                self._put(entry["metadata"], float(entry["fetched_at"]), entry.get("ticker"))
+            except (KeyError, TypeError, ValueError, AttributeError):
+                skipped += 1
+        listings = doc.get("listings")
+        for key, entry in (listings.items() if isinstance(listings, dict) else []):
+            try:
+                fetched_at = float(entry["fetched_at"])
+                tickers = [str(ticker) for ticker in entry["tickers"]]
+            except (KeyError, TypeError, ValueError):
+                skipped += 1
+                continue
+            ttl = self.ttl_sec - (now - fetched_at)
+            if ttl > 0:
+                self._listings.set(key, (fetched_at, tickers), ttl)
+        if skipped:
+            logger.warning(f"Kalshi registry snapshot: skipped {skipped} malformed entries")
+
+    def save(self):
+        """Writes the unexpired entries to `path` atomically (no-op without a path)."""
+        if not self.path:
+            return
+        doc = {
+            "format": SNAPSHOT_FORMAT,
+            "saved_at": time.time(),
+            "markets": [
+                {"ticker": ticker, "fetched_at": fetched_at, "metadata": info.metadata}
+                for ticker, (fetched_at, info) in self._markets.items()
+            ],
+            "listings": {
+                key: {"fetched_at": fetched_at, "tickers": tickers}
+                for key, (fetched_at, tickers) in self._listings.items()
+            },
+        }
+        # Snapshots outgrow atomic_write_json's 10KB artifact limit.
+        atomic_write_bytes(Path(self.path), json.dumps(doc, separators=(",", ":")).encode("utf-8"))
@@ -3,6 +3,9 @@ import os
 import time
 from typing import List, Optional, Tuple
 
+from venuebook.ladder import BookLadder
+from venuebook.levels import best_ask_level, best_bid_level, total_depth, total_notional
+from venuebook.retention import RawRetention, retain_raw
 from venuebook.types import BookFailReason, BookStatus, VenueBook
 from venues.polymarket_fetch import PolymarketFetchError, fetch_book
 
@@ -90,20 +93,18 @@ def _parse_levels(arr: list, field_name: str) -> List[Tuple[float, float]]:
     return levels
 
 
-def _total_depth(levels: List[Tuple[float, float]]) -> float:
-    return sum(qty for _, qty in levels)
-
-
-def _total_notional(levels: List[Tuple[float, float]]) -> float:
-    return sum(price * qty for price, qty in levels)
-
-
-def parse_polymarket_book(data: dict, *, ts: Optional[float] = None) -> VenueBook:
+def parse_polymarket_book(
+    data: dict,
+    *,
+    ts: Optional[float] = None,
+    raw_retention: Optional[RawRetention] = None,
+    with_ladder: bool = False,
+) -> VenueBook:
     ts_val = time.time() if ts is None else float(ts)
     if not isinstance(data, dict):
         return _fail_book(ts_val, BookFailReason.PARSE_AMBIGUOUS, raw=None)
 
-    raw = data
+    raw = retain_raw(data, raw_retention)
     market = data.get("market")
     if not isinstance(market, str):
         return _fail_book(ts_val, BookFailReason.PARSE_AMBIGUOUS, raw=raw)
@@ -123,11 +124,8 @@ def parse_polymarket_book(data: dict, *, ts: Optional[float] = None) -> VenueBoo
         if price > 1.0:
             return _fail_book(ts_val, BookFailReason.PARSE_AMBIGUOUS, raw=raw)
 
-    bids.sort(key=lambda x: x[0], reverse=True)
-    asks.sort(key=lambda x: x[0])
-
-    depth_qty_total = _total_depth(bids) + _total_depth(asks)
-    depth_notional_total_usd = _total_notional(bids) + _total_notional(asks)
+    depth_qty_total = total_depth(bids) + total_depth(asks)
+    depth_notional_total_usd = total_notional(bids) + total_notional(asks)
 
     if not bids or not asks:
         return _fail_book(
@@ -138,8 +136,9 @@ def parse_polymarket_book(data: dict, *, ts: Optional[float] = None) -> VenueBoo
             depth_notional_total_usd=depth_notional_total_usd,
         )
 
-    best_bid = bids[0][0]
-    best_ask = asks[0][0]
+    # BBO via linear scan; nothing downstream consumes an ordered ladder.
+    best_bid = best_bid_level(bids)[0]
+    best_ask = best_ask_level(asks)[0]
     if best_bid >= best_ask:
         return _fail_book(
             ts_val,
@@ -178,10 +177,17 @@ def parse_polymarket_book(data: dict, *, ts: Optional[float] = None) -> VenueBoo
         status=BookStatus.OK,
         fail_reason=None,
         raw=raw,
+        ladder=BookLadder.from_levels(bids, asks) if with_ladder else None,
     )
 
 
-def fetch_polymarket_venuebook(market: str, *, timeout_s: float = 5.0) -> VenueBook:
+def fetch_polymarket_venuebook(
+    market: str,
+    *,
+    timeout_s: float = 5.0,
+    raw_retention: Optional[RawRetention] = None,
+    with_ladder: bool = False,
+) -> VenueBook:
     ts_val = time.time()
 
     # Check for fixture mode via env
@@ -193,10 +199,16 @@ def fetch_polymarket_venuebook(market: str, *, timeout_s: float = 5.0) -> VenueB
          if fix_path.exists():
              with open(fix_path, 'r') as f:
                  raw = json.load(f)
-                 return parse_polymarket_book(raw, ts=ts_val)
+                 return parse_polymarket_book(
+                     raw, ts=ts_val, raw_retention=raw_retention, with_ladder=with_ladder
+                 )
 
     try:
         raw = fetch_book(market, timeout_s=timeout_s)
     except PolymarketFetchError:
-        return _fail_book(ts_val, BookFailReason.BOOK_UNAVAILABLE, raw=None)
-    return parse_polymarket_book(raw, ts=ts_val)
+        return _fail_book(time.time(), BookFailReason.BOOK_UNAVAILABLE, raw=None)
+    # Stamp the book with its receive time, not the request time.
+    ts_val = time.time()
+    return parse_polymarket_book(
+        raw, ts=ts_val, raw_retention=raw_retention, with_ladder=with_ladder
+    )